@@ -3,7 +3,7 @@ from django.contrib import admin
 from django.contrib.auth.models import User
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.utils import timezone
-from .models import UserProfile
+from .models import UserProfile, profiles_bulk_updated
 
 class UserProfileInline(admin.StackedInline):
     """User 모델에 UserProfile 인라인으로 표시"""
@@ -41,10 +41,11 @@ admin.site.register(User, CustomUserAdmin)
 class UserProfileAdmin(admin.ModelAdmin):
     """UserProfile 관리자 페이지"""
     list_display = [
-        'user', 'get_email', 'approval_status', 
+        'user', 'get_email', 'approval_status', 'is_member',
         'approved_at', 'approved_by', 'created_at'
     ]
-    list_filter = ['approval_status', 'approved_at', 'created_at']
+    list_filter = ['approval_status', 'is_member', 'approved_at', 'created_at']
+    list_select_related = ['user', 'approved_by']
     search_fields = ['user__username', 'user__email']
     readonly_fields = ['user', 'approved_at', 'approved_by', 'created_at', 'updated_at']
     
@@ -53,12 +54,13 @@ class UserProfileAdmin(admin.ModelAdmin):
             'fields': ('user', 'created_at', 'updated_at')
         }),
         ('승인 관리', {
-            'fields': ('approval_status', 'approved_at', 'approved_by', 'rejection_reason'),
+            'fields': ('approval_status', 'is_member', 'approved_at', 'approved_by', 'rejection_reason'),
             'classes': ('wide',)
         }),
     )
     
-    actions = ['approve_users', 'reject_users', 'pending_users']
+    actions = ['approve_users', 'approve_members', 'reject_users', 'pending_users',
+               'mark_members', 'unmark_members']
     
     def get_email(self, obj):
         """이메일 표시"""
@@ -66,49 +68,65 @@ class UserProfileAdmin(admin.ModelAdmin):
     get_email.short_description = '이메일'
     get_email.admin_order_field = 'user__email'
     
+    # ── 일괄 처리: 행마다 save() 하지 않고 UPDATE 1회 ─────────────
+
+    def _bulk_update(self, queryset, exclude, **values):
+        """바뀔 행만 UPDATE 1회 → 권한 캐시/토큰 claims 무효화. 변경된 수 반환"""
+        targets = queryset.exclude(**exclude)
+        user_ids = list(targets.values_list('user_id', flat=True))
+        if user_ids:
+            UserProfile.objects.filter(user_id__in=user_ids).update(updated_at=timezone.now(), **values)
+            profiles_bulk_updated(user_ids)
+        return len(user_ids)
+
+    def _approve(self, request, queryset, **extra):
+        return self._bulk_update(
+            queryset, {'approval_status': 'approved', **extra},
+            approval_status='approved', approved_at=timezone.now(),
+            approved_by=request.user, rejection_reason='', **extra,
+        )
+
     def approve_users(self, request, queryset):
         """선택한 사용자들을 승인"""
-        updated = 0
-        for profile in queryset:
-            if profile.approval_status != 'approved':
-                profile.approval_status = 'approved'
-                profile.approved_at = timezone.now()
-                profile.approved_by = request.user
-                profile.rejection_reason = ''
-                profile.save()
-                updated += 1
-        
+        updated = self._approve(request, queryset)
         self.message_user(request, f'{updated}명의 사용자를 승인했습니다.')
     approve_users.short_description = '선택한 사용자 승인'
+
+    def approve_members(self, request, queryset):
+        """선택한 사용자들을 교인으로 승인 (승인 + 교인 표시를 한 번에)"""
+        updated = self._approve(request, queryset, is_member=True)
+        self.message_user(request, f'{updated}명의 사용자를 교인으로 승인했습니다.')
+    approve_members.short_description = '선택한 사용자 교인으로 승인'
     
     def reject_users(self, request, queryset):
         """선택한 사용자들을 거부"""
-        updated = 0
-        for profile in queryset:
-            if profile.approval_status != 'rejected':
-                profile.approval_status = 'rejected'
-                profile.approved_at = None
-                profile.approved_by = None
-                profile.save()
-                updated += 1
-        
+        updated = self._bulk_update(
+            queryset, {'approval_status': 'rejected'},
+            approval_status='rejected', approved_at=None, approved_by=None,
+        )
         self.message_user(request, f'{updated}명의 사용자를 거부했습니다.')
     reject_users.short_description = '선택한 사용자 거부'
     
     def pending_users(self, request, queryset):
         """선택한 사용자들을 대기 상태로 변경"""
-        updated = 0
-        for profile in queryset:
-            if profile.approval_status != 'pending':
-                profile.approval_status = 'pending'
-                profile.approved_at = None
-                profile.approved_by = None
-                profile.rejection_reason = ''
-                profile.save()
-                updated += 1
-        
+        updated = self._bulk_update(
+            queryset, {'approval_status': 'pending'},
+            approval_status='pending', approved_at=None, approved_by=None, rejection_reason='',
+        )
         self.message_user(request, f'{updated}명의 사용자를 대기 상태로 변경했습니다.')
     pending_users.short_description = '대기 상태로 변경'
+
+    def mark_members(self, request, queryset):
+        """선택한 사용자들을 교인으로 표시"""
+        updated = self._bulk_update(queryset, {'is_member': True}, is_member=True)
+        self.message_user(request, f'{updated}명을 교인으로 표시했습니다.')
+    mark_members.short_description = '교인으로 표시'
+
+    def unmark_members(self, request, queryset):
+        """선택한 사용자들의 교인 표시 해제"""
+        updated = self._bulk_update(queryset, {'is_member': False}, is_member=False)
+        self.message_user(request, f'{updated}명의 교인 표시를 해제했습니다.')
+    unmark_members.short_description = '교인 표시 해제'
     
     def save_model(self, request, obj, form, change):
         """승인 상태 변경 시 자동으로 승인자와 시간 기록"""
@@ -0,0 +1,105 @@
+# backend/accounts/auth_context.py
+"""
+요청 사용자의 승인/교인/관리자 여부 (auth context)
+
+권한 클래스와 뷰가 각자 request.user.profile 을 읽던 것을 한 곳으로 모은다.
+
+[캐시 단계]
+1. 요청 안: user 객체에 _auth_context 로 보관 → 같은 요청에서 다시 계산하지 않음
+2. 요청 사이: 캐시(Redis) accounts:auth_ctx:<user_id> — UserProfile 저장/삭제 시 무효화
+3. 둘 다 없으면 UserProfile 에서 필요한 두 컬럼만 조회 (쿼리 1회)
+
+관리자(is_staff / is_superuser)는 User 에 이미 있는 값이라 캐시하지 않는다.
+"""
+
+import logging
+from dataclasses import dataclass
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+CACHE_TIMEOUT = 60 * 10   # 10분 — 무효화를 놓쳐도 이 시간 뒤에는 반영
+
+
+@dataclass(frozen=True)
+class AuthContext:
+    user_id:          int | None
+    is_authenticated: bool
+    is_staff:         bool
+    is_approved:      bool
+    is_member:        bool
+
+    @property
+    def can_write_post(self):
+        """게시글/댓글 작성 가능 여부 (관리자 또는 승인된 사용자)"""
+        return self.is_authenticated and (self.is_staff or self.is_approved)
+
+    @property
+    def can_view_pastoral_letters(self):
+        """목회서신 열람 가능 여부 (관리자 또는 승인된 교인)"""
+        return self.is_authenticated and (self.is_staff or (self.is_approved and self.is_member))
+
+
+ANONYMOUS = AuthContext(None, False, False, False, False)
+
+
+def _cache_key(user_id):
+    return f'accounts:auth_ctx:{user_id}'
+
+
+def _load_profile(user):
+    """(is_approved, is_member) — 캐시 → DB 순"""
+    try:
+        cached = cache.get(_cache_key(user.pk))
+        if cached is not None:
+            return cached
+    except Exception as e:
+        logger.warning(f"auth context cache read failed: {e}")
+
+    from .models import UserProfile
+    row = UserProfile.objects.filter(user_id=user.pk).values_list('approval_status', 'is_member').first()
+    values = (row[0] == 'approved', row[1]) if row else (False, False)
+
+    try:
+        cache.set(_cache_key(user.pk), values, timeout=CACHE_TIMEOUT)
+    except Exception as e:
+        logger.warning(f"auth context cache write failed: {e}")
+    return values
+
+
+def get_auth_context(request_or_user):
+    """request 또는 user 를 받아 AuthContext 반환 (요청당 최대 1회 계산)"""
+    user = getattr(request_or_user, 'user', request_or_user)
+    if not user or not user.is_authenticated:
+        return ANONYMOUS
+
+    context = getattr(user, '_auth_context', None)
+    if context is not None:
+        return context
+
+    is_staff = bool(user.is_staff or user.is_superuser)
+    if is_staff:
+        is_approved, is_member = True, True
+    else:
+        is_approved, is_member = _load_profile(user)
+
+    context = AuthContext(user.pk, True, is_staff, is_approved, is_member)
+    user._auth_context = context
+    return context
+
+
+def invalidate(user_id):
+    """UserProfile 변경 시 호출 — 다음 요청에서 다시 읽음"""
+    try:
+        cache.delete(_cache_key(user_id))
+    except Exception as e:
+        logger.warning(f"auth context cache delete failed: {e}")
+
+
+def invalidate_many(user_ids):
+    """대량 변경(queryset.update) 후 호출 — signal 이 없으므로 직접 무효화"""
+    try:
+        cache.delete_many([_cache_key(user_id) for user_id in user_ids])
+    except Exception as e:
+        logger.warning(f"auth context cache delete failed: {e}")
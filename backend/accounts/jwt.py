@@ -0,0 +1,200 @@
+# backend/accounts/jwt.py
+"""
+권한 정보를 담은 JWT (claims token)
+
+/api/token/ 에서 발급하는 토큰에 사용자 이름·관리자·승인·교인 여부를 싣고,
+요청마다 User 를 DB 에서 읽는 대신 검증된 토큰 내용으로 사용자 객체를 만든다.
+
+[사용자 객체]
+user_from_claims() 는 진짜 User 인스턴스 (FK 대입, isinstance 모두 그대로 동작).
+토큰에 있는 필드만 채우고 나머지(email, last_login 등)는 deferred 필드 →
+뷰가 실제로 접근할 때만 그 필드를 DB 에서 읽는다.
+승인/교인 여부는 auth context (accounts/auth_context.py) 로 미리 채워 둔다.
+
+[무효화 — Redis, 토큰 수명 동안만 보관]
+- accounts:jwt:stale:<user_id> : 이 시각 이전에 발급된 토큰의 claims 는 믿지 않음
+  (승인 상태·관리자 여부·비밀번호 변경 시) → 해당 토큰은 기존처럼 DB 에서 사용자 조회
+- accounts:jwt:revoked:<jti>   : 로그아웃한 access 토큰 → 거부
+Redis 를 읽을 수 없으면 DB 조회로 처리 (claims 를 믿지 않음).
+
+settings.JWT_CLAIMS_USER = False (기본) 면 사용자는 기존처럼 DB 에서 읽고 Redis 는 확인하지 않는다
+(폐기 목록은 DB 조회를 건너뛰는 claims 모드를 위한 것 — 요청마다 Redis 왕복을 더하지 않도록).
+"""
+
+import logging
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from . import last_login
+from .auth_context import AuthContext, get_auth_context
+
+logger = logging.getLogger(__name__)
+
+CLAIMS_VERSION = 1
+# 토큰에 싣는 User 필드 (그 외 필드는 deferred)
+USER_CLAIMS = ('username', 'is_staff', 'is_superuser')
+
+
+def _lifetime():
+    return int(api_settings.ACCESS_TOKEN_LIFETIME.total_seconds())
+
+
+def _stale_key(user_id):
+    return f'accounts:jwt:stale:{user_id}'
+
+
+def _revoked_key(jti):
+    return f'accounts:jwt:revoked:{jti}'
+
+
+# ── 발급 ──────────────────────────────────────────────────────
+
+def add_claims(token, user):
+    context = get_auth_context(user)
+    token['claims'] = CLAIMS_VERSION
+    for name in USER_CLAIMS:
+        token[name] = getattr(user, name)
+    token['is_approved'] = context.is_approved
+    token['is_member'] = context.is_member
+    return token
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+
+    @classmethod
+    def get_token(cls, user):
+        # refresh 에 실은 claims 는 access 로 복사됨
+        return add_claims(super().get_token(user), user)
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        # UPDATE_LAST_LOGIN 대신 버퍼에 기록 (accounts/last_login.py)
+        if not api_settings.UPDATE_LAST_LOGIN:
+            last_login.record(self.user.pk)
+        return data
+
+
+class ClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    """refresh 때마다 최신 승인 상태로 claims 를 다시 씀 (refresh 토큰의 값은 발급 시점 기준)"""
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        access = AccessToken(data['access'])
+        user = (
+            get_user_model().objects
+            .filter(**{api_settings.USER_ID_FIELD: access[api_settings.USER_ID_CLAIM]})
+            .first()
+        )
+        if user is None:
+            return data
+
+        data['access'] = str(add_claims(access, user))
+        if 'refresh' in data:
+            data['refresh'] = str(add_claims(RefreshToken(data['refresh']), user))
+        return data
+
+
+# ── 무효화 ────────────────────────────────────────────────────
+
+def mark_claims_stale(user_id):
+    """사용자 권한 정보가 바뀜 — 지금까지 발급된 토큰의 claims 를 더 이상 믿지 않음"""
+    try:
+        cache.set(_stale_key(user_id), time.time(), timeout=_lifetime())
+    except Exception as e:
+        logger.warning(f"jwt claims stale mark failed: {e}")
+
+
+def mark_claims_stale_many(user_ids):
+    """대량 변경(queryset.update) 후 호출 — 캐시 왕복 1회"""
+    now = time.time()
+    try:
+        cache.set_many({_stale_key(user_id): now for user_id in user_ids}, timeout=_lifetime())
+    except Exception as e:
+        logger.warning(f"jwt claims stale mark failed: {e}")
+
+
+def revoke_token(token):
+    """access 토큰 폐기 (로그아웃) — 남은 수명 동안만 보관"""
+    remaining = int(token['exp'] - time.time())
+    if remaining <= 0:
+        return
+    try:
+        cache.set(_revoked_key(token[api_settings.JTI_CLAIM]), 1, timeout=remaining)
+    except Exception as e:
+        logger.warning(f"jwt revoke failed: {e}")
+
+
+def token_state(token):
+    """'revoked' / 'stale' / 'ok' — Redis 왕복 1회"""
+    user_id = token.get(api_settings.USER_ID_CLAIM)
+    jti = token.get(api_settings.JTI_CLAIM)
+    try:
+        values = cache.get_many([_revoked_key(jti), _stale_key(user_id)])
+    except Exception as e:
+        logger.warning(f"jwt revocation check failed: {e}")
+        return 'stale'
+
+    if values.get(_revoked_key(jti)):
+        return 'revoked'
+    stale_since = values.get(_stale_key(user_id))
+    # iat 는 초 단위 → 같은 초에 발급된 토큰도 stale 로 (DB 조회일 뿐이라 안전한 쪽)
+    if stale_since is not None and token.get('iat', 0) <= stale_since:
+        return 'stale'
+    return 'ok'
+
+
+# ── 사용자 객체 ───────────────────────────────────────────────
+
+def claims_enabled():
+    return getattr(settings, 'JWT_CLAIMS_USER', False)
+
+
+def has_claims(token):
+    return token.get('claims') == CLAIMS_VERSION
+
+
+def user_from_claims(token):
+    """토큰 내용으로 User 인스턴스 생성 (DB 조회 없음, 나머지 필드는 deferred)"""
+    User = get_user_model()
+    loaded = {
+        # simplejwt 는 user_id 를 문자열로 저장 → pk 타입으로 변환
+        User._meta.pk.attname: User._meta.pk.to_python(token[api_settings.USER_ID_CLAIM]),
+        'is_active': True,   # 비활성 사용자는 토큰 발급/refresh 불가, 비활성화 시 stale 처리
+        **{name: token[name] for name in USER_CLAIMS},
+    }
+    # from_db 는 모델 필드 순서대로 값을 받음
+    field_names = [f.attname for f in User._meta.concrete_fields if f.attname in loaded]
+    user = User.from_db(DEFAULT_DB_ALIAS, field_names, [loaded[name] for name in field_names])
+
+    is_staff = bool(user.is_staff or user.is_superuser)
+    user._auth_context = AuthContext(
+        user.pk, True, is_staff,
+        is_staff or bool(token.get('is_approved')),
+        is_staff or bool(token.get('is_member')),
+    )
+    return user
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """claims 토큰이면 DB 조회 없이 사용자 생성, 아니면 기존 방식"""
+
+    def get_user(self, validated_token):
+        if not claims_enabled() or validated_token.get(api_settings.USER_ID_CLAIM) is None:
+            return super().get_user(validated_token)
+
+        state = token_state(validated_token)
+        if state == 'revoked':
+            raise AuthenticationFailed('로그아웃된 토큰입니다.', code='token_revoked')
+
+        if has_claims(validated_token) and state == 'ok':
+            return user_from_claims(validated_token)
+        return super().get_user(validated_token)
@@ -0,0 +1,107 @@
+# backend/accounts/last_login.py
+"""
+last_login 지연 기록 (로그인 쓰기 줄이기)
+
+토큰 발급(/api/token/)마다 auth_user 를 UPDATE 하던 것을
+Redis 해시 accounts:last_login { user_id: timestamp } 에 적어 두고
+FLUSH_INTERVAL 마다 한 번 bulk_update 로 모아서 저장한다.
+
+- 같은 사용자가 여러 번 로그인해도 해시에는 마지막 시각 하나만 남음
+- flush 는 RENAME 으로 해시를 떼어 낸 뒤 처리 → flush 중 들어온 기록은 다음 차례로
+- 주기 실행: 로그인 요청이 들어올 때 FLUSH_INTERVAL 이 지났으면 그 요청에서 flush
+  (스케줄러 없이도 동작). 수동/cron: python manage.py flush_last_login
+- Redis 가 아니면 바로 UPDATE 1회 (signal 없음)
+
+bulk_update 는 post_save 를 보내지 않으므로 프로필 재저장도 일어나지 않는다.
+"""
+
+import logging
+import time
+import uuid
+from datetime import datetime, timezone as dt_timezone
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+FLUSH_INTERVAL = 60          # 초
+FLUSH_BATCH    = 500
+FLUSH_LOCK_KEY = 'accounts:last_login:flush_lock'
+
+
+def _redis():
+    """django_redis 연결 (Redis 캐시가 아니면 None)"""
+    try:
+        from django_redis import get_redis_connection
+        return get_redis_connection('default')
+    except Exception:
+        return None
+
+
+def _key():
+    return cache.make_key('accounts:last_login')
+
+
+def _update_now(user_id, when):
+    get_user_model().objects.filter(pk=user_id).update(last_login=when)
+
+
+def record(user_id, when=None):
+    """로그인 시각 기록 (버퍼). 필요하면 이 호출에서 flush"""
+    when = when or timezone.now()
+    conn = _redis()
+    if conn is None:
+        _update_now(user_id, when)
+        return
+
+    try:
+        conn.hset(_key(), user_id, when.timestamp())
+    except Exception as e:
+        logger.warning(f"last_login buffer write failed: {e}")
+        _update_now(user_id, when)
+        return
+
+    maybe_flush()
+
+
+def maybe_flush():
+    """마지막 flush 후 FLUSH_INTERVAL 이 지났으면 flush (워커 중 하나만)"""
+    try:
+        due = cache.add(FLUSH_LOCK_KEY, 1, timeout=FLUSH_INTERVAL)
+    except Exception:
+        return
+    if due:
+        flush()
+
+
+def flush():
+    """버퍼에 쌓인 last_login 을 DB 에 저장. 저장한 사용자 수 반환"""
+    conn = _redis()
+    if conn is None:
+        return 0
+
+    key = _key()
+    pending = f'{key}:flushing:{uuid.uuid4().hex}'
+    try:
+        conn.rename(key, pending)
+    except Exception:
+        return 0   # 키 없음 (쌓인 기록 없음) 또는 Redis 오류
+
+    try:
+        entries = conn.hgetall(pending)
+        conn.delete(pending)
+    except Exception as e:
+        logger.warning(f"last_login buffer read failed: {e}")
+        return 0
+
+    User = get_user_model()
+    users = [
+        User(pk=int(user_id), last_login=datetime.fromtimestamp(float(ts), tz=dt_timezone.utc))
+        for user_id, ts in entries.items()
+    ]
+    started = time.perf_counter()
+    User.objects.bulk_update(users, ['last_login'], batch_size=FLUSH_BATCH)
+    logger.info(f"last_login flushed: {len(users)} users ({(time.perf_counter() - started) * 1000:.1f}ms)")
+    return len(users)
@@ -0,0 +1,134 @@
+# backend/accounts/management/commands/bench_token_obtain.py
+#
+# /api/token/ (로그인) 처리량 벤치마크 — 로그인 한 번에 생기는 DB 쓰기 비교
+#   legacy   : UPDATE_LAST_LOGIN=True + User 저장마다 프로필 재저장 (이전 동작 재현)
+#   buffered : last_login Redis 버퍼 + 바뀐 필드만 프로필 저장 (현재 동작)
+# 비밀번호 해시(PBKDF2) 가 지연의 대부분이라 기본은 빠른 해시로 DB 비용만 비교
+#
+# ── 사용법 ──────────────────────────────────────────────────────
+#   python manage.py bench_token_obtain                      # 두 방식 비교 (요청 300회)
+#   python manage.py bench_token_obtain --requests 1000 --users 50
+#   python manage.py bench_token_obtain --real-hasher        # 실제 비밀번호 해시 포함
+#   python manage.py bench_token_obtain --cleanup            # 벤치용 사용자 삭제
+# ────────────────────────────────────────────────────────────────
+
+import statistics
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User, update_last_login
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models.signals import post_save
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.views import TokenObtainPairView
+
+from accounts import last_login
+
+BENCH_PREFIX = '__bench_login_'
+BENCH_PASSWORD = 'bench-password-1234'
+FAST_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+WRITE_PREFIXES = ('INSERT', 'UPDATE', 'DELETE')
+
+
+def _legacy_save_user_profile(sender, instance, **kwargs):
+    """이전 accounts.models.save_user_profile — User 저장마다 프로필 전체 저장"""
+    if hasattr(instance, 'profile'):
+        instance.profile.save()
+
+
+class LegacyTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """이전 /api/token/ — UPDATE_LAST_LOGIN=True 와 같은 즉시 저장"""
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        update_last_login(None, self.user)
+        return data
+
+
+class Command(BaseCommand):
+    help = '로그인(/api/token/) 처리량 벤치마크 (legacy vs buffered)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=300, help='방식별 요청 수')
+        parser.add_argument('--users', type=int, default=20, help='벤치용 사용자 수')
+        parser.add_argument('--mode', choices=['both', 'legacy', 'buffered'], default='both')
+        parser.add_argument('--real-hasher', action='store_true', help='설정된 비밀번호 해시 그대로 사용')
+        parser.add_argument('--cleanup', action='store_true', help='벤치용 사용자 삭제')
+
+    def handle(self, *args, **options):
+        if options['cleanup']:
+            deleted, _ = User.objects.filter(username__startswith=BENCH_PREFIX).delete()
+            self.stdout.write(self.style.SUCCESS(f'  ✅ 벤치용 데이터 {deleted}건 삭제'))
+            return
+
+        hashers = settings.PASSWORD_HASHERS if options['real_hasher'] else FAST_HASHERS
+        with override_settings(PASSWORD_HASHERS=hashers):
+            usernames = self._users(options['users'])
+            modes = ['legacy', 'buffered'] if options['mode'] == 'both' else [options['mode']]
+            results = {mode: self._run(mode, usernames, options['requests']) for mode in modes}
+
+        if len(results) == 2:
+            before, after = results['legacy'], results['buffered']
+            self.stdout.write(self.style.SUCCESS(
+                f'  ✅ 처리량 {before:.0f} → {after:.0f} req/s ({after / before:.2f}배)'
+            ))
+
+    def _users(self, count):
+        """벤치용 사용자 (현재 해시로 비밀번호를 다시 설정 → 로그인 중 rehash 없음)"""
+        usernames = [f'{BENCH_PREFIX}{i}' for i in range(count)]
+        for username in usernames:
+            user, _ = User.objects.get_or_create(username=username)
+            user.set_password(BENCH_PASSWORD)
+            user.save(update_fields=['password'])
+            user.profile.approval_status = 'approved'
+            user.profile.save()
+        return usernames
+
+    def _run(self, mode, usernames, requests):
+        factory = APIRequestFactory()
+        host = settings.ALLOWED_HOSTS[0] if settings.ALLOWED_HOSTS else 'localhost'
+
+        if mode == 'legacy':
+            view = TokenObtainPairView.as_view(serializer_class=LegacyTokenObtainPairSerializer)
+            post_save.connect(_legacy_save_user_profile, sender=User, dispatch_uid='bench_legacy_profile')
+        else:
+            view = TokenObtainPairView.as_view()
+        try:
+            timings, queries, writes = [], [], []
+            started = time.perf_counter()
+            for i in range(requests):
+                body = {'username': usernames[i % len(usernames)], 'password': BENCH_PASSWORD}
+                request = factory.post('/api/token/', body, format='json', SERVER_NAME=host)
+                with CaptureQueriesContext(connection) as ctx:
+                    t0 = time.perf_counter()
+                    response = view(request)
+                    timings.append((time.perf_counter() - t0) * 1000)
+                if response.status_code != 200:
+                    raise RuntimeError(f'token obtain failed: {response.status_code} {response.data}')
+                queries.append(len(ctx))
+                writes.append(sum(q['sql'].lstrip().upper().startswith(WRITE_PREFIXES) for q in ctx))
+            elapsed = time.perf_counter() - started
+
+            flush_ms = flush_queries = 0
+            if mode == 'buffered':
+                with CaptureQueriesContext(connection) as ctx:
+                    t0 = time.perf_counter()
+                    flushed = last_login.flush()
+                    flush_ms = (time.perf_counter() - t0) * 1000
+                flush_queries = len(ctx)
+        finally:
+            post_save.disconnect(dispatch_uid='bench_legacy_profile', sender=User)
+
+        throughput = requests / elapsed
+        self.stdout.write(
+            f'  {mode:>8}: {throughput:8.1f} req/s, 중앙값 {statistics.median(timings):.2f}ms, '
+            f'요청당 쿼리 {statistics.mean(queries):.1f} (쓰기 {statistics.mean(writes):.1f})'
+        )
+        if mode == 'buffered':
+            self.stdout.write(
+                f'            flush: 사용자 {flushed}명, 쿼리 {flush_queries}, {flush_ms:.1f}ms'
+            )
+        return throughput
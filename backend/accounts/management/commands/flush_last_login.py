@@ -0,0 +1,21 @@
+# backend/accounts/management/commands/flush_last_login.py
+#
+# Redis 버퍼에 쌓인 last_login 을 DB 에 저장 (accounts/last_login.py)
+# 로그인 요청에서도 FLUSH_INTERVAL 마다 자동으로 실행되므로 보통은 필요 없음
+# (배포 직전, 또는 로그인이 뜸한 시간대에 cron 으로 실행)
+#
+# ── 사용법 ──────────────────────────────────────────────────────
+#   python manage.py flush_last_login
+# ────────────────────────────────────────────────────────────────
+
+from django.core.management.base import BaseCommand
+
+from accounts import last_login
+
+
+class Command(BaseCommand):
+    help = 'Redis 버퍼의 last_login 을 DB 에 일괄 저장'
+
+    def handle(self, *args, **options):
+        count = last_login.flush()
+        self.stdout.write(self.style.SUCCESS(f'  ✅ last_login {count}명 저장'))
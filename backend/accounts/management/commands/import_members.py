@@ -0,0 +1,209 @@
+# backend/accounts/management/commands/import_members.py
+#
+# 교인 명단(CSV) 일괄 등록 — 사용자 + 프로필(교인 여부, 승인 상태)을 한 번에 생성
+# 비밀번호 해시(PBKDF2)는 CPU 작업이므로 프로세스 풀에서 병렬 처리하고
+# User / UserProfile 은 bulk_create 로 배치 단위 저장 (사용자별 signal·UPDATE 없음)
+#
+# CSV 헤더 (username 외에는 선택):
+#   username,email,password,first_name,last_name,is_member,approval_status
+#   - password 가 비어 있으면 --generate-passwords 로 생성 (결과 파일에 기록),
+#     아니면 로그인 불가(unusable) 상태로 등록
+#   - is_member / approval_status 가 비어 있으면 --member / --approve 옵션 값
+#
+# ── 사용법 ──────────────────────────────────────────────────────
+#   python manage.py import_members members.csv --approve --member
+#   python manage.py import_members members.csv --generate-passwords passwords.csv
+#   python manage.py import_members members.csv --workers 8 --batch-size 1000
+#   python manage.py import_members members.csv --dry-run           # 검증만
+# ────────────────────────────────────────────────────────────────
+
+import csv
+import os
+import secrets
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from django.utils import timezone
+
+from accounts.models import UserProfile
+
+TRUE_VALUES = {'1', 'true', 'y', 'yes', 'o', '예', '교인'}
+APPROVAL_VALUES = {value for value, _ in UserProfile.APPROVAL_STATUS}
+
+
+def _init_worker():
+    # spawn 방식 플랫폼에서도 자식 프로세스가 설정(PASSWORD_HASHERS)을 불러오도록
+    django.setup()
+
+
+def _hash(password):
+    """자식 프로세스 — 해시만 계산 (DB 접근 없음). None → unusable 비밀번호"""
+    return make_password(password)
+
+
+def _flag(value, default):
+    value = (value or '').strip().lower()
+    return default if not value else value in TRUE_VALUES
+
+
+class Command(BaseCommand):
+    help = '교인 명단 CSV 일괄 등록 (bulk_create + 프로세스 풀 비밀번호 해시)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('csv_path', help='CSV 파일 경로 (UTF-8)')
+        parser.add_argument('--approve', action='store_true', help='approval_status 가 없으면 승인 상태로')
+        parser.add_argument('--member', action='store_true', help='is_member 가 없으면 교인으로')
+        parser.add_argument('--approved-by', help='승인자 username (승인 기록용)')
+        parser.add_argument('--generate-passwords', metavar='OUT_CSV',
+                            help='비밀번호가 빈 행은 생성하고 username,password 를 이 파일에 기록')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 2, help='해시 프로세스 수')
+        parser.add_argument('--batch-size', type=int, default=500, help='bulk_create 배치 크기')
+        parser.add_argument('--dry-run', action='store_true', help='검증만 하고 저장하지 않음')
+
+    def handle(self, *args, **options):
+        rows, skipped = self._read(options)
+        self.stdout.write(f'  CSV {len(rows) + len(skipped)}행 → 등록 {len(rows)}명, 건너뜀 {len(skipped)}명')
+        for username, reason in skipped[:20]:
+            self.stdout.write(self.style.WARNING(f'  ⚠️ {username or "(빈 username)"}: {reason}'))
+        if len(skipped) > 20:
+            self.stdout.write(self.style.WARNING(f'  ... 외 {len(skipped) - 20}건'))
+
+        if not rows or options['dry_run']:
+            self.stdout.write(self.style.SUCCESS('  ✅ 검증 완료 (저장하지 않음)' if rows else '  ✅ 등록할 사용자가 없습니다'))
+            return
+
+        approved_by = None
+        if options['approved_by']:
+            approved_by = User.objects.filter(username=options['approved_by']).first()
+            if approved_by is None:
+                raise CommandError(f"승인자를 찾을 수 없습니다: {options['approved_by']}")
+
+        generated = self._fill_passwords(rows, options['generate_passwords'])
+
+        started = time.perf_counter()
+        hashes = self._hash_all([row['password'] for row in rows], options['workers'])
+        hash_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        created = 0
+        batch_size = max(1, options['batch_size'])
+        for offset in range(0, len(rows), batch_size):
+            created += self._save_batch(rows[offset:offset + batch_size],
+                                        hashes[offset:offset + batch_size], approved_by)
+            self.stdout.write(f'  {created}/{len(rows)} 저장')
+        save_elapsed = time.perf_counter() - started
+
+        if generated:
+            self.stdout.write(f"  생성한 비밀번호 {generated}건 → {options['generate_passwords']}")
+        total = hash_elapsed + save_elapsed
+        self.stdout.write(self.style.SUCCESS(
+            f'  ✅ {created}명 등록 — 해시 {hash_elapsed:.1f}s (프로세스 {options["workers"]}개), '
+            f'저장 {save_elapsed:.2f}s, 초당 {created / total if total else created:.0f}명'
+        ))
+
+    # ── 읽기 / 검증 ───────────────────────────────────────────
+    def _read(self, options):
+        try:
+            with open(options['csv_path'], newline='', encoding='utf-8-sig') as f:
+                records = list(csv.DictReader(f))
+        except OSError as e:
+            raise CommandError(f'CSV 를 읽을 수 없습니다: {e}')
+        if records and 'username' not in records[0]:
+            raise CommandError('CSV 에 username 열이 필요합니다.')
+
+        default_status = 'approved' if options['approve'] else 'pending'
+        rows, skipped, seen = [], [], set()
+        for record in records:
+            username = (record.get('username') or '').strip()
+            status = (record.get('approval_status') or '').strip().lower() or default_status
+            if not username:
+                skipped.append((username, 'username 없음'))
+            elif username in seen:
+                skipped.append((username, 'CSV 안에서 중복'))
+            elif len(username) > User._meta.get_field('username').max_length:
+                skipped.append((username, 'username 이 너무 김'))
+            elif status not in APPROVAL_VALUES:
+                skipped.append((username, f'알 수 없는 승인 상태: {status}'))
+            else:
+                seen.add(username)
+                rows.append({
+                    'username':        username,
+                    'email':           (record.get('email') or '').strip(),
+                    'password':        record.get('password') or None,
+                    'first_name':      (record.get('first_name') or '').strip(),
+                    'last_name':       (record.get('last_name') or '').strip(),
+                    'is_member':       _flag(record.get('is_member'), options['member']),
+                    'approval_status': status,
+                })
+
+        # 이미 있는 사용자 (쿼리는 배치당 1회)
+        existing = set()
+        names = [row['username'] for row in rows]
+        for offset in range(0, len(names), 1000):
+            existing.update(User.objects.filter(username__in=names[offset:offset + 1000])
+                            .values_list('username', flat=True))
+        if existing:
+            skipped += [(name, '이미 등록된 사용자') for name in names if name in existing]
+            rows = [row for row in rows if row['username'] not in existing]
+        return rows, skipped
+
+    def _fill_passwords(self, rows, out_path):
+        if not out_path:
+            return 0
+        generated = [row for row in rows if not row['password']]
+        for row in generated:
+            row['password'] = secrets.token_urlsafe(9)
+        if generated:
+            with open(out_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(['username', 'password'])
+                writer.writerows([row['username'], row['password']] for row in generated)
+        return len(generated)
+
+    # ── 비밀번호 해시 (프로세스 풀) ───────────────────────────
+    def _hash_all(self, passwords, workers):
+        if workers <= 1 or len(passwords) < 2:
+            return [_hash(p) for p in passwords]
+        # 자식 프로세스가 부모의 DB 연결을 물려받지 않도록 먼저 닫음
+        connections.close_all()
+        chunksize = max(1, len(passwords) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            return list(pool.map(_hash, passwords, chunksize=chunksize))
+
+    # ── 저장 ─────────────────────────────────────────────────
+    def _save_batch(self, rows, hashes, approved_by):
+        now = timezone.now()
+        users = [
+            User(
+                username=row['username'], email=row['email'], password=password,
+                first_name=row['first_name'], last_name=row['last_name'],
+                date_joined=now,
+            )
+            for row, password in zip(rows, hashes)
+        ]
+        with transaction.atomic():
+            # bulk_create 는 post_save 를 보내지 않음 → 프로필도 여기서 함께 생성
+            users = User.objects.bulk_create(users)
+            if any(user.pk is None for user in users):
+                # PK 를 돌려주지 않는 DB → username 으로 다시 조회
+                ids = dict(User.objects.filter(username__in=[u.username for u in users])
+                           .values_list('username', 'id'))
+                for user in users:
+                    user.pk = ids[user.username]
+
+            UserProfile.objects.bulk_create([
+                UserProfile(
+                    user=user,
+                    is_member=row['is_member'],
+                    approval_status=row['approval_status'],
+                    approved_at=now if row['approval_status'] == 'approved' else None,
+                    approved_by=approved_by if row['approval_status'] == 'approved' else None,
+                )
+                for user, row in zip(users, rows)
+            ])
+        return len(users)
@@ -1,7 +1,7 @@
 # backend/accounts/models.py (수정된 부분만)
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import User
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 
 class UserProfile(models.Model):
@@ -75,6 +75,28 @@ class UserProfile(models.Model):
         """목회서신 열람 가능 여부"""
         return self.is_approved and self.is_member
 
+    # 토큰 claims 에 실리는 필드 — 바뀌었을 때만 기존 토큰을 stale 처리 (accounts/jwt.py)
+    CLAIM_FIELDS = {'approval_status', 'is_member'}
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 바뀐 필드만 저장하기 위한 스냅샷 (저장 후 signal 에서 갱신)
+        instance._loaded_values = instance._field_values()
+        return instance
+
+    def _field_values(self):
+        loaded = self.__dict__
+        return {f.attname: loaded[f.attname] for f in self._meta.concrete_fields if f.attname in loaded}
+
+    def changed_fields(self):
+        """읽은(저장한) 뒤 바뀐 필드 목록. 스냅샷이 없으면 None (알 수 없음)"""
+        snapshot = getattr(self, '_loaded_values', None)
+        if snapshot is None:
+            return None
+        return [name for name, value in self._field_values().items()
+                if name in snapshot and snapshot[name] != value]
+
 
 # Signal: User 생성 시 자동으로 UserProfile 생성
 @receiver(post_save, sender=User)
@@ -85,7 +107,66 @@ def create_user_profile(sender, instance, created, **kwargs):
 
 
 @receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
-    """사용자 저장 시 프로필도 저장"""
-    if hasattr(instance, 'profile'):
-        instance.profile.save()
\ No newline at end of file
+def save_user_profile(sender, instance, created, **kwargs):
+    """
+    사용자 저장 시 함께 수정된 프로필 저장
+    - 메모리에 올라온 프로필만 (프로필을 읽으려고 쿼리하지 않음)
+    - 바뀐 필드가 있을 때만, 바뀐 필드만 UPDATE (로그인 등 User 만 저장하는 경로는 쓰기 없음)
+    """
+    if created or not User.profile.is_cached(instance):
+        return
+    profile = instance.profile
+    changed = profile.changed_fields()
+    if changed is None:
+        profile.save()
+    elif changed:
+        profile.save(update_fields=changed + ['updated_at'])
+
+
+# Signal: 프로필 변경 시 권한 캐시(auth context) 무효화
+@receiver(post_save, sender=UserProfile)
+@receiver(post_delete, sender=UserProfile)
+def invalidate_auth_context(sender, instance, **kwargs):
+    """승인 상태/교인 여부가 바뀌면 다음 요청부터 반영"""
+    from .auth_context import invalidate
+    user_id = instance.user_id
+    invalidate(user_id)
+    if UserProfile.CLAIM_FIELDS & set(instance.changed_fields() or ()):
+        from .jwt import mark_claims_stale
+        mark_claims_stale(user_id)
+    instance._loaded_values = instance._field_values()
+    # 트랜잭션 중 다른 요청이 이전 값을 다시 캐시했을 수 있으므로 커밋 후 한 번 더
+    transaction.on_commit(lambda: invalidate(user_id))
+
+
+# Signal: 이름/관리자/활성/비밀번호 변경 시 발급된 토큰 claims 무효화
+JWT_USER_FIELDS = {'username', 'is_staff', 'is_superuser', 'is_active', 'password'}
+
+
+@receiver(post_save, sender=User)
+def mark_user_claims_stale(sender, instance, created, update_fields=None, raw=False, **kwargs):
+    """last_login 만 저장하는 로그인 경로 등은 제외"""
+    if created or raw:
+        return
+    if update_fields is not None and not JWT_USER_FIELDS & set(update_fields):
+        return
+    from .jwt import mark_claims_stale
+    mark_claims_stale(instance.pk)
+
+
+
+def profiles_bulk_updated(user_ids):
+    """
+    UserProfile queryset.update() / bulk_create 뒤에 호출 (signal 대신)
+    권한 캐시와 발급된 토큰 claims 를 커밋 후 무효화
+    """
+    user_ids = list(user_ids)
+    if not user_ids:
+        return
+    from .auth_context import invalidate_many
+    from .jwt import mark_claims_stale_many
+
+    def invalidate():
+        invalidate_many(user_ids)
+        mark_claims_stale_many(user_ids)
+    transaction.on_commit(invalidate)
@@ -1,9 +1,11 @@
 # backend/accounts/views.py 
 from rest_framework import generics, status
 from rest_framework.response import Response
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.views import APIView
 from django.contrib.auth.models import User
 from .serializers import RegisterSerializer
+from .jwt import revoke_token
 
 class RegisterView(generics.CreateAPIView):
     queryset = User.objects.all()
@@ -21,4 +23,14 @@ class RegisterView(generics.CreateAPIView):
                 "email": user.email
             },
             "message": "User created successfully"
-        }, status=status.HTTP_201_CREATED)
\ No newline at end of file
+        }, status=status.HTTP_201_CREATED)
+
+
+class LogoutView(APIView):
+    """현재 access 토큰 폐기 (만료 전까지 Redis 폐기 목록에 보관, JWT_CLAIMS_USER 일 때 인증에서 확인)"""
+    permission_classes = (IsAuthenticated,)
+
+    def post(self, request):
+        if request.auth is not None:
+            revoke_token(request.auth)
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -1,7 +1,7 @@
 # backend/bible_verses/admin.py
 
 from django.contrib import admin
-from .models import BibleVerse, Theme, JesusSaying, ParallelGroup, Meditation
+from .models import BibleVerse, Theme, JesusSaying, ParallelGroup, Meditation, MeditationDay
 
 
 # ============================================================
@@ -108,8 +108,16 @@ class ParallelGroupAdmin(admin.ModelAdmin):
 
 @admin.register(Meditation)
 class MeditationAdmin(admin.ModelAdmin):
-    list_display  = ['id', 'user', 'saying', 'is_private', 'created_at']
-    list_filter   = ['is_private', 'created_at']
+    list_display  = ['id', 'user', 'saying', 'is_private', 'is_deleted', 'change_seq', 'created_at']
+    list_filter   = ['is_private', 'is_deleted', 'created_at']
     search_fields = ['user__username', 'content', 'saying__text_ko_krv']
     raw_id_fields = ['user', 'saying']
-    ordering      = ['-created_at']
\ No newline at end of file
+    ordering      = ['-created_at']
+
+
+@admin.register(MeditationDay)
+class MeditationDayAdmin(admin.ModelAdmin):
+    list_display  = ['user', 'date', 'count']
+    search_fields = ['user__username']
+    raw_id_fields = ['user']
+    ordering      = ['-date']
@@ -0,0 +1,53 @@
+# backend/bible_verses/books.py
+"""
+성경 책 코드 정규화
+
+앱마다 책 코드 체계가 다르다.
+- sermons.Sermon.bible_book       : 영어 소문자 ('john', '1corinthians')
+- bible_verses.JesusSaying.book   : USFM 3글자 ('JHN', '1CO')
+
+두 모델을 연결할 때는 모두 USFM 코드로 정규화해서 비교한다.
+"""
+
+# Sermon.BIBLE_BOOKS 코드 → USFM 코드
+SERMON_BOOK_TO_USFM = {
+    # 구약
+    'genesis': 'GEN', 'exodus': 'EXO', 'leviticus': 'LEV',
+    'numbers': 'NUM', 'deuteronomy': 'DEU', 'joshua': 'JOS',
+    'judges': 'JDG', 'ruth': 'RUT', '1samuel': '1SA',
+    '2samuel': '2SA', '1kings': '1KI', '2kings': '2KI',
+    '1chronicles': '1CH', '2chronicles': '2CH', 'ezra': 'EZR',
+    'nehemiah': 'NEH', 'esther': 'EST', 'job': 'JOB',
+    'psalms': 'PSA', 'proverbs': 'PRO', 'ecclesiastes': 'ECC',
+    'song': 'SNG', 'isaiah': 'ISA', 'jeremiah': 'JER',
+    'lamentations': 'LAM', 'ezekiel': 'EZK', 'daniel': 'DAN',
+    'hosea': 'HOS', 'joel': 'JOL', 'amos': 'AMO',
+    'obadiah': 'OBA', 'jonah': 'JON', 'micah': 'MIC',
+    'nahum': 'NAM', 'habakkuk': 'HAB', 'zephaniah': 'ZEP',
+    'haggai': 'HAG', 'zechariah': 'ZEC', 'malachi': 'MAL',
+    # 신약
+    'matthew': 'MAT', 'mark': 'MRK', 'luke': 'LUK',
+    'john': 'JHN', 'acts': 'ACT', 'romans': 'ROM',
+    '1corinthians': '1CO', '2corinthians': '2CO',
+    'galatians': 'GAL', 'ephesians': 'EPH',
+    'philippians': 'PHP', 'colossians': 'COL',
+    '1thessalonians': '1TH', '2thessalonians': '2TH',
+    '1timothy': '1TI', '2timothy': '2TI',
+    'titus': 'TIT', 'philemon': 'PHM', 'hebrews': 'HEB',
+    'james': 'JAS', '1peter': '1PE', '2peter': '2PE',
+    '1john': '1JN', '2john': '2JN', '3john': '3JN',
+    'jude': 'JUD', 'revelation': 'REV',
+}
+
+USFM_TO_SERMON_BOOK = {usfm: code for code, usfm in SERMON_BOOK_TO_USFM.items()}
+
+
+def canonical_book(code):
+    """어느 체계의 코드든 USFM 코드로 변환 (모르는 코드는 None)"""
+    if not code:
+        return None
+    if code in USFM_TO_SERMON_BOOK:
+        return code
+    if code.upper() in USFM_TO_SERMON_BOOK:
+        return code.upper()
+    return SERMON_BOOK_TO_USFM.get(code.lower())
@@ -0,0 +1,207 @@
+# backend/bible_verses/bundle.py
+"""
+오프라인 콘텐츠 번들 (PWA)
+
+홈 화면/말씀 탐색기가 여러 번 나눠 받던 읽기 전용 묵상 콘텐츠
+(성경 구절, 주제, 예수님 말씀, 병행구절 그룹)를 gzip JSON 파일 하나로 묶는다.
+
+[형식]
+{ "format": 1,
+  "tables": { "sayings": { "fields": [...], "rows": [[...], ...] }, ... } }
+- 테이블마다 필드 이름은 한 번만 쓰고 행은 배열 → 키 반복 없음
+- M2M(말씀↔주제, 그룹↔말씀)은 ID 배열 컬럼
+
+[버전]
+정규화한 JSON 의 sha256 앞 16자리 = 버전(content hash).
+내용이 같으면 다시 빌드해도 버전이 같다 → 클라이언트는 재다운로드하지 않음.
+파일: MEDIA_ROOT/bundles/content-<버전>.json.gz  (한 번 만든 파일은 바뀌지 않음)
+
+[갱신]
+콘텐츠 저장/삭제 signal → mark_stale() (표식만 남김).
+다음 manifest 요청 때 get_manifest() 가 다시 빌드한다.
+대량 적재(load_jesus_sayings 등) 중에 행마다 빌드하지 않기 위함.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from .models import BibleVerse, Theme, JesusSaying, ParallelGroup
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_FORMAT = 1
+BUNDLE_DIR    = 'bundles'
+KEEP_BUNDLES  = 3          # 이전 버전 파일 보관 수 (구버전 manifest 를 받은 클라이언트용)
+
+MANIFEST_KEY = 'sayings:bundle:manifest'
+STALE_KEY    = 'sayings:bundle:stale'
+LOCK_KEY     = 'sayings:bundle:lock'
+
+VERSE_FIELDS  = ['id', 'category', 'reference_kr', 'reference_de', 'text_kr', 'text_de', 'priority']
+THEME_FIELDS  = ['id', 'key', 'name_ko', 'name_en', 'name_de', 'order']
+SAYING_FIELDS = [
+    'id', 'book', 'chapter', 'verse_start', 'verse_end', 'size',
+    'text_ko_krv', 'text_ko_new', 'text_en', 'text_de',
+    'context_ko', 'context_en', 'keywords',
+    'audience', 'occasion', 'season', 'slide_cycle', 'slide_order',
+]
+GROUP_FIELDS  = ['id', 'name', 'order']
+
+
+# ── 빌드 ──────────────────────────────────────────────────────
+
+def _m2m(through, owner, target):
+    """through 테이블 → {owner_id: [target_id, ...]} (쿼리 1회)"""
+    mapping = {}
+    for owner_id, target_id in through.objects.order_by(owner, target).values_list(owner, target):
+        mapping.setdefault(owner_id, []).append(target_id)
+    return mapping
+
+
+def _table(qs, fields, extra=None):
+    """extra: {컬럼 이름: {id: 값}} — 행 끝에 덧붙일 컬럼"""
+    extra = extra or {}
+    rows = []
+    for values in qs.order_by('id').values_list(*fields):
+        row = list(values)
+        for mapping in extra.values():
+            row.append(mapping.get(values[0], []))
+        rows.append(row)
+    return {'fields': fields + list(extra), 'rows': rows}
+
+
+def build_payload():
+    saying_themes = _m2m(JesusSaying.themes.through, 'jesussaying_id', 'theme_id')
+    group_sayings = _m2m(ParallelGroup.sayings.through, 'parallelgroup_id', 'jesussaying_id')
+    return {
+        'format': BUNDLE_FORMAT,
+        'tables': {
+            'verses':    _table(BibleVerse.objects.filter(is_active=True), VERSE_FIELDS),
+            'themes':    _table(Theme.objects.all(), THEME_FIELDS),
+            'sayings':   _table(JesusSaying.objects.filter(is_active=True), SAYING_FIELDS,
+                                {'themes': saying_themes}),
+            'parallels': _table(ParallelGroup.objects.all(), GROUP_FIELDS,
+                                {'sayings': group_sayings}),
+        },
+    }
+
+
+def bundle_dir():
+    return Path(settings.MEDIA_ROOT) / BUNDLE_DIR
+
+
+def bundle_path(version):
+    return bundle_dir() / f'content-{version}.json.gz'
+
+
+def _write_atomic(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _cleanup(keep_version):
+    files = sorted(bundle_dir().glob('content-*.json.gz'), key=lambda p: p.stat().st_mtime, reverse=True)
+    for path in files[KEEP_BUNDLES:]:
+        if keep_version not in path.name:
+            path.unlink(missing_ok=True)
+
+
+def build_bundle():
+    """번들 파일 + manifest 생성. manifest dict 반환"""
+    try:
+        # 빌드 중 들어온 변경은 다시 stale 표식을 남기도록 먼저 지움
+        cache.delete(STALE_KEY)
+    except Exception as e:
+        logger.warning(f"content bundle stale flag clear failed: {e}")
+
+    payload = build_payload()
+    raw = json.dumps(payload, ensure_ascii=False, separators=(',', ':'), sort_keys=True).encode('utf-8')
+    version = hashlib.sha256(raw).hexdigest()[:16]
+
+    path = bundle_path(version)
+    if not path.exists():
+        # mtime=0 → 같은 내용이면 같은 바이트
+        _write_atomic(path, gzip.compress(raw, compresslevel=9, mtime=0))
+
+    manifest = {
+        'version':  version,
+        'format':   BUNDLE_FORMAT,
+        'size':     path.stat().st_size,
+        'raw_size': len(raw),
+        'counts':   {name: len(t['rows']) for name, t in payload['tables'].items()},
+        'built_at': timezone.now().isoformat(),
+    }
+    _write_atomic(bundle_dir() / 'manifest.json', json.dumps(manifest).encode('utf-8'))
+    try:
+        cache.set(MANIFEST_KEY, manifest, timeout=None)
+    except Exception as e:
+        logger.warning(f"content bundle manifest cache write failed: {e}")
+
+    _cleanup(version)
+    logger.info(f"content bundle built: {version} ({manifest['size']} bytes)")
+    return manifest
+
+
+# ── 조회 ──────────────────────────────────────────────────────
+
+def _stored_manifest():
+    try:
+        manifest = cache.get(MANIFEST_KEY)
+        if manifest is not None:
+            return manifest
+    except Exception as e:
+        logger.warning(f"content bundle manifest cache read failed: {e}")
+    try:
+        return json.loads((bundle_dir() / 'manifest.json').read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _is_stale():
+    try:
+        return bool(cache.get(STALE_KEY))
+    except Exception:
+        return False
+
+
+def get_manifest():
+    """현재 manifest (없거나 stale 이면 다시 빌드)"""
+    manifest = _stored_manifest()
+    if manifest is not None and bundle_path(manifest['version']).exists() and not _is_stale():
+        return manifest
+
+    try:
+        acquired = cache.add(LOCK_KEY, 1, timeout=60)
+    except Exception:
+        acquired = True
+    if not acquired and manifest is not None:
+        return manifest   # 다른 워커가 빌드 중 → 직전 버전으로 응답
+
+    try:
+        return build_bundle()
+    finally:
+        if acquired:
+            try:
+                cache.delete(LOCK_KEY)
+            except Exception:
+                pass
+
+
+def mark_stale():
+    """콘텐츠 변경 시 호출 — 다음 manifest 요청에서 재빌드"""
+    try:
+        cache.set(STALE_KEY, 1, timeout=None)
+    except Exception as e:
+        logger.warning(f"content bundle stale mark failed: {e}")
@@ -0,0 +1,48 @@
+# backend/bible_verses/management/commands/backfill_meditation_days.py
+#
+# 기존 묵상 노트로 일일 묵상 집계(MeditationDay)를 다시 계산
+#
+# ── 사용법 ──────────────────────────────────────────────────────
+#   python manage.py backfill_meditation_days                  # 전체 사용자
+#   python manage.py backfill_meditation_days --batch-size 200 # 사용자 200명씩
+#   python manage.py backfill_meditation_days --user 5         # 특정 사용자만
+# ────────────────────────────────────────────────────────────────
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from bible_verses.meditation_calendar import rebuild_days
+from bible_verses.models import Meditation
+
+
+class Command(BaseCommand):
+    help = '묵상 달력/연속일 집계 테이블 재계산'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='한 번에 처리할 사용자 수')
+        parser.add_argument('--user', type=int, help='특정 사용자 ID만')
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options['batch_size'])
+        user_ids = (
+            Meditation.objects
+            .values_list('user_id', flat=True)
+            .distinct()
+            .order_by('user_id')
+        )
+        if options['user']:
+            user_ids = user_ids.filter(user_id=options['user'])
+        user_ids = list(user_ids)
+
+        started = time.perf_counter()
+        days = 0
+        for i in range(0, len(user_ids), batch_size):
+            batch = user_ids[i:i + batch_size]
+            days += rebuild_days(batch)
+            self.stdout.write(f'  {min(i + batch_size, len(user_ids))}/{len(user_ids)} 명 처리')
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'  ✅ 사용자 {len(user_ids)}명, 집계 {days}일 생성 ({elapsed:.2f}s)'
+        ))
@@ -0,0 +1,29 @@
+# backend/bible_verses/management/commands/build_content_bundle.py
+#
+# 오프라인 콘텐츠 번들(성경 구절·주제·말씀·병행구절) 빌드
+#
+# ── 사용법 ──────────────────────────────────────────────────────
+#   python manage.py build_content_bundle            # 배포 후 / 데이터 적재 후 실행
+# ────────────────────────────────────────────────────────────────
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from bible_verses.bundle import build_bundle
+
+
+class Command(BaseCommand):
+    help = '오프라인 콘텐츠 번들 빌드 (content hash 버전)'
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        manifest = build_bundle()
+        elapsed = time.perf_counter() - started
+
+        counts = ', '.join(f'{name} {n}' for name, n in manifest['counts'].items())
+        self.stdout.write(f'  {counts}')
+        self.stdout.write(self.style.SUCCESS(
+            f'  ✅ 번들 {manifest["version"]} '
+            f'({manifest["raw_size"] / 1024:.1f}KB → {manifest["size"] / 1024:.1f}KB gzip, {elapsed:.2f}s)'
+        ))
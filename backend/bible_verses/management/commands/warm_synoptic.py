@@ -0,0 +1,42 @@
+# backend/bible_verses/management/commands/warm_synoptic.py
+#
+# 병행구절 그룹 공관복음 비교 결과를 미리 계산해 캐시에 저장
+#
+# ── 사용법 ──────────────────────────────────────────────────────
+#   python manage.py warm_synoptic                 # 전체 그룹 × 전체 언어
+#   python manage.py warm_synoptic --lang ko       # 한국어(개역개정)만
+#   python manage.py warm_synoptic --group 12      # 특정 그룹만
+# ────────────────────────────────────────────────────────────────
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from bible_verses.models import ParallelGroup
+from bible_verses.synoptic import LANG_FIELDS, get_synoptic
+
+
+class Command(BaseCommand):
+    help = '병행구절 공관복음 비교 캐시 예열'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--lang', choices=list(LANG_FIELDS), help='특정 언어만')
+        parser.add_argument('--group', type=int, help='특정 그룹 ID만')
+
+    def handle(self, *args, **options):
+        langs  = [options['lang']] if options['lang'] else list(LANG_FIELDS)
+        groups = ParallelGroup.objects.prefetch_related('sayings')
+        if options['group']:
+            groups = groups.filter(id=options['group'])
+
+        started = time.perf_counter()
+        count = 0
+        for group in groups:
+            for lang in langs:
+                get_synoptic(group, lang)
+                count += 1
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'  ✅ {count}건 비교 결과 캐시 완료 ({elapsed:.2f}s)'
+        ))
@@ -0,0 +1,121 @@
+# backend/bible_verses/meditation_calendar.py
+"""
+묵상 달력(히트맵) / 연속 묵상일(streak)
+
+[집계 테이블]
+MeditationDay(user, date, count) — 사용자·날짜별 묵상 수.
+Meditation 저장/삭제 signal 이 바뀐 날짜만 refresh_days() 로 다시 센다.
+달력/연속일 조회는 노트 본문을 읽지 않고 이 테이블만 읽는다
+(1년 조회 = 최대 366행).
+
+[기준 날짜]
+Meditation.date 가 있으면 그 날짜, 없으면 작성일(created_at, 로컬 날짜).
+삭제 표식(is_deleted) 노트는 세지 않는다.
+"""
+
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Count, Q
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+
+from .models import Meditation, MeditationDay
+
+
+def _day_filter(day):
+    return Q(date=day) | Q(date__isnull=True, created_at__date=day)
+
+
+# ── 갱신 ──────────────────────────────────────────────────────
+
+def refresh_days(user_id, days):
+    """지정한 날짜들의 묵상 수를 다시 세서 집계 행을 맞춤"""
+    for day in {d for d in days if d}:
+        count = (
+            Meditation.objects
+            .filter(_day_filter(day), user_id=user_id, is_deleted=False)
+            .count()
+        )
+        if count:
+            MeditationDay.objects.update_or_create(
+                user_id=user_id, date=day, defaults={'count': count}
+            )
+        else:
+            MeditationDay.objects.filter(user_id=user_id, date=day).delete()
+
+
+def rebuild_days(user_ids):
+    """사용자 묶음의 집계를 전부 다시 계산 (backfill 용). 생성된 행 수 반환"""
+    rows = (
+        Meditation.objects
+        .filter(user_id__in=user_ids, is_deleted=False)
+        .annotate(day=Coalesce('date', TruncDate('created_at')))
+        .values('user_id', 'day')
+        .annotate(n=Count('id'))
+        .order_by()
+    )
+    days = [MeditationDay(user_id=r['user_id'], date=r['day'], count=r['n']) for r in rows]
+
+    with transaction.atomic():
+        MeditationDay.objects.filter(user_id__in=user_ids).delete()
+        MeditationDay.objects.bulk_create(days, batch_size=1000)
+    return len(days)
+
+
+# ── 조회 ──────────────────────────────────────────────────────
+
+def calendar(user, year):
+    """{ year, days: {'YYYY-MM-DD': 묵상 수}, total, active_days }"""
+    rows = (
+        MeditationDay.objects
+        .filter(user=user, date__year=year)
+        .order_by('date')
+        .values_list('date', 'count')
+    )
+    days = {d.isoformat(): n for d, n in rows}
+    return {
+        'year':        year,
+        'days':        days,
+        'total':       sum(days.values()),
+        'active_days': len(days),
+    }
+
+
+def streak(user, today=None):
+    """
+    current : 오늘(또는 어제)까지 이어지는 연속 묵상일
+              — 오늘 아직 묵상하지 않았어도 어제까지 이어졌으면 유지
+    longest : 전체 기간 최장 연속 묵상일
+    """
+    today = today or timezone.localdate()
+    dates = list(
+        MeditationDay.objects
+        .filter(user=user, count__gt=0)
+        .order_by('-date')
+        .values_list('date', flat=True)
+    )
+
+    one_day = timedelta(days=1)
+
+    current = 0
+    if dates and dates[0] >= today - one_day:
+        current = 1
+        for later, earlier in zip(dates, dates[1:]):
+            if later - earlier != one_day:
+                break
+            current += 1
+
+    longest = run = 0
+    previous = None
+    for day in dates:
+        run = run + 1 if previous and previous - day == one_day else 1
+        longest = max(longest, run)
+        previous = day
+
+    return {
+        'current':    current,
+        'longest':    longest,
+        'last_date':  dates[0].isoformat() if dates else None,
+        'today_done': bool(dates) and dates[0] == today,
+    }
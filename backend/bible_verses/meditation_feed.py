@@ -0,0 +1,176 @@
+# backend/bible_verses/meditation_feed.py
+"""
+공유 묵상 피드 (is_private=False 인 다른 회원의 묵상)
+
+[타임라인 캐시]  Redis sorted set — 전체 피드 1개 + 말씀별 피드
+- member/score = 묵상 ID → 최신순 정렬이 ID 역순과 같음
+- 쓰기 시 record() 로 추가하고 최근 FEED_LENGTH 건만 남기도록 잘라냄
+  (비공개 전환/삭제 시에는 제거)
+- score 0 의 SENTINEL 멤버 = "DB 에서 채워진 타임라인" 표식.
+  없으면 읽을 때 DB 최신 FEED_LENGTH 건으로 채운다.
+- <key>:complete = 타임라인에 모든 공유 묵상이 들어 있음 (잘라낸 적 없음).
+  없으면 타임라인 끝에 닿았을 때 DB 로 넘어간다.
+
+[읽기]  window_ids()
+커서 위치 이후 ID 를 Redis 에서 한 번에 꺼내고, 뷰는 그 ID 로만 DB 를 조회
+(PK 조회 1회). 커서가 타임라인 창 밖이거나 Redis 장애 시 None → 뷰가
+공유 묵상 부분 인덱스로 DB 커서 페이지네이션.
+타임라인에 남은 삭제/비공개 ID 가 WINDOW_SLACK 보다 많아 페이지가 모자라면
+뷰가 prune() 으로 그 ID 를 지우고 DB 로 다시 조회.
+"""
+
+import logging
+
+from django.core.cache import cache
+from django.db.models import Count
+
+from .models import Meditation
+
+logger = logging.getLogger(__name__)
+
+FEED_LENGTH  = 300
+FEED_TIMEOUT = 60 * 60 * 24 * 7   # 7일 (쓰기마다 연장)
+WINDOW_SLACK = 10                 # 캐시에 남은 삭제/비공개 ID 를 걸러도 한 페이지가 차도록 여유분
+SENTINEL     = '0'
+
+
+def _redis():
+    """django_redis 연결 (Redis 캐시가 아니면 None)"""
+    try:
+        from django_redis import get_redis_connection
+        return get_redis_connection('default')
+    except Exception:
+        return None
+
+
+def _key(saying_id=None):
+    name = f'sayings:shared_feed:saying:{saying_id}' if saying_id else 'sayings:shared_feed:all'
+    return cache.make_key(name)
+
+
+def _complete_key(key):
+    return f'{key}:complete'
+
+
+def shared_queryset(saying_id=None):
+    qs = (
+        Meditation.objects
+        .filter(is_private=False, is_deleted=False)
+        .select_related('saying', 'user')
+    )
+    if saying_id:
+        qs = qs.filter(saying_id=saying_id)
+    return qs
+
+
+# ── 쓰기 ──────────────────────────────────────────────────────
+
+def _trim(pipe, key):
+    # rank 0 = SENTINEL(score 0) → 그 다음부터 최근 FEED_LENGTH 건 앞까지 제거
+    pipe.zremrangebyrank(key, 1, -(FEED_LENGTH + 1))
+    pipe.expire(key, FEED_TIMEOUT)
+    pipe.expire(_complete_key(key), FEED_TIMEOUT)
+
+
+def record(note_id, saying_id, shared):
+    """묵상 저장/삭제 후 호출 — 공유 상태에 따라 타임라인에 추가 또는 제거"""
+    conn = _redis()
+    if conn is None:
+        return
+    keys = (_key(), _key(saying_id))
+    try:
+        pipe = conn.pipeline(transaction=False)
+        for key in keys:
+            if shared:
+                pipe.zadd(key, {note_id: note_id})
+                _trim(pipe, key)
+            else:
+                pipe.zrem(key, note_id)
+        results = pipe.execute()
+        if shared:
+            # 잘려 나간 항목이 있으면 더 이상 전체 목록이 아님
+            trimmed = [key for key, removed in zip(keys, results[1::4]) if removed]
+            if trimmed:
+                conn.delete(*[_complete_key(key) for key in trimmed])
+    except Exception as e:
+        logger.warning(f"shared feed write failed: {e}")
+
+
+def _seed(conn, key, saying_id):
+    """DB 최신 공유 묵상으로 타임라인 채움 (기존 멤버와 합집합 → 동시 쓰기 유실 없음)"""
+    ids = list(
+        shared_queryset(saying_id)
+        .order_by('-id')
+        .values_list('id', flat=True)[:FEED_LENGTH]
+    )
+    pipe = conn.pipeline(transaction=False)
+    if len(ids) < FEED_LENGTH:
+        pipe.set(_complete_key(key), 1, ex=FEED_TIMEOUT)
+    else:
+        pipe.delete(_complete_key(key))
+    pipe.zadd(key, {SENTINEL: 0, **{i: i for i in ids}})
+    _trim(pipe, key)
+    pipe.execute()
+
+
+# ── 읽기 ──────────────────────────────────────────────────────
+
+def window_ids(paginator, request, saying_id=None):
+    """
+    이번 페이지에 필요한 묵상 ID 목록 (Redis 타임라인) 과 타임라인 끝까지 읽었는지 여부.
+    None → 타임라인으로 답할 수 없음 (DB 조회 필요)
+    """
+    cursor = paginator.decode_cursor(request)
+    if cursor and (cursor.reverse or cursor.offset):
+        return None   # 이전 페이지 방향은 DB 로
+
+    conn = _redis()
+    if conn is None:
+        return None
+
+    key   = _key(saying_id)
+    upper = f'({cursor.position}' if cursor and cursor.position else '+inf'
+    size  = paginator.get_page_size(request)
+    limit = size + 1 + WINDOW_SLACK
+
+    def read():
+        pipe = conn.pipeline(transaction=False)
+        pipe.zscore(key, SENTINEL)
+        pipe.zrevrangebyscore(key, upper, '(0', start=0, num=limit)
+        pipe.exists(_complete_key(key))
+        return pipe.execute()
+
+    try:
+        seeded, ids, complete = read()
+        if seeded is None:
+            _seed(conn, key, saying_id)
+            seeded, ids, complete = read()
+    except Exception as e:
+        logger.warning(f"shared feed read failed: {e}")
+        return None
+
+    if len(ids) <= size and not complete:
+        return None   # 창 끝에 닿음 → 더 오래된 묵상은 DB 에서
+
+    exhaustive = bool(complete) and len(ids) < limit
+    return [int(i) for i in ids], exhaustive
+
+
+def prune(saying_id, note_ids):
+    """타임라인에 남은 삭제/비공개 묵상 ID 제거 (읽기 중 발견)"""
+    conn = _redis()
+    if conn is None or not note_ids:
+        return
+    try:
+        conn.zrem(_key(saying_id), *note_ids)
+    except Exception as e:
+        logger.warning(f"shared feed prune failed: {e}")
+
+
+def shared_counts(saying_ids=None):
+    """{말씀 ID: 공유 묵상 수} — 공유 묵상 부분 인덱스(saying, id)로 집계"""
+    qs = Meditation.objects.filter(is_private=False, is_deleted=False)
+    if saying_ids is not None:
+        qs = qs.filter(saying_id__in=saying_ids)
+    rows = qs.values('saying_id').annotate(n=Count('id')).order_by()
+    return {r['saying_id']: r['n'] for r in rows}
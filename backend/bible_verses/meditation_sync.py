@@ -0,0 +1,206 @@
+# backend/bible_verses/meditation_sync.py
+"""
+묵상 노트 오프라인 동기화 (delta sync)
+
+[커서]
+서버가 발급하는 불투명 문자열. 내부적으로 마지막으로 전달한 change_seq 만 담는다.
+클라이언트는 값을 해석하지 않고 그대로 돌려준다.
+
+[조회]  changes_since(user, cursor)
+(user, change_seq) 인덱스로 커서 이후 변경분만 읽음 → 비용이 전체 노트 수가 아니라
+변경 수에 비례. 삭제된 노트는 tombstone(id, deleted_at)으로 전달.
+
+[업로드]  apply_changes(user, items)
+항목별로 처리하고 결과를 항목별로 돌려준다.
+- id 없음                      → 새 노트 생성 (client_id 를 그대로 돌려줌)
+                                 같은 client_id 로 다시 보내면 이미 만든 노트를 created 로 돌려줌
+- 형식이 잘못된 항목             → invalid (배치의 나머지 항목은 그대로 처리)
+- base_seq < 서버 change_seq    → conflict (서버 버전 반환, 클라이언트가 병합)
+- base_seq 생략                 → 덮어쓰기 (last-write-wins)
+- deleted: true               → 삭제 표식
+"""
+
+import base64
+import binascii
+
+from django.db import IntegrityError, transaction
+
+from .models import Meditation
+from .serializers import MeditationSerializer
+
+MAX_PULL = 500
+MAX_PUSH = 100
+CLIENT_ID_MAX_LENGTH = 64
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+# ── 커서 ──────────────────────────────────────────────────────
+
+def encode_cursor(seq):
+    return base64.urlsafe_b64encode(str(seq).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """커서 → change_seq (없으면 0)"""
+    if not cursor:
+        return 0
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        # 이전 형식 'seq|updated_at' 커서도 받음 (이미 발급된 커서)
+        seq, _, _ = base64.urlsafe_b64decode(padded).decode().partition('|')
+        return int(seq)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursor(str(e)) from e
+
+
+def _tombstone(note):
+    return {
+        'id':         note.id,
+        'change_seq': note.change_seq,
+        'deleted_at': note.deleted_at.isoformat() if note.deleted_at else None,
+    }
+
+
+# ── 조회 ──────────────────────────────────────────────────────
+
+def changes_since(user, cursor, limit=MAX_PULL):
+    since = decode_cursor(cursor)
+    limit = max(1, min(limit, MAX_PULL))
+
+    qs = (
+        Meditation.objects
+        .filter(user=user, change_seq__gt=since)
+        .select_related('saying', 'user')
+        .order_by('change_seq')
+    )
+    if not since:
+        # 최초 동기화: 삭제 표식은 필요 없음
+        qs = qs.filter(is_deleted=False)
+
+    rows = list(qs[:limit + 1])
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    live    = [n for n in rows if not n.is_deleted]
+    deleted = [_tombstone(n) for n in rows if n.is_deleted]
+    last    = rows[-1] if rows else None
+
+    return {
+        'changes':  MeditationSerializer(live, many=True).data,
+        'deleted':  deleted,
+        'cursor':   encode_cursor(last.change_seq) if last else (cursor or encode_cursor(0)),
+        'has_more': has_more,
+    }
+
+
+# ── 업로드 ────────────────────────────────────────────────────
+
+def _as_int(value):
+    """정수 / 정수 문자열 → int, 아니면 None (bool 은 제외)"""
+    if isinstance(value, bool):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _item_errors(item):
+    """항목 형식 검사 — 문제가 있으면 {필드: [메시지]}"""
+    errors = {}
+    client_id = item.get('client_id')
+    if client_id is not None and (not isinstance(client_id, (str, int)) or isinstance(client_id, bool)
+                                  or len(str(client_id)) > CLIENT_ID_MAX_LENGTH):
+        errors['client_id'] = [f'{CLIENT_ID_MAX_LENGTH}자 이하의 문자열이어야 합니다.']
+    for field in ('id', 'base_seq'):
+        value = item.get(field)
+        if value not in (None, '') and _as_int(value) is None:
+            errors[field] = ['정수여야 합니다.']
+    return errors
+
+
+def _create(user, item, result):
+    client_id = item.get('client_id')
+    client_id = str(client_id) if client_id not in (None, '') else None
+
+    def existing():
+        note = Meditation.objects.filter(user=user, client_id=client_id).first()
+        if note is None:
+            return None
+        return result('created', id=note.id, change_seq=note.change_seq)
+
+    if client_id and (replay := existing()):
+        return replay
+
+    serializer = MeditationSerializer(data=item)
+    if not serializer.is_valid():
+        return result('invalid', errors=serializer.errors)
+    try:
+        with transaction.atomic():
+            note = serializer.save(user=user, client_id=client_id)
+    except IntegrityError:
+        # 같은 client_id 의 동시 재전송 — 먼저 저장된 노트를 돌려줌
+        if client_id and (replay := existing()):
+            return replay
+        raise
+    return result('created', id=note.id, change_seq=note.change_seq)
+
+
+def _apply_one(user, item):
+    if not isinstance(item, dict):
+        return {'client_id': None, 'id': None, 'status': 'invalid',
+                'errors': {'non_field_errors': ['항목은 객체여야 합니다.']}}
+
+    client_id = item.get('client_id')
+    note_id   = item.get('id')
+    base_seq  = item.get('base_seq')
+
+    def result(status, **extra):
+        return {'client_id': client_id, 'id': note_id, 'status': status, **extra}
+
+    errors = _item_errors(item)
+    if errors:
+        return result('invalid', errors=errors)
+
+    # 새 노트
+    if not note_id:
+        if item.get('deleted'):
+            return result('ignored')
+        return _create(user, item, result)
+
+    with transaction.atomic():
+        note = (
+            Meditation.objects
+            .select_for_update()
+            .filter(id=_as_int(note_id), user=user)
+            .first()
+        )
+        if note is None:
+            return result('not_found')
+
+        if base_seq not in (None, '') and note.change_seq > _as_int(base_seq):
+            server = _tombstone(note) if note.is_deleted else MeditationSerializer(note).data
+            return result('conflict', change_seq=note.change_seq, server=server,
+                          server_deleted=note.is_deleted)
+
+        if item.get('deleted'):
+            if not note.is_deleted:
+                note.soft_delete()
+            return result('deleted', change_seq=note.change_seq)
+
+        if note.is_deleted:
+            return result('conflict', change_seq=note.change_seq,
+                          server=_tombstone(note), server_deleted=True)
+
+        serializer = MeditationSerializer(note, data=item, partial=True)
+        if not serializer.is_valid():
+            return result('invalid', errors=serializer.errors)
+        note = serializer.save()
+        return result('updated', change_seq=note.change_seq)
+
+
+def apply_changes(user, items):
+    return [_apply_one(user, item) for item in items[:MAX_PUSH]]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.7 on 2026-10-19 08:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_change_seq(apps, schema_editor):
+    """기존 노트에 updated_at 순서대로 변경 번호 부여 (최초 동기화에 포함되도록)"""
+    Meditation = apps.get_model('bible_verses', 'Meditation')
+    SyncSequence = apps.get_model('bible_verses', 'SyncSequence')
+
+    seq = 0
+    for note_id in Meditation.objects.order_by('updated_at', 'id').values_list('id', flat=True).iterator():
+        seq += 1
+        Meditation.objects.filter(id=note_id).update(change_seq=seq)
+    SyncSequence.objects.update_or_create(name='meditation', defaults={'value': seq})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bible_verses', '0003_meditation_date'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncSequence',
+            fields=[
+                ('name', models.CharField(max_length=50, primary_key=True, serialize=False, verbose_name='시퀀스 이름')),
+                ('value', models.BigIntegerField(default=0, verbose_name='현재 값')),
+            ],
+            options={
+                'verbose_name': '동기화 시퀀스',
+                'verbose_name_plural': '동기화 시퀀스 목록',
+            },
+        ),
+        migrations.AddField(
+            model_name='meditation',
+            name='change_seq',
+            field=models.BigIntegerField(default=0, editable=False, verbose_name='변경 번호'),
+        ),
+        migrations.AddField(
+            model_name='meditation',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='삭제 일시'),
+        ),
+        migrations.AddField(
+            model_name='meditation',
+            name='is_deleted',
+            field=models.BooleanField(default=False, help_text='삭제 표식(tombstone) — 동기화 클라이언트에 삭제를 전달', verbose_name='삭제됨'),
+        ),
+        migrations.AddIndex(
+            model_name='meditation',
+            index=models.Index(fields=['user', 'change_seq'], name='meditation_user_seq_idx'),
+        ),
+        migrations.RunPython(backfill_change_seq, migrations.RunPython.noop),
+    ]
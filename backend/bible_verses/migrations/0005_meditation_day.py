@@ -0,0 +1,31 @@
+# Generated by Django 5.2.7 on 2026-10-19 08:35
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bible_verses', '0004_meditation_sync'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MeditationDay',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='날짜')),
+                ('count', models.PositiveIntegerField(default=0, verbose_name='묵상 수')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='meditation_days', to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '일일 묵상 집계',
+                'verbose_name_plural': '일일 묵상 집계 목록',
+                'ordering': ['-date'],
+                'unique_together': {('user', 'date')},
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-19 08:37
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bible_verses', '0005_meditation_day'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='meditation',
+            index=models.Index(condition=models.Q(('is_deleted', False), ('is_private', False)), fields=['-id'], name='meditation_shared_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='meditation',
+            index=models.Index(condition=models.Q(('is_deleted', False), ('is_private', False)), fields=['saying', '-id'], name='meditation_saying_shared_idx'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.7 on 2026-10-19 09:43
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Max
+
+
+def split_sequence_per_user(apps, schema_editor):
+    """전역 'meditation' 카운터 → 사용자별 'meditation:<user_id>' (각자 지금까지의 최대 번호부터)"""
+    Meditation = apps.get_model('bible_verses', 'Meditation')
+    SyncSequence = apps.get_model('bible_verses', 'SyncSequence')
+
+    rows = Meditation.objects.values('user_id').annotate(last=Max('change_seq'))
+    SyncSequence.objects.bulk_create(
+        [SyncSequence(name=f"meditation:{row['user_id']}", value=row['last'] or 0) for row in rows],
+        ignore_conflicts=True,
+    )
+    SyncSequence.objects.filter(name='meditation').delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bible_verses', '0006_meditation_shared_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='meditation',
+            name='client_id',
+            field=models.CharField(blank=True, editable=False, help_text='오프라인에서 만든 노트의 임시 ID — 같은 생성 요청 재전송 시 중복 방지', max_length=64, null=True, verbose_name='클라이언트 ID'),
+        ),
+        migrations.AddConstraint(
+            model_name='meditation',
+            constraint=models.UniqueConstraint(condition=models.Q(('client_id__isnull', False)), fields=('user', 'client_id'), name='meditation_user_client_uniq'),
+        ),
+        migrations.RunPython(split_sequence_per_user, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,10 @@
 # backend/bible_verses/models.py
 
-from django.db import models
+from django.db import models, transaction
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
 from django.conf import settings
+from django.utils import timezone
 
 
 # ============================================================
@@ -211,6 +214,33 @@ class ParallelGroup(models.Model):
         return self.name
 
 
+class SyncSequence(models.Model):
+    """단조 증가 변경 번호 (오프라인 동기화 커서용) — 이름별 카운터 한 행"""
+
+    name  = models.CharField(max_length=50, primary_key=True, verbose_name='시퀀스 이름')
+    value = models.BigIntegerField(default=0, verbose_name='현재 값')
+
+    class Meta:
+        verbose_name = '동기화 시퀀스'
+        verbose_name_plural = '동기화 시퀀스 목록'
+
+    def __str__(self):
+        return f'{self.name}={self.value}'
+
+    @classmethod
+    def next_value(cls, name):
+        """
+        다음 번호 발급. 반드시 트랜잭션 안에서 호출.
+        UPDATE 로 행 잠금을 잡아 커밋 순서 = 번호 순서가 되도록 보장
+        (먼저 번호를 받은 트랜잭션이 늦게 커밋되어 커서를 건너뛰는 일 방지).
+        잠금은 그 이름의 행에만 걸리므로 이름(예: 사용자별)이 다르면 서로 기다리지 않음.
+        """
+        if not cls.objects.filter(name=name).update(value=models.F('value') + 1):
+            cls.objects.get_or_create(name=name)
+            cls.objects.filter(name=name).update(value=models.F('value') + 1)
+        return cls.objects.values_list('value', flat=True).get(name=name)
+
+
 class Meditation(models.Model):
     """개인 묵상 노트"""
 
@@ -225,10 +255,207 @@ class Meditation(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # ── 오프라인 동기화 ──────────────────────────────────────
+    # 저장할 때마다 사용자별 SyncSequence 에서 새 번호를 받음 → 클라이언트는 커서 이후 변경만 조회
+    # (커서는 사용자별이므로 번호도 사용자 안에서만 단조 증가하면 됨 — 다른 사용자의 저장과 잠금 경합 없음)
+    change_seq = models.BigIntegerField(default=0, editable=False, verbose_name='변경 번호')
+    client_id  = models.CharField(max_length=64, null=True, blank=True, editable=False,
+                                  verbose_name='클라이언트 ID',
+                                  help_text='오프라인에서 만든 노트의 임시 ID — 같은 생성 요청 재전송 시 중복 방지')
+    is_deleted = models.BooleanField(default=False, verbose_name='삭제됨',
+                                     help_text='삭제 표식(tombstone) — 동기화 클라이언트에 삭제를 전달')
+    deleted_at = models.DateTimeField(null=True, blank=True, verbose_name='삭제 일시')
+
+    SEQUENCE_NAME = 'meditation'
+
     class Meta:
         ordering = ['-created_at']
         verbose_name = '묵상 노트'
         verbose_name_plural = '묵상 노트 목록'
+        indexes = [
+            models.Index(fields=['user', 'change_seq'], name='meditation_user_seq_idx'),
+            # 공유 피드 / 말씀별 공유 수 — 공유 묵상만 담는 부분 인덱스
+            models.Index(fields=['-id'], name='meditation_shared_idx',
+                         condition=models.Q(is_private=False, is_deleted=False)),
+            models.Index(fields=['saying', '-id'], name='meditation_saying_shared_idx',
+                         condition=models.Q(is_private=False, is_deleted=False)),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'client_id'], name='meditation_user_client_uniq',
+                                    condition=models.Q(client_id__isnull=False)),
+        ]
+
+    def __str__(self):
+        return f'{self.user.username} — {self.saying.reference}'
+
+    @classmethod
+    def sequence_name(cls, user_id):
+        return f'{cls.SEQUENCE_NAME}:{user_id}'
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 일일 집계(MeditationDay) 갱신 시 이전 날짜/삭제 상태가 필요
+        instance._loaded_day_state = instance.day_state
+        return instance
+
+    @property
+    def activity_date(self):
+        """달력 집계 기준 날짜 — 묵상 날짜가 없으면 작성일"""
+        if self.date:
+            return self.date
+        if self.created_at:
+            return timezone.localdate(self.created_at)
+        return None
+
+    @property
+    def day_state(self):
+        return (self.activity_date, self.is_deleted)
+
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            self.change_seq = SyncSequence.next_value(self.sequence_name(self.user_id))
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | {'change_seq', 'updated_at'}
+            super().save(*args, **kwargs)
+
+    def soft_delete(self):
+        """삭제 표식만 남김 (동기화 클라이언트가 삭제를 알 수 있도록)"""
+        self.is_deleted = True
+        self.deleted_at = timezone.now()
+        self.save(update_fields=['is_deleted', 'deleted_at'])
+
+
+class MeditationDay(models.Model):
+    """사용자별 일일 묵상 수 (달력 히트맵 / 연속 묵상일 계산용 집계)
+
+    Meditation 저장·삭제 시 signal 로 해당 날짜만 다시 센다.
+    묵상이 없는 날은 행을 두지 않는다.
+    """
+
+    user  = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE,
+                              related_name='meditation_days', verbose_name='사용자')
+    date  = models.DateField(verbose_name='날짜')
+    count = models.PositiveIntegerField(default=0, verbose_name='묵상 수')
+
+    class Meta:
+        ordering = ['-date']
+        unique_together = ('user', 'date')   # (user, date) 인덱스 겸용
+        verbose_name = '일일 묵상 집계'
+        verbose_name_plural = '일일 묵상 집계 목록'
 
     def __str__(self):
-        return f'{self.user.username} — {self.saying.reference}'
\ No newline at end of file
+        return f'{self.user_id} {self.date}: {self.count}'
+
+
+# ============================================================
+# Signal: 말씀 변경 시 구절 인덱스 무효화
+# ============================================================
+
+@receiver([post_save, post_delete], sender=JesusSaying)
+def invalidate_verse_index(sender, **kwargs):
+    """말씀 저장/삭제 후 구절 구간 인덱스 재구성 예약"""
+    from .verse_index import invalidate
+    transaction.on_commit(invalidate)
+
+
+# ============================================================
+# Signal: 말씀/그룹 변경 시 공관복음 비교 캐시 무효화
+# ============================================================
+
+@receiver(post_save, sender=JesusSaying)
+def invalidate_synoptic_for_saying(sender, instance, **kwargs):
+    """말씀 본문이 바뀌면 이 말씀이 속한 병행구절 그룹의 비교 결과 삭제"""
+    from .synoptic import invalidate_group
+    for group_id in instance.parallel_groups.values_list('id', flat=True):
+        invalidate_group(group_id)
+
+
+@receiver(m2m_changed, sender=ParallelGroup.sayings.through)
+def invalidate_synoptic_for_group(sender, instance, action, pk_set=None, reverse=False, **kwargs):
+    """그룹 구성(말씀 추가/제거)이 바뀌면 비교 결과 삭제"""
+    from .synoptic import invalidate_group
+    if not reverse:
+        # group.sayings.add/remove/clear — instance 가 그룹
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            invalidate_group(instance.pk)
+        return
+
+    # saying.parallel_groups.add/remove — pk_set 이 그룹 ID
+    if action in ('post_add', 'post_remove'):
+        group_ids = pk_set or []
+    elif action == 'pre_clear':
+        group_ids = list(instance.parallel_groups.values_list('id', flat=True))
+    else:
+        return
+    for group_id in group_ids:
+        invalidate_group(group_id)
+
+
+# ============================================================
+# Signal: 묵상 저장/삭제 시 일일 집계 갱신
+# ============================================================
+
+@receiver(post_save, sender=Meditation)
+def refresh_meditation_day_on_save(sender, instance, created, raw=False, **kwargs):
+    """날짜나 삭제 상태가 바뀐 경우에만 이전/현재 날짜를 다시 집계"""
+    if raw:
+        return
+    previous = getattr(instance, '_loaded_day_state', None)
+    current  = instance.day_state
+    instance._loaded_day_state = current
+    if not created and previous == current:
+        return
+
+    from .meditation_calendar import refresh_days
+    user_id = instance.user_id
+    days = {current[0], previous[0] if previous else None}
+    transaction.on_commit(lambda: refresh_days(user_id, days))
+
+
+@receiver(post_delete, sender=Meditation)
+def refresh_meditation_day_on_delete(sender, instance, **kwargs):
+    """하드 삭제(관리자 삭제 등) 시 해당 날짜 다시 집계"""
+    from .meditation_calendar import refresh_days
+    user_id = instance.user_id
+    days = {instance.activity_date}
+    transaction.on_commit(lambda: refresh_days(user_id, days))
+
+
+# ============================================================
+# Signal: 공유 묵상 타임라인 캐시 갱신
+# ============================================================
+
+@receiver(post_save, sender=Meditation)
+def update_shared_feed_on_save(sender, instance, raw=False, **kwargs):
+    """공유 묵상이면 타임라인에 추가, 비공개 전환/삭제 표식이면 제거"""
+    if raw:
+        return
+    from .meditation_feed import record
+    note_id, saying_id = instance.pk, instance.saying_id
+    shared = not instance.is_private and not instance.is_deleted
+    transaction.on_commit(lambda: record(note_id, saying_id, shared))
+
+
+@receiver(post_delete, sender=Meditation)
+def update_shared_feed_on_delete(sender, instance, **kwargs):
+    from .meditation_feed import record
+    note_id, saying_id = instance.pk, instance.saying_id
+    transaction.on_commit(lambda: record(note_id, saying_id, False))
+
+
+# ============================================================
+# Signal: 읽기 전용 콘텐츠 변경 시 오프라인 번들 stale 표식
+# ============================================================
+
+@receiver([post_save, post_delete], sender=BibleVerse)
+@receiver([post_save, post_delete], sender=Theme)
+@receiver([post_save, post_delete], sender=JesusSaying)
+@receiver([post_save, post_delete], sender=ParallelGroup)
+@receiver(m2m_changed, sender=JesusSaying.themes.through)
+@receiver(m2m_changed, sender=ParallelGroup.sayings.through)
+def mark_content_bundle_stale(sender, **kwargs):
+    """번들은 다음 manifest 요청 때 다시 빌드 (대량 적재 중 반복 빌드 방지)"""
+    from .bundle import mark_stale
+    transaction.on_commit(mark_stale)
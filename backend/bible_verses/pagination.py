@@ -0,0 +1,12 @@
+# backend/bible_verses/pagination.py
+
+from rest_framework.pagination import CursorPagination
+
+
+class SharedMeditationPagination(CursorPagination):
+    """공유 묵상 피드 — 최신순 커서 페이지네이션 (id 역순, OFFSET 없음)"""
+
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 50
+    ordering = '-id'
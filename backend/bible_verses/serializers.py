@@ -78,6 +78,7 @@ class JesusSayingDetailSerializer(serializers.ModelSerializer):
     reference        = serializers.CharField(read_only=True)
     parallels        = serializers.SerializerMethodField()
     related_sayings  = serializers.SerializerMethodField()
+    related_sermons  = serializers.SerializerMethodField()
 
     class Meta:
         model  = JesusSaying
@@ -94,7 +95,7 @@ class JesusSayingDetailSerializer(serializers.ModelSerializer):
             'themes', 'audience', 'audience_display',
             'occasion', 'season', 'season_display',
             # 연결 데이터
-            'parallels', 'related_sayings',
+            'parallels', 'related_sayings', 'related_sermons',
         ]
 
     def get_parallels(self, obj):
@@ -140,6 +141,25 @@ class JesusSayingDetailSerializer(serializers.ModelSerializer):
         ]
 
 
+    def get_related_sermons(self, obj):
+        """본문이 겹치는 설교 (SermonSayingLink 미리 계산, 최신순)"""
+        sermons = sorted(
+            (link.sermon for link in obj.sermon_links.all()),
+            key=lambda s: (s.sermon_date, s.id),
+            reverse=True,
+        )
+        return [
+            {
+                'id':              s.id,
+                'title':           s.title,
+                'preacher':        s.preacher,
+                'sermon_date':     s.sermon_date,
+                'bible_reference': s.bible_reference,
+            }
+            for s in sermons
+        ]
+
+
 # ── 슬라이드용 (홈 화면 3개) ─────────────────────────────────
 class JesusSayingSlideSerializer(serializers.ModelSerializer):
     """홈 슬라이드용 — 본문 + 배경 + 키워드만"""
@@ -210,7 +230,8 @@ class MeditationSerializer(serializers.ModelSerializer):
             'username', 'content', 'is_private',
             'date',                              # ← 추가
             'created_at', 'updated_at',
+            'change_seq',                        # 동기화 충돌 판단용 (base_seq)
         ]
         read_only_fields = ['id', 'username', 'saying_ref', 'saying_text',
-                            'created_at', 'updated_at']
+                            'created_at', 'updated_at', 'change_seq']
         # date는 read_only_fields에 넣지 않음 → 프론트에서 값 전송 가능
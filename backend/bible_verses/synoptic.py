@@ -0,0 +1,206 @@
+# backend/bible_verses/synoptic.py
+"""
+병행구절 공관복음 비교 (Synoptic word-level diff)
+
+병행구절 그룹에 속한 복음서 본문들을 토큰 단위로 정렬(alignment)해서
+어느 부분이 모든 복음서에 공통인지, 일부에만 있는지, 한 복음서에만 있는지 표시한다.
+
+[토큰화]
+- 한국어(ko, ko_new) : 음절 단위 (가-힣 한 글자 = 토큰), 숫자/라틴 문자는 단어 단위
+- 영어/독일어(en, de): 단어 단위 (대소문자 무시), 문장부호는 별도 토큰
+
+[정렬]
+- 기준 본문: 마가복음이 있으면 마가(마가 우선설), 없으면 MAT→LUK→JHN 순 첫 본문
+- 기준 본문과 나머지 각각을 difflib.SequenceMatcher 로 비교
+- 기준 토큰이 모든 본문과 일치 → common, 일부만 → partial, 없음 → unique
+- 기준 본문과 맞지 않는 토큰은 나머지 본문끼리도 비교 → 다른 본문과 일치하면 double
+  (기준 본문에는 없고 마태·누가에만 공통인 이중 전승 등), 아무 데도 없으면 unique
+
+[캐시]
+- 입력 본문들의 content hash 를 키로 결과 저장 (본문이 바뀌면 키도 바뀜)
+- 그룹별 포인터 키를 두어 말씀 저장 시 invalidate_group() 으로 즉시 삭제
+"""
+
+import hashlib
+import json
+import logging
+import re
+from difflib import SequenceMatcher
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+BOOK_ORDER = ['MAT', 'MRK', 'LUK', 'JHN']
+BASE_PREFERENCE = ['MRK', 'MAT', 'LUK', 'JHN']
+
+LANG_FIELDS = {
+    'ko':     'text_ko_krv',
+    'ko_new': 'text_ko_new',
+    'en':     'text_en',
+    'de':     'text_de',
+}
+
+CACHE_VERSION = 2
+CACHE_TIMEOUT = 60 * 60 * 24 * 30  # 30일 (본문 변경 시 키가 바뀌므로 길게)
+
+_KO_TOKEN  = re.compile(r'[가-힣]|[0-9A-Za-z]+|[^\s가-힣0-9A-Za-z]')
+_WORD_TOKEN = re.compile(r'\w+|[^\w\s]', re.UNICODE)
+
+
+# ── 토큰화 ────────────────────────────────────────────────────
+
+def tokenize(text, lang):
+    """
+    [(표시 문자열, 비교 키, 앞 공백 여부), ...]
+    표시 문자열을 공백 여부대로 이어 붙이면 원문 띄어쓰기가 복원된다.
+    """
+    pattern = _KO_TOKEN if lang.startswith('ko') else _WORD_TOKEN
+    tokens = []
+    last_end = 0
+    for m in pattern.finditer(text or ''):
+        token = m.group()
+        space = m.start() > last_end and bool(tokens)
+        key = token if lang.startswith('ko') else token.lower()
+        tokens.append((token, key, space))
+        last_end = m.end()
+    return tokens
+
+
+# ── 정렬 ──────────────────────────────────────────────────────
+
+def _spans(tokens, statuses):
+    """같은 상태의 연속 토큰을 하나의 구간으로 병합"""
+    spans = []
+    for (text, _, space), status in zip(tokens, statuses):
+        chunk = (' ' if space else '') + text
+        if spans and spans[-1]['status'] == status:
+            spans[-1]['text'] += chunk
+        else:
+            spans.append({'text': chunk, 'status': status})
+    return spans
+
+
+def compare(texts, lang):
+    """
+    texts: {book: 본문} (빈 본문 제외)
+    반환: { base, books: { book: { spans, similarity, opcodes } } }
+    """
+    books = [b for b in BOOK_ORDER if texts.get(b)]
+    if not books:
+        return {'base': None, 'lang': lang, 'books': {}}
+
+    base = next(b for b in BASE_PREFERENCE if b in books)
+    tokens = {b: tokenize(texts[b], lang) for b in books}
+    base_keys = [t[1] for t in tokens[base]]
+
+    others = [b for b in books if b != base]
+    base_hits = [0] * len(base_keys)
+    matches = {}   # book → {다른 본문 토큰 인덱스: 기준 토큰 인덱스}
+    result = {}
+
+    for book in others:
+        keys = [t[1] for t in tokens[book]]
+        matcher = SequenceMatcher(None, base_keys, keys, autojunk=False)
+        mapping = {}
+        for block in matcher.get_matching_blocks():
+            for k in range(block.size):
+                mapping[block.b + k] = block.a + k
+                base_hits[block.a + k] += 1
+        matches[book] = mapping
+        result[book] = {
+            'similarity': round(matcher.ratio(), 3),
+            'opcodes':    [list(op) for op in matcher.get_opcodes()],
+        }
+
+    def base_status(i):
+        if not others or base_hits[i] == 0:
+            return 'unique'
+        return 'common' if base_hits[i] == len(others) else 'partial'
+
+    base_statuses = [base_status(i) for i in range(len(base_keys))]
+    result[base] = {'similarity': 1.0, 'opcodes': []}
+    result[base]['spans'] = _spans(tokens[base], base_statuses)
+
+    # 기준 본문 없이 다른 본문끼리만 일치하는 토큰 (이중 전승)
+    shared = {book: set() for book in others}
+    for i, book in enumerate(others):
+        keys = [t[1] for t in tokens[book]]
+        for other in others[i + 1:]:
+            other_keys = [t[1] for t in tokens[other]]
+            matcher = SequenceMatcher(None, keys, other_keys, autojunk=False)
+            for block in matcher.get_matching_blocks():
+                for k in range(block.size):
+                    shared[book].add(block.a + k)
+                    shared[other].add(block.b + k)
+
+    for book in others:
+        mapping = matches[book]
+        statuses = []
+        for j in range(len(tokens[book])):
+            if j in mapping:
+                statuses.append(base_statuses[mapping[j]])
+            else:
+                statuses.append('double' if j in shared[book] else 'unique')
+        result[book]['spans'] = _spans(tokens[book], statuses)
+
+    return {
+        'base':  base,
+        'lang':  lang,
+        'books': {b: result[b] for b in books},
+    }
+
+
+# ── 캐시 ──────────────────────────────────────────────────────
+
+def _group_pointer_key(group_id, lang):
+    return f'synoptic:v{CACHE_VERSION}:group:{group_id}:{lang}'
+
+
+def content_hash(texts, lang):
+    payload = json.dumps([lang, sorted(texts.items())], ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def group_texts(group, lang):
+    """그룹의 활성 말씀 본문 {book: text} — 복음서당 첫 말씀만 사용"""
+    field = LANG_FIELDS[lang]
+    texts = {}
+    for saying in group.sayings.all():
+        if saying.is_active and saying.book not in texts:
+            texts[saying.book] = getattr(saying, field) or ''
+    return {b: t for b, t in texts.items() if t}
+
+
+def get_synoptic(group, lang='ko'):
+    """캐시 조회 → 없으면 계산 후 저장"""
+    texts = group_texts(group, lang)
+    digest = content_hash(texts, lang)
+    key = f'synoptic:v{CACHE_VERSION}:{digest}'
+
+    try:
+        cached = cache.get(key)
+    except Exception as e:
+        logger.warning(f"synoptic cache read failed: {e}")
+        cached = None
+    if cached is not None:
+        return cached
+
+    data = compare(texts, lang)
+    data['group_id'] = group.id
+    data['hash'] = digest
+    try:
+        cache.set_many({key: data, _group_pointer_key(group.id, lang): key}, CACHE_TIMEOUT)
+    except Exception as e:
+        logger.warning(f"synoptic cache write failed: {e}")
+    return data
+
+
+def invalidate_group(group_id):
+    """그룹의 모든 언어 비교 결과 삭제 (말씀 본문/구성 변경 시)"""
+    pointer_keys = [_group_pointer_key(group_id, lang) for lang in LANG_FIELDS]
+    try:
+        pointers = cache.get_many(pointer_keys)
+        cache.delete_many(list(pointers.values()) + pointer_keys)
+    except Exception as e:
+        logger.warning(f"synoptic cache invalidation failed: {e}")
@@ -0,0 +1,184 @@
+# backend/bible_verses/verse_index.py
+"""
+말씀 구절 구간 인덱스 (Verse-coverage interval index)
+
+복음서별로 (chapter, verse_start, verse_end) 구간을 장 단위 정렬 배열로 보관하고
+이진 탐색(bisect)으로 다음 질의에 답한다.
+- "요한복음 14:6을 포함하는 말씀은?"        → VerseIndex.lookup()
+- "이 구간과 겹치는 말씀은?"                 → VerseIndex.overlapping()
+- "누가복음 15장의 절 단위 커버리지 지도"      → VerseIndex.coverage()
+
+[구조]
+장마다 시작 절 오름차순으로 정렬된 배열(starts / ends / ids)과
+끝 절의 누적 최댓값(max_end)을 유지한다.
+bisect로 시작 절 ≤ 질의 끝 절인 마지막 위치를 찾은 뒤 뒤로 훑으면서
+max_end < 질의 시작 절이 되는 순간 중단 → 겹치지 않는 구간은 보지 않는다.
+
+[무효화]
+- 프로세스 로컬 캐시 + Redis 버전 키 (gunicorn/daphne 워커 간 동기화)
+- JesusSaying 저장/삭제 시 invalidate() → 버전 증가 → 다음 조회 때 재구성
+- Redis 장애 시에는 로컬 캐시만 사용 (조회는 계속 동작)
+"""
+
+import base64
+import logging
+import threading
+from bisect import bisect_right
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = 'sayings:verse_index:version'
+
+_lock = threading.Lock()
+_index = None
+_index_version = None
+
+
+class ChapterIntervals:
+    """한 장(chapter)의 말씀 구간 배열"""
+
+    __slots__ = ('starts', 'ends', 'max_end', 'ids', 'bitmap', 'max_verse')
+
+    def __init__(self, rows):
+        # rows: [(verse_start, verse_end, saying_id), ...]
+        rows = sorted(rows)
+        self.starts  = [r[0] for r in rows]
+        self.ends    = [r[1] for r in rows]
+        self.ids     = [r[2] for r in rows]
+        self.max_end = []
+
+        running = 0
+        bitmap  = 0
+        for start, end, _ in rows:
+            running = max(running, end)
+            self.max_end.append(running)
+            # start~end 절 비트 세팅 (bit 0 = 1절)
+            bitmap |= ((1 << (end - start + 1)) - 1) << (start - 1)
+
+        self.bitmap    = bitmap
+        self.max_verse = running
+
+    def overlapping(self, start, end):
+        """[start, end] 와 겹치는 말씀 ID (시작 절 순)"""
+        i = bisect_right(self.starts, end)
+        result = []
+        while i > 0:
+            i -= 1
+            if self.max_end[i] < start:
+                break
+            if self.ends[i] >= start:
+                result.append(self.ids[i])
+        result.reverse()
+        return result
+
+    @property
+    def saying_count(self):
+        return len(self.ids)
+
+    @property
+    def covered_verses(self):
+        return bin(self.bitmap).count('1')
+
+    def encode_bitmap(self):
+        """LSB 우선 바이트열 → base64 (bit i = i+1절)"""
+        length = (self.max_verse + 7) // 8
+        return base64.b64encode(self.bitmap.to_bytes(length, 'little')).decode('ascii')
+
+
+class VerseIndex:
+    """복음서별 구간 인덱스 묶음 — {book: {chapter: ChapterIntervals}}"""
+
+    def __init__(self, rows):
+        # rows: [(id, book, chapter, verse_start, verse_end), ...]
+        grouped = {}
+        for saying_id, book, chapter, verse_start, verse_end in rows:
+            if not verse_start:
+                continue
+            verse_end = max(verse_end or verse_start, verse_start)
+            grouped.setdefault(book, {}).setdefault(chapter, []).append(
+                (verse_start, verse_end, saying_id)
+            )
+
+        self.books = {
+            book: {chapter: ChapterIntervals(items) for chapter, items in chapters.items()}
+            for book, chapters in grouped.items()
+        }
+
+    @classmethod
+    def build(cls):
+        from .models import JesusSaying
+        rows = (
+            JesusSaying.objects
+            .filter(is_active=True)
+            .values_list('id', 'book', 'chapter', 'verse_start', 'verse_end')
+        )
+        return cls(list(rows))
+
+    def lookup(self, book, chapter, verse):
+        """해당 절을 포함하는 말씀 ID 목록"""
+        return self.overlapping(book, chapter, verse, verse)
+
+    def overlapping(self, book, chapter, verse_start, verse_end):
+        """해당 구간과 겹치는 말씀 ID 목록"""
+        intervals = self.books.get(book, {}).get(chapter)
+        if intervals is None:
+            return []
+        return intervals.overlapping(verse_start, max(verse_end, verse_start))
+
+    def chapter_counts(self, book):
+        """{장: 말씀 수} — chapter-summary 응답과 동일한 구조"""
+        chapters = self.books.get(book, {})
+        return {str(ch): chapters[ch].saying_count for ch in sorted(chapters)}
+
+    def coverage(self, book):
+        """장별 절 커버리지 비트맵"""
+        chapters = self.books.get(book, {})
+        return {
+            str(ch): {
+                'bitmap':    chapters[ch].encode_bitmap(),
+                'max_verse': chapters[ch].max_verse,
+                'verses':    chapters[ch].covered_verses,
+                'sayings':   chapters[ch].saying_count,
+            }
+            for ch in sorted(chapters)
+        }
+
+
+# ── 캐시 / 무효화 ─────────────────────────────────────────────
+
+def _current_version():
+    try:
+        return cache.get(VERSION_KEY, 0)
+    except Exception as e:
+        logger.warning(f"verse index version read failed: {e}")
+        return None
+
+
+def get_verse_index():
+    """현재 프로세스의 인덱스 반환 (버전이 바뀌었으면 재구성)"""
+    global _index, _index_version
+
+    version = _current_version()
+    index = _index
+    if index is not None and (version is None or version == _index_version):
+        return index
+
+    with _lock:
+        if _index is None or (version is not None and version != _index_version):
+            _index = VerseIndex.build()
+            _index_version = version
+        return _index
+
+
+def invalidate():
+    """말씀 변경 시 호출 — 로컬 캐시 제거 + 워커 공용 버전 증가"""
+    global _index
+    _index = None
+    try:
+        if cache.add(VERSION_KEY, 1, timeout=None):
+            return
+        cache.incr(VERSION_KEY)
+    except Exception as e:
+        logger.warning(f"verse index invalidation failed: {e}")
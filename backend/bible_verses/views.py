@@ -7,8 +7,12 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
 from django.utils import timezone
 from datetime import date
+import gzip
 import random
 
+from django.http import HttpResponse
+from django.urls import reverse
+
 from .models import BibleVerse, Theme, JesusSaying, ParallelGroup, Meditation
 from .serializers import (
     BibleVerseSerializer,
@@ -19,6 +23,13 @@ from .serializers import (
     ParallelGroupSerializer,
     MeditationSerializer,
 )
+from .verse_index import get_verse_index
+from .synoptic import LANG_FIELDS, get_synoptic
+from . import meditation_sync
+from . import meditation_calendar
+from . import meditation_feed
+from . import bundle
+from .pagination import SharedMeditationPagination
 
 
 # ============================================================
@@ -105,6 +116,10 @@ class JesusSayingViewSet(viewsets.ReadOnlyModelViewSet):
     GET /api/sayings/{id}/               — 상세 (병행구절·관련말씀 포함)
     GET /api/sayings/slide/              — 홈 슬라이드용 오늘의 3개 말씀
     GET /api/sayings/books/              — 복음서별 말씀 수 통계
+    GET /api/sayings/ref/{book}/{ch}/{v}/ — 해당 절을 포함하는 말씀
+    GET /api/sayings/coverage/?book=LUK  — 장별 절 커버리지 비트맵
+    GET /api/sayings/bundle/manifest/    — 오프라인 번들 버전(content hash)
+    GET /api/sayings/bundle/{version}/   — 오프라인 번들 (gzip JSON, 불변 캐시)
     """
     queryset           = JesusSaying.objects.filter(is_active=True).prefetch_related('themes')
     permission_classes = [AllowAny]
@@ -127,6 +142,13 @@ class JesusSayingViewSet(viewsets.ReadOnlyModelViewSet):
     ordering_fields  = ['book', 'chapter', 'verse_start', 'slide_order']
     ordering         = ['book', 'chapter', 'verse_start']
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'retrieve':
+            # 관련 설교는 미리 계산된 연결 테이블에서 한 번에 로드
+            queryset = queryset.prefetch_related('sermon_links__sermon')
+        return queryset
+
     def get_serializer_class(self):
         if self.action == 'retrieve':
             return JesusSayingDetailSerializer
@@ -217,38 +239,132 @@ class JesusSayingViewSet(viewsets.ReadOnlyModelViewSet):
     def chapter_summary(self, request):
         """
         특정 복음서의 '장별 말씀 수'를 페이지네이션 없이 한 번에 반환.
-        BibleExplorer 장 마킹용.
+        BibleExplorer 장 마킹용. 구절 인덱스에서 바로 계산 (GROUP BY 없음).
  
         GET /api/sayings/chapter-summary/?book=JHN
         → { "1": 2, "3": 3, "14": 4, ... }
         """
-        from django.db.models import Count
- 
         book = request.query_params.get('book')
         if not book:
             return Response({'detail': 'book 파라미터가 필요합니다.'}, status=400)
  
-        stats = (
-            JesusSaying.objects
-            .filter(is_active=True, book=book)
-            .values('chapter')
-            .annotate(count=Count('id'))
-            .order_by('chapter')
-        )
         # { "1": 2, "3": 3, ... } 형태로 반환 — 프론트 chSummary와 동일한 구조
-        result = {str(s['chapter']): s['count'] for s in stats}
-        return Response(result)
+        return Response(get_verse_index().chapter_counts(book))
+
+    # ── 구절 참조로 말씀 찾기 ─────────────────────────────────
+    @action(detail=False, methods=['get'],
+            url_path=r'ref/(?P<book>[A-Za-z]{3})/(?P<chapter>[0-9]+)/(?P<verse>[0-9]+)')
+    def ref(self, request, book=None, chapter=None, verse=None):
+        """
+        해당 절을 포함하는 말씀 목록.
+
+        GET /api/sayings/ref/JHN/14/6/
+        → [ { id, reference: "요한복음 14:1–7", ... }, ... ]
+        """
+        book = book.upper()
+        if book not in dict(JesusSaying.BOOK_CHOICES):
+            return Response({'detail': f'알 수 없는 복음서입니다: {book}'}, status=400)
+
+        ids = get_verse_index().lookup(book, int(chapter), int(verse))
+        if not ids:
+            return Response([])
+
+        saying_map = JesusSaying.objects.prefetch_related('themes').in_bulk(ids)
+        sayings    = [saying_map[i] for i in ids if i in saying_map]
+        serializer = JesusSayingListSerializer(sayings, many=True)
+        return Response(serializer.data)
+
+    # ── 장별 절 커버리지 비트맵 ───────────────────────────────
+    @action(detail=False, methods=['get'], url_path='coverage')
+    def coverage(self, request):
+        """
+        특정 복음서의 장별 절 커버리지를 비트맵으로 반환. BibleExplorer 절 마킹용.
+        bitmap: base64, LSB 우선 (첫 바이트의 bit 0 = 1절)
+
+        GET /api/sayings/coverage/?book=LUK
+        → { "book": "LUK",
+            "chapters": { "15": { "bitmap": "/v8P", "max_verse": 32,
+                                  "verses": 28, "sayings": 3 }, ... } }
+        """
+        book = request.query_params.get('book', '').upper()
+        if not book:
+            return Response({'detail': 'book 파라미터가 필요합니다.'}, status=400)
+        if book not in dict(JesusSaying.BOOK_CHOICES):
+            return Response({'detail': f'알 수 없는 복음서입니다: {book}'}, status=400)
+
+        return Response({
+            'book':     book,
+            'chapters': get_verse_index().coverage(book),
+        })
+
+    # ── 오프라인 번들 ────────────────────────────────────────────
+    @action(detail=False, methods=['get'], url_path='bundle/manifest')
+    def bundle_manifest(self, request):
+        """
+        클라이언트는 이 응답의 version 만 주기적으로 확인하고,
+        바뀌었을 때만 /bundle/{version}/ 을 내려받는다.
+        """
+        manifest = bundle.get_manifest()
+        etag = f'"{manifest["version"]}"'
+        if request.headers.get('If-None-Match') == etag:
+            response = HttpResponse(status=304)
+        else:
+            response = Response({
+                **manifest,
+                'url': reverse('saying-bundle-file', kwargs={'version': manifest['version']}),
+            })
+        response['ETag'] = etag
+        response['Cache-Control'] = 'no-cache'
+        return response
+
+    @action(detail=False, methods=['get'], url_path=r'bundle/(?P<version>[0-9a-f]{16})')
+    def bundle_file(self, request, version=None):
+        path = bundle.bundle_path(version)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return Response({'detail': '번들 버전이 없습니다. manifest 를 다시 조회하세요.'},
+                            status=status.HTTP_404_NOT_FOUND)
+
+        if 'gzip' in request.headers.get('Accept-Encoding', ''):
+            response = HttpResponse(data, content_type='application/json')
+            response['Content-Encoding'] = 'gzip'
+        else:
+            response = HttpResponse(gzip.decompress(data), content_type='application/json')
+        # 버전(content hash)이 URL 에 있으므로 내용이 바뀌지 않음
+        response['Cache-Control'] = 'public, max-age=31536000, immutable'
+        response['ETag'] = f'"{version}"'
+        response['Vary'] = 'Accept-Encoding'
+        return response
  
 
 class ParallelGroupViewSet(viewsets.ReadOnlyModelViewSet):
     """병행구절 그룹 API
     GET /api/sayings/parallels/           — 전체 그룹 목록 (이름만)
     GET /api/sayings/parallels/{id}/      — 그룹 상세 (4복음서 나란히)
+    GET /api/sayings/parallels/{id}/synoptic/?lang=ko — 복음서 간 단어/음절 단위 비교
     """
     queryset           = ParallelGroup.objects.prefetch_related('sayings').all()
     serializer_class   = ParallelGroupSerializer
     permission_classes = [AllowAny]
 
+    @action(detail=True, methods=['get'])
+    def synoptic(self, request, pk=None):
+        """
+        공관복음 비교. lang: ko(개역개정, 기본) / ko_new / en / de
+        spans[].status: common(모든 본문 공통) / partial(기준 본문과 일부 본문에 공통)
+                        / double(기준 본문에는 없고 다른 본문끼리 공통 — 마태·누가 이중 전승 등)
+                        / unique(이 본문만)
+        """
+        lang = request.query_params.get('lang', 'ko')
+        if lang not in LANG_FIELDS:
+            return Response(
+                {'detail': f"lang 은 {', '.join(LANG_FIELDS)} 중 하나여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        group = self.get_object()
+        return Response(get_synoptic(group, lang))
+
 
 class MeditationViewSet(viewsets.ModelViewSet):
     """개인 묵상 노트 API — 로그인 필요
@@ -256,18 +372,113 @@ class MeditationViewSet(viewsets.ModelViewSet):
     POST   /api/sayings/meditations/      — 묵상 작성
     GET    /api/sayings/meditations/{id}/ — 묵상 상세
     PUT    /api/sayings/meditations/{id}/ — 묵상 수정
-    DELETE /api/sayings/meditations/{id}/ — 묵상 삭제
+    DELETE /api/sayings/meditations/{id}/ — 묵상 삭제 (삭제 표식만 남김)
+    GET    /api/sayings/meditations/sync/?cursor= — 커서 이후 변경분 (오프라인 동기화)
+    POST   /api/sayings/meditations/sync/ — 변경 일괄 업로드 (항목별 충돌 처리)
+    GET    /api/sayings/meditations/calendar/?year= — 날짜별 묵상 수 (히트맵)
+    GET    /api/sayings/meditations/streak/ — 연속 묵상일
+    GET    /api/sayings/meditations/shared/?saying= — 공유 묵상 피드 (커서 페이지네이션)
+    GET    /api/sayings/meditations/shared/counts/?ids= — 말씀별 공유 묵상 수
     """
     serializer_class   = MeditationSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        # 본인 묵상만 반환
-        return Meditation.objects.filter(user=self.request.user).select_related('saying')
+        # 본인 묵상만 반환 (삭제 표식 제외)
+        return (
+            Meditation.objects
+            .filter(user=self.request.user, is_deleted=False)
+            .select_related('saying', 'user')
+        )
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
+    def perform_destroy(self, instance):
+        # 오프라인 클라이언트가 삭제를 알 수 있도록 tombstone 유지
+        instance.soft_delete()
+
+    # 오프라인 동기화
+    @action(detail=False, methods=['get', 'post'], url_path='sync')
+    def sync(self, request):
+        if request.method == 'GET':
+            try:
+                limit = int(request.query_params.get('limit', meditation_sync.MAX_PULL))
+                data  = meditation_sync.changes_since(
+                    request.user, request.query_params.get('cursor'), limit
+                )
+            except (ValueError, meditation_sync.InvalidCursor):
+                return Response({'detail': '잘못된 cursor 또는 limit 입니다.'},
+                                status=status.HTTP_400_BAD_REQUEST)
+            return Response(data)
+
+        items = request.data.get('changes')
+        if not isinstance(items, list):
+            return Response({'detail': 'changes 배열이 필요합니다.'},
+                            status=status.HTTP_400_BAD_REQUEST)
+        if len(items) > meditation_sync.MAX_PUSH:
+            return Response({'detail': f'한 번에 최대 {meditation_sync.MAX_PUSH}건까지 업로드할 수 있습니다.'},
+                            status=status.HTTP_400_BAD_REQUEST)
+        return Response({'results': meditation_sync.apply_changes(request.user, items)})
+
+    # 묵상 달력 (일일 집계 테이블에서 조회)
+    @action(detail=False, methods=['get'], url_path='calendar')
+    def calendar(self, request):
+        try:
+            year = int(request.query_params.get('year', timezone.localdate().year))
+        except ValueError:
+            return Response({'detail': 'year 는 숫자여야 합니다.'},
+                            status=status.HTTP_400_BAD_REQUEST)
+        if not 1900 <= year <= 9999:
+            return Response({'detail': '잘못된 year 입니다.'},
+                            status=status.HTTP_400_BAD_REQUEST)
+        return Response(meditation_calendar.calendar(request.user, year))
+
+    # 연속 묵상일
+    @action(detail=False, methods=['get'], url_path='streak')
+    def streak(self, request):
+        return Response(meditation_calendar.streak(request.user))
+
+    # 공유 묵상 피드 (전체 / 말씀별)
+    @action(detail=False, methods=['get'], url_path='shared')
+    def shared(self, request):
+        saying_id = request.query_params.get('saying')
+        if saying_id and not saying_id.isdigit():
+            return Response({'detail': 'saying 은 숫자여야 합니다.'},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        paginator = SharedMeditationPagination()
+        qs = meditation_feed.shared_queryset(saying_id)
+        # 최근 구간은 Redis 타임라인의 ID 로 PK 조회, 그 밖은 부분 인덱스로 DB 조회
+        page   = None
+        window = meditation_feed.window_ids(paginator, request, saying_id)
+        if window is not None:
+            ids, exhaustive = window
+            page = paginator.paginate_queryset(qs.filter(id__in=ids), request, view=self)
+            if not paginator.has_next and not exhaustive:
+                # 창 안의 유효한 묵상이 다음 페이지 표식까지 차지 않음 → 남은 삭제/비공개 ID 정리 후 DB 로
+                meditation_feed.prune(saying_id, set(ids) - {note.id for note in page})
+                page = None
+
+        if page is None:
+            page = paginator.paginate_queryset(qs, request, view=self)
+        serializer = self.get_serializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
+
+    # 말씀별 공유 묵상 수
+    @action(detail=False, methods=['get'], url_path='shared/counts')
+    def shared_counts(self, request):
+        raw = request.query_params.get('ids')
+        saying_ids = None
+        if raw:
+            try:
+                saying_ids = [int(i) for i in raw.split(',') if i][:200]
+            except ValueError:
+                return Response({'detail': 'ids 는 쉼표로 구분한 숫자여야 합니다.'},
+                                status=status.HTTP_400_BAD_REQUEST)
+        counts = meditation_feed.shared_counts(saying_ids)
+        return Response({str(k): v for k, v in counts.items()})
+
     # 특정 말씀에 달린 내 묵상 조회
     @action(detail=False, methods=['get'], url_path='by-saying/(?P<saying_id>[0-9]+)')
     def by_saying(self, request, saying_id=None):
@@ -0,0 +1,94 @@
+# backend/board/consumers.py
+"""
+BoardConsumer — 게시판 실시간 갱신 (ws/board/)
+
+연결하면 목록 그룹(board_updates)에 들어가고,
+상세 화면은 subscribe_post / unsubscribe_post 로 게시글 그룹에 들어간다.
+조회는 로그인 없이도 가능하므로 익명 연결도 허용 (읽기 전용).
+
+클라이언트 → 서버
+    { "type": "subscribe_post",   "post_id": 12 }
+    { "type": "unsubscribe_post", "post_id": 12 }
+    { "type": "ping" }
+서버 → 클라이언트
+    { "type": "board.events", "events": [ ... ] }   (board/events.py)
+    { "type": "subscribed", "post_id": 12 } / { "type": "pong" } / { "type": "error", ... }
+"""
+import json
+import logging
+
+from channels.generic.websocket import AsyncWebsocketConsumer
+
+from .events import BOARD_GROUP, post_group
+
+logger = logging.getLogger(__name__)
+
+MAX_POST_SUBSCRIPTIONS = 5
+
+
+class BoardConsumer(AsyncWebsocketConsumer):
+
+    async def connect(self):
+        self.post_ids = set()
+        await self.channel_layer.group_add(BOARD_GROUP, self.channel_name)
+        await self.accept()
+
+    async def disconnect(self, close_code):
+        try:
+            await self.channel_layer.group_discard(BOARD_GROUP, self.channel_name)
+            for post_id in self.post_ids:
+                await self.channel_layer.group_discard(post_group(post_id), self.channel_name)
+        except Exception as e:
+            logger.warning(f"board ws disconnect error: {e}")
+
+    async def receive(self, text_data=None, bytes_data=None):
+        try:
+            data = json.loads(text_data or '')
+        except ValueError:
+            await self.send_error('잘못된 메시지 형식입니다.')
+            return
+        if not isinstance(data, dict):
+            await self.send_error('잘못된 메시지 형식입니다.')
+            return
+
+        message_type = data.get('type')
+        if message_type == 'ping':
+            await self.send(text_data='{"type":"pong"}')
+        elif message_type in ('subscribe_post', 'unsubscribe_post'):
+            try:
+                post_id = int(data.get('post_id'))
+            except (TypeError, ValueError):
+                await self.send_error('post_id 가 필요합니다.')
+                return
+            if message_type == 'subscribe_post':
+                await self.subscribe_post(post_id)
+            else:
+                await self.unsubscribe_post(post_id)
+        else:
+            await self.send_error(f'알 수 없는 메시지: {message_type}')
+
+    # ── 게시글 구독 ───────────────────────────────────────────
+
+    async def subscribe_post(self, post_id):
+        if post_id not in self.post_ids:
+            if len(self.post_ids) >= MAX_POST_SUBSCRIPTIONS:
+                await self.send_error('구독할 수 있는 게시글 수를 넘었습니다.')
+                return
+            await self.channel_layer.group_add(post_group(post_id), self.channel_name)
+            self.post_ids.add(post_id)
+        await self.send(text_data=json.dumps({'type': 'subscribed', 'post_id': post_id}))
+
+    async def unsubscribe_post(self, post_id):
+        if post_id in self.post_ids:
+            await self.channel_layer.group_discard(post_group(post_id), self.channel_name)
+            self.post_ids.discard(post_id)
+        await self.send(text_data=json.dumps({'type': 'unsubscribed', 'post_id': post_id}))
+
+    async def send_error(self, message):
+        await self.send(text_data=json.dumps({'type': 'error', 'message': message}, ensure_ascii=False))
+
+    # ── 그룹 메시지 핸들러 ────────────────────────────────────
+
+    async def board_events(self, event):
+        # events.flush() 에서 이미 JSON 으로 만든 본문 → 그대로 전달
+        await self.send(text_data=event['text'])
@@ -0,0 +1,176 @@
+# backend/board/events.py
+"""
+게시판 실시간 이벤트 (WebSocket — board/consumers.py)
+
+클라이언트가 목록/댓글을 주기적으로 다시 받는 대신
+저장/삭제 signal 에서 작은 이벤트를 만들어 channel layer 로 보낸다.
+
+[그룹]
+- board_updates      : 게시판 목록 화면 (post.created / post.updated / post.deleted / post.counts)
+- board_post_<id>    : 게시글 상세 화면 (해당 글의 post.* + comment.*)
+
+[묶음 전송 (coalescing)]
+이벤트는 커밋 후 프로세스 내 버퍼에 쌓이고 FLUSH_DELAY 뒤 그룹마다
+group_send 1회로 보낸다. 같은 대상 (그룹, 종류, ID) 의 이벤트는 하나로 합침:
+- created → updated      = created (최신 내용)
+- created → deleted      = 보내지 않음
+- 그 외                  = 마지막 이벤트
+댓글 수는 댓글 이벤트마다 보내지 않고 flush 때 영향받은 게시글의
+comment_count 를 한 번에 읽어 post.counts 1건으로 보낸다.
+
+메시지 JSON 은 flush 때 한 번만 만들고 consumer 는 그대로 전달만 한다.
+"""
+
+import json
+import logging
+import threading
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+BOARD_GROUP = 'board_updates'
+FLUSH_DELAY = 0.25          # 초 — 이 시간 안의 연속 변경은 한 번에 전송
+
+_lock    = threading.Lock()
+_pending = {}               # (그룹, 종류, ID) → 이벤트 (삽입 순서 유지)
+_counts  = set()            # comment_count 를 보낼 게시글 ID
+_timer   = None
+
+
+def post_group(post_id):
+    return f'board_post_{post_id}'
+
+
+# ── 이벤트 본문 ───────────────────────────────────────────────
+
+def post_payload(post):
+    return {
+        'id':            post.pk,
+        'title':         post.title,
+        'author':        post.author,
+        'comment_count': post.comment_count,
+        'view_count':    post.view_count,
+        'has_image':     bool(post.image),
+        'created_at':    post.created_at,
+        'updated_at':    post.updated_at,
+    }
+
+
+def comment_payload(comment):
+    return {
+        'id':         comment.pk,
+        'post':       comment.post_id,
+        'parent':     comment.parent_id,
+        'author':     comment.author,
+        'content':    comment.content,
+        'created_at': comment.created_at,
+        'updated_at': comment.updated_at,
+    }
+
+
+# ── 버퍼 ──────────────────────────────────────────────────────
+
+def _merge(key, event):
+    previous = _pending.get(key)
+    if previous is not None and previous['type'].endswith('.created'):
+        if event['type'].endswith('.deleted'):
+            del _pending[key]          # 아무도 보지 못한 항목 → 생성/삭제 모두 생략
+            return
+        if event['type'].endswith('.updated'):
+            event = {**event, 'type': previous['type']}
+    _pending[key] = event
+
+
+def _schedule():
+    global _timer
+    if _timer is None:
+        _timer = threading.Timer(FLUSH_DELAY, flush)
+        _timer.daemon = True
+        _timer.start()
+
+
+def publish_post(action, post_id, data=None):
+    """action: created / updated / deleted"""
+    event = {'type': f'post.{action}', 'id': post_id}
+    if data is not None:
+        event['data'] = data
+    with _lock:
+        _merge((BOARD_GROUP, 'post', post_id), event)
+        if action != 'created':        # 새 글은 상세 화면을 보는 사람이 없음
+            _merge((post_group(post_id), 'post', post_id), event)
+        _schedule()
+
+
+def publish_comment(action, post_id, comment_id, data=None):
+    event = {'type': f'comment.{action}', 'id': comment_id, 'post': post_id}
+    if data is not None:
+        event['data'] = data
+    with _lock:
+        _merge((post_group(post_id), 'comment', comment_id), event)
+        if action != 'updated':
+            _counts.add(post_id)
+        _schedule()
+
+
+# ── 전송 ──────────────────────────────────────────────────────
+
+def _comment_counts(post_ids):
+    from .models import Post
+    try:
+        return dict(Post.objects.filter(pk__in=post_ids).values_list('id', 'comment_count'))
+    except Exception as e:
+        logger.warning(f"board event comment counts failed: {e}")
+        return {}
+    finally:
+        if threading.current_thread() is not threading.main_thread():
+            connection.close()   # 타이머 스레드의 DB 연결 정리
+
+
+def _encode(events):
+    return json.dumps({'type': 'board.events', 'events': events},
+                      cls=DjangoJSONEncoder, ensure_ascii=False, separators=(',', ':'))
+
+
+def flush():
+    """버퍼의 이벤트를 그룹별 메시지 1건씩 전송 (타이머 스레드에서 호출)"""
+    global _pending, _counts, _timer
+    with _lock:
+        pending, counts = _pending, _counts
+        _pending, _counts, _timer = {}, set(), None
+    if not pending and not counts:
+        return
+
+    by_group = {}
+    for (group, _, _), event in pending.items():
+        by_group.setdefault(group, []).append(event)
+
+    if counts:
+        values = _comment_counts(counts)
+        if values:
+            by_group.setdefault(BOARD_GROUP, []).append({
+                'type':   'post.counts',
+                'counts': {str(pk): n for pk, n in values.items()},
+            })
+            for pk, n in values.items():
+                if post_group(pk) in by_group:
+                    by_group[post_group(pk)].append({'type': 'post.counts', 'counts': {str(pk): n}})
+
+    messages = [(group, {'type': 'board.events', 'text': _encode(events)})
+                for group, events in by_group.items()]
+
+    layer = get_channel_layer()
+    if layer is None:
+        return
+
+    async def send_all():
+        for group, message in messages:
+            await layer.group_send(group, message)
+
+    try:
+        async_to_sync(send_all)()
+    except Exception as e:
+        logger.warning(f"board event send failed: {e}")
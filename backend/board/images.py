@@ -0,0 +1,182 @@
+# backend/board/images.py
+"""
+게시글 대표 이미지 반응형 변환 (responsive variants)
+
+원본(휴대폰 사진 12MP 등)을 그대로 목록 썸네일로 내려받지 않도록
+여러 너비의 WebP / JPEG 파일을 원본 옆에 만든다.
+
+    posts/images/post_ab12cd34.jpg          ← 원본
+    posts/images/post_ab12cd34.w320.webp
+    posts/images/post_ab12cd34.w320.jpg
+    posts/images/post_ab12cd34.w640.webp   ...
+
+[디코딩]
+- 픽셀 수 상한(MAX_PIXELS) 초과 시 디코딩 전에 거부 (decompression bomb)
+- JPEG 는 draft 모드로 필요한 크기에 가장 가까운 1/2·1/4·1/8 배율로 바로 디코딩
+- EXIF 회전 적용 후 저장 시 EXIF 는 싣지 않음 (위치 정보 등 제거)
+
+[실행]
+- 요청 처리 중에는 하지 않음: Post 저장 signal → 커밋 후 schedule() → 스레드 풀
+- 기존 이미지 일괄 처리: build_post_image_variants 명령 (프로세스 풀)
+
+결과는 Post.image_variants 에 저장:
+    { "source": "<원본 이름>", "width": 4032, "height": 3024,
+      "webp": {"320": "<이름>", ...}, "jpeg": {"320": "<이름>", ...} }
+"""
+
+import io
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connection
+from PIL import Image, ImageOps
+
+logger = logging.getLogger(__name__)
+
+VARIANT_WIDTHS = (320, 640, 1280)
+MAX_PIXELS = 40_000_000       # 약 40MP — 이보다 큰 이미지는 처리하지 않음
+ORIENTATION_TAG = 0x0112
+
+FORMATS = {
+    'webp': ('WEBP', 'webp', {'quality': 80, 'method': 4}),
+    'jpeg': ('JPEG', 'jpg',  {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='post-images')
+
+
+class ImageRejected(ValueError):
+    """처리할 수 없는 이미지 (손상, 지원하지 않는 형식, 픽셀 수 초과)"""
+
+
+# ── 변환 ──────────────────────────────────────────────────────
+
+def variant_name(source_name, width, ext):
+    base, _ = os.path.splitext(source_name)
+    return f'{base}.w{width}.{ext}'
+
+
+def _decode(fp, max_width):
+    img = Image.open(fp)   # 헤더만 읽음 (픽셀 디코딩 전)
+    width, height = img.size
+    if width * height > MAX_PIXELS:
+        raise ImageRejected(f'too many pixels: {width}x{height}')
+    # EXIF Orientation 5~8 은 90도 회전 → 가로/세로가 바뀜
+    if img.getexif().get(ORIENTATION_TAG) in (5, 6, 7, 8):
+        width, height = height, width
+
+    # 회전 여부와 상관없이 두 변 모두 max_width 이상이 되는 배율로 디코딩
+    if img.format == 'JPEG':
+        img.draft('RGB', (max_width, max_width))
+
+    img = ImageOps.exif_transpose(img)
+    img.load()
+    return img, (width, height)
+
+
+def _prepare(img, fmt):
+    if fmt == 'JPEG':
+        if img.mode in ('RGBA', 'LA', 'P'):
+            rgba = img.convert('RGBA')
+            flat = Image.new('RGB', rgba.size, (255, 255, 255))
+            flat.paste(rgba, mask=rgba.getchannel('A'))
+            return flat
+        return img.convert('RGB') if img.mode != 'RGB' else img
+    if img.mode not in ('RGB', 'RGBA'):
+        return img.convert('RGBA' if 'A' in img.getbands() or img.mode == 'P' else 'RGB')
+    return img
+
+
+def render_variants(source_name, storage=None):
+    """원본 옆에 변환 파일을 쓰고 image_variants dict 반환 (DB 접근 없음)"""
+    storage = storage or default_storage
+    try:
+        with storage.open(source_name, 'rb') as fp:
+            img, (src_w, src_h) = _decode(fp, max(VARIANT_WIDTHS))
+    except (OSError, SyntaxError, Image.DecompressionBombError) as e:
+        raise ImageRejected(str(e)) from e
+
+    # 원본보다 작은 너비만 생성 (원본이 가장 작은 너비보다 작으면 원본 크기로 1개)
+    widths = [w for w in VARIANT_WIDTHS if w < src_w] or [src_w]
+    result = {'source': source_name, 'width': src_w, 'height': src_h}
+    for key in FORMATS:
+        result[key] = {}
+
+    # 큰 너비부터 줄여 나감 → 작은 변환은 직전 결과에서 축소
+    current = img
+    for width in sorted(widths, reverse=True):
+        height = max(1, round(current.height * width / current.width))
+        if current.width != width:
+            current = current.resize((width, height), Image.LANCZOS, reducing_gap=2.0)
+
+        for key, (fmt, ext, params) in FORMATS.items():
+            buffer = io.BytesIO()
+            _prepare(current, fmt).save(buffer, fmt, **params)   # exif 인자 없음 → EXIF 제거
+            name = variant_name(source_name, width, ext)
+            if storage.exists(name):
+                storage.delete(name)
+            storage.save(name, ContentFile(buffer.getvalue()))
+            result[key][str(width)] = name
+
+    return result
+
+
+def variant_files(variants):
+    return [name for key in FORMATS for name in (variants or {}).get(key, {}).values()]
+
+
+def delete_variants(variants, keep=(), storage=None):
+    storage = storage or default_storage
+    for name in variant_files(variants):
+        if name not in keep:
+            try:
+                storage.delete(name)
+            except OSError as e:
+                logger.warning(f"post image variant delete failed ({name}): {e}")
+
+
+# ── 게시글 단위 처리 ──────────────────────────────────────────
+
+def process_post(post_id):
+    """게시글 이미지 변환 후 image_variants 저장. 성공 여부 반환"""
+    from .models import Post
+
+    post = Post.objects.filter(pk=post_id).only('id', 'image', 'image_variants').first()
+    if post is None or not post.image:
+        return False
+
+    source = post.image.name
+    try:
+        variants = render_variants(source, post.image.storage)
+    except ImageRejected as e:
+        logger.warning(f"post {post_id} image rejected: {e}")
+        # 같은 이미지로 다시 시도하지 않도록 실패도 기록
+        Post.objects.filter(pk=post_id, image=source).update(
+            image_variants={'source': source, 'error': str(e)[:200]}
+        )
+        return False
+
+    # 변환 중 이미지가 바뀌었으면 저장하지 않음 (새 이미지 작업이 따로 예약됨)
+    updated = Post.objects.filter(pk=post_id, image=source).update(image_variants=variants)
+    if updated:
+        delete_variants(post.image_variants, keep=set(variant_files(variants)), storage=post.image.storage)
+    else:
+        delete_variants(variants, storage=post.image.storage)
+    return bool(updated)
+
+
+def _run(post_id):
+    try:
+        process_post(post_id)
+    except Exception:
+        logger.exception(f"post {post_id} image variants failed")
+    finally:
+        connection.close()   # 풀 스레드의 DB 연결 정리
+
+
+def schedule(post_id):
+    """요청 스레드를 막지 않고 백그라운드 스레드에서 변환"""
+    _executor.submit(_run, post_id)
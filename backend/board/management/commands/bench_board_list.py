@@ -0,0 +1,123 @@
+# backend/board/management/commands/bench_board_list.py
+#
+# 게시판 목록 API 벤치마크 — 페이지 깊이와 무관하게 쿼리 수/지연이 일정한지 확인
+#
+# ── 사용법 ──────────────────────────────────────────────────────
+#   python manage.py bench_board_list --seed 100000     # 벤치용 게시글 10만 건 생성
+#   python manage.py bench_board_list --pages 200       # 1 ~ 200 페이지를 커서로 순회하며 측정
+#   python manage.py bench_board_list --search 은혜      # 검색 목록 측정
+#   python manage.py bench_board_list --cleanup         # 벤치용 게시글 삭제
+# ────────────────────────────────────────────────────────────────
+
+import statistics
+import time
+from datetime import timedelta
+from urllib.parse import parse_qsl, urlsplit
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory
+
+from board.models import Post, Comment
+from board.views import PostViewSet
+
+BENCH_AUTHOR = '__bench__'
+CHECKPOINTS = [1, 2, 10, 50, 100, 500, 1000, 5000]
+
+
+class Command(BaseCommand):
+    help = '게시판 목록 API 벤치마크 (keyset 페이지네이션)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seed', type=int, default=0, help='생성할 벤치용 게시글 수')
+        parser.add_argument('--pages', type=int, default=100, help='커서를 따라 읽을 페이지 수')
+        parser.add_argument('--search', default='', help='검색어 (목록 대신 검색 결과 측정)')
+        parser.add_argument('--cleanup', action='store_true', help='벤치용 게시글 삭제')
+
+    def handle(self, *args, **options):
+        if options['cleanup']:
+            deleted, _ = Post.objects.filter(author=BENCH_AUTHOR).delete()
+            self.stdout.write(self.style.SUCCESS(f'  ✅ 벤치용 데이터 {deleted}건 삭제'))
+            return
+
+        if options['seed']:
+            self._seed(options['seed'])
+
+        self._run(options['pages'], options['search'])
+
+    # ── 데이터 생성 ───────────────────────────────────────────
+    def _seed(self, count, batch_size=5000):
+        started = time.perf_counter()
+        base = timezone.now()
+        created_at = Post._meta.get_field('created_at')
+
+        # 게시글마다 다른 작성 시각이 필요 → 생성 동안만 auto_now_add 해제
+        created_at.auto_now_add = False
+        try:
+            for offset in range(0, count, batch_size):
+                n = min(batch_size, count - offset)
+                posts = Post.objects.bulk_create([
+                    Post(
+                        title=f'벤치 게시글 {offset + i}',
+                        content='은혜와 평강이 있기를 ' * 10,
+                        author=BENCH_AUTHOR,
+                        created_at=base - timedelta(seconds=offset + i),
+                    )
+                    for i in range(n)
+                ])
+                if connection.features.can_return_rows_from_bulk_insert:
+                    Comment.objects.bulk_create([
+                        Comment(post=post, author=BENCH_AUTHOR, content='아멘')
+                        for post in posts[::3] for _ in range(2)
+                    ])
+                self.stdout.write(f'  {offset + n}/{count} 건 생성')
+        finally:
+            created_at.auto_now_add = True
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f'  ✅ 게시글 {count}건 생성 ({elapsed:.1f}s)'))
+
+    # ── 측정 ─────────────────────────────────────────────────
+    def _run(self, pages, search):
+        factory = APIRequestFactory()
+        view = PostViewSet.as_view({'get': 'list'})
+        host = settings.ALLOWED_HOSTS[0] if settings.ALLOWED_HOSTS else 'localhost'
+
+        total = Post.objects.count()
+        self.stdout.write(f'  게시글 {total}건, {pages}페이지 순회' + (f", 검색어 '{search}'" if search else ''))
+        self.stdout.write(f'  {"page":>6} {"queries":>8} {"ms":>8} {"rows":>6}')
+
+        params = {'search': search} if search else {}
+        url = '/api/board/posts/'
+        timings = []
+        query_counts = set()
+
+        for page in range(1, pages + 1):
+            request = factory.get(url, params, SERVER_NAME=host)
+            with CaptureQueriesContext(connection) as ctx:
+                started = time.perf_counter()
+                response = view(request)
+                response.render()
+                elapsed = (time.perf_counter() - started) * 1000
+
+            timings.append(elapsed)
+            query_counts.add(len(ctx))
+            if page in CHECKPOINTS or page == pages:
+                self.stdout.write(
+                    f'  {page:>6} {len(ctx):>8} {elapsed:>8.2f} {len(response.data["results"]):>6}'
+                )
+
+            next_url = response.data.get('next')
+            if not next_url:
+                break
+            # next 는 절대 URL → 경로와 쿼리스트링(cursor) 그대로 다음 요청에 사용
+            parts = urlsplit(next_url)
+            url, params = parts.path, dict(parse_qsl(parts.query))
+
+        self.stdout.write(self.style.SUCCESS(
+            f'  ✅ 요청당 쿼리 수 {sorted(query_counts)}, '
+            f'지연 중앙값 {statistics.median(timings):.2f}ms / 최대 {max(timings):.2f}ms'
+        ))
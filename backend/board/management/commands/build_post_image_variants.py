@@ -0,0 +1,86 @@
+# backend/board/management/commands/build_post_image_variants.py
+#
+# 기존 게시글 대표 이미지의 반응형 변환본(WebP/JPEG, 여러 너비) 일괄 생성
+# 이미지 디코딩/인코딩은 CPU 작업이므로 프로세스 풀에서 병렬 처리
+#
+# ── 사용법 ──────────────────────────────────────────────────────
+#   python manage.py build_post_image_variants              # 변환본 없는 게시글만
+#   python manage.py build_post_image_variants --all        # 전체 다시 생성
+#   python manage.py build_post_image_variants --workers 4  # 프로세스 수 지정
+#   python manage.py build_post_image_variants --post 12    # 특정 게시글만
+# ────────────────────────────────────────────────────────────────
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import django
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from board import images
+from board.models import Post
+
+
+def _init_worker():
+    # spawn 방식 플랫폼에서도 자식 프로세스가 설정/앱을 불러오도록
+    django.setup()
+
+
+def _render(post_id, source):
+    """자식 프로세스 — 파일만 다루고 DB 는 건드리지 않음"""
+    try:
+        return post_id, source, images.render_variants(source), None
+    except images.ImageRejected as e:
+        return post_id, source, None, str(e)
+
+
+class Command(BaseCommand):
+    help = '게시글 대표 이미지 반응형 변환본 일괄 생성 (프로세스 풀)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help='이미 변환된 게시글도 다시 생성')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 2, help='프로세스 수')
+        parser.add_argument('--post', type=int, help='특정 게시글 ID만')
+
+    def handle(self, *args, **options):
+        posts = Post.objects.exclude(image='').exclude(image__isnull=True)
+        if options['post']:
+            posts = posts.filter(pk=options['post'])
+
+        jobs = [
+            (pk, name, variants)
+            for pk, name, variants in posts.values_list('id', 'image', 'image_variants')
+            if options['all'] or (variants or {}).get('source') != name
+        ]
+        if not jobs:
+            self.stdout.write(self.style.SUCCESS('  ✅ 변환할 이미지가 없습니다'))
+            return
+
+        previous = {pk: variants for pk, _, variants in jobs}
+        done = failed = 0
+        started = time.perf_counter()
+
+        # 자식 프로세스가 부모의 DB 연결을 물려받지 않도록 먼저 닫음
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=max(1, options['workers']), initializer=_init_worker) as pool:
+            futures = [pool.submit(_render, pk, name) for pk, name, _ in jobs]
+            for future in as_completed(futures):
+                post_id, source, variants, error = future.result()
+                if error:
+                    failed += 1
+                    self.stdout.write(self.style.WARNING(f'  ⚠️ post {post_id}: {error}'))
+                    variants = {'source': source, 'error': error[:200]}
+
+                updated = Post.objects.filter(pk=post_id, image=source).update(image_variants=variants)
+                if updated and not error:
+                    done += 1
+                    images.delete_variants(previous[post_id], keep=set(images.variant_files(variants)))
+
+                if (done + failed) % 50 == 0:
+                    self.stdout.write(f'  {done + failed}/{len(jobs)} 처리')
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'  ✅ {done}건 변환, {failed}건 실패 ({elapsed:.1f}s, 프로세스 {options["workers"]}개)'
+        ))
@@ -1,5 +1,8 @@
 # backend/board/models.py
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from django.contrib.auth.models import User
 import uuid
 import os
@@ -15,6 +18,8 @@ class Post(models.Model):
     content = models.TextField()
     author = models.CharField(max_length=100)
     view_count = models.IntegerField(default=0)
+    # 댓글 수 (답글 포함) — Comment 저장/삭제 signal 에서 F() 로 증감
+    comment_count = models.PositiveIntegerField(default=0, editable=False)
     
     # ✅ 이미지 필드 추가
     image = models.ImageField(
@@ -24,6 +29,9 @@ class Post(models.Model):
         null=True,
         help_text='포스트 대표 이미지 (선택사항)'
     )
+    # 반응형 변환 파일 목록 (board/images.py 참고) — 백그라운드에서 채워짐
+    image_variants = models.JSONField(default=dict, blank=True, editable=False,
+                                      verbose_name='이미지 변환본')
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -31,20 +39,36 @@ class Post(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # 목록 keyset 페이지네이션 (created_at 역순)
+            models.Index(fields=['-created_at'], name='board_post_created_idx'),
+        ]
 
     def __str__(self):
         return self.title
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 이미지 교체 여부 판단용 (변환 작업 예약)
+        instance._loaded_image = values[field_names.index('image')] if 'image' in field_names else None
+        return instance
     
     def delete(self, *args, **kwargs):
         """모델 삭제 시 이미지도 함께 삭제"""
         if self.image:
             if os.path.isfile(self.image.path):
                 os.remove(self.image.path)
+            from .images import delete_variants
+            delete_variants(self.image_variants, storage=self.image.storage)
         super().delete(*args, **kwargs)
 
 
 class Comment(models.Model):
     post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='comments')
+    # 답글은 한 단계만: parent 는 항상 최상위 댓글 (인덱스는 아래 (parent, created_at) 사용)
+    parent = models.ForeignKey('self', on_delete=models.CASCADE, related_name='replies',
+                               null=True, blank=True, db_index=False)
     author = models.CharField(max_length=100)
     content = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
@@ -53,6 +77,87 @@ class Comment(models.Model):
 
     class Meta:
         ordering = ['created_at']
+        indexes = [
+            # 게시글별 댓글 / 댓글별 답글 커서 페이지네이션
+            models.Index(fields=['post', 'created_at'], name='board_comment_post_idx'),
+            models.Index(fields=['parent', 'created_at'], name='board_comment_parent_idx'),
+        ]
 
     def __str__(self):
-        return f'{self.author} - {self.content[:20]}'
\ No newline at end of file
+        return f'{self.author} - {self.content[:20]}'
+
+
+# ============================================================
+# Signal: 대표 이미지 저장/교체 시 반응형 변환 예약
+# ============================================================
+
+@receiver(post_save, sender=Post)
+def schedule_post_image_variants(sender, instance, created, raw=False, **kwargs):
+    """새 이미지면 커밋 후 백그라운드 스레드에서 변환 (요청 응답은 기다리지 않음)"""
+    if raw or not instance.image:
+        return
+    name = instance.image.name
+    if not created and getattr(instance, '_loaded_image', None) == name \
+            and instance.image_variants.get('source') == name:
+        return
+    instance._loaded_image = name
+
+    from .images import schedule
+    post_id = instance.pk
+    transaction.on_commit(lambda: schedule(post_id))
+
+
+# ============================================================
+# Signal: 실시간 게시판 이벤트 (board/events.py → WebSocket)
+# ============================================================
+
+@receiver(post_save, sender=Post)
+def publish_post_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    from .events import publish_post, post_payload
+    action = 'created' if created else 'updated'
+    post_id, data = instance.pk, post_payload(instance)
+    transaction.on_commit(lambda: publish_post(action, post_id, data))
+
+
+@receiver(post_delete, sender=Post)
+def publish_post_deleted(sender, instance, **kwargs):
+    from .events import publish_post
+    post_id = instance.pk
+    transaction.on_commit(lambda: publish_post('deleted', post_id))
+
+
+@receiver(post_save, sender=Comment)
+def publish_comment_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    from .events import publish_comment, comment_payload
+    action = 'created' if created else 'updated'
+    post_id, comment_id, data = instance.post_id, instance.pk, comment_payload(instance)
+    transaction.on_commit(lambda: publish_comment(action, post_id, comment_id, data))
+
+
+@receiver(post_delete, sender=Comment)
+def publish_comment_deleted(sender, instance, **kwargs):
+    from .events import publish_comment
+    post_id, comment_id = instance.post_id, instance.pk
+    transaction.on_commit(lambda: publish_comment('deleted', post_id, comment_id))
+
+
+# ============================================================
+# Signal: 댓글 수 (Post.comment_count) 증감
+# ============================================================
+
+@receiver(post_save, sender=Comment)
+def increment_comment_count(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        Post.objects.filter(pk=instance.post_id).update(comment_count=F('comment_count') + 1)
+
+
+@receiver(post_delete, sender=Comment)
+def decrement_comment_count(sender, instance, **kwargs):
+    # 부모 댓글 삭제 시 답글도 CASCADE 로 지워지며 각각 이 signal 이 호출됨
+    Post.objects.filter(pk=instance.post_id, comment_count__gt=0).update(
+        comment_count=F('comment_count') - 1
+    )
@@ -0,0 +1,25 @@
+# backend/board/pagination.py
+
+from rest_framework.pagination import CursorPagination
+
+
+class PostCursorPagination(CursorPagination):
+    """
+    게시글 목록 — created_at 역순 keyset 페이지네이션
+    OFFSET 없이 "created_at < 마지막 글" 조건으로 다음 페이지를 읽으므로
+    몇 번째 페이지든 같은 비용 (created_at 인덱스 사용)
+    """
+
+    page_size = 12
+    page_size_query_param = 'page_size'
+    max_page_size = 50
+    ordering = '-created_at'
+
+
+class CommentCursorPagination(CursorPagination):
+    """댓글/답글 — 작성순 keyset 페이지네이션 ((post, created_at) / (parent, created_at) 인덱스)"""
+
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = 'created_at'
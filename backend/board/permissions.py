@@ -1,6 +1,8 @@
 # backend/board/permissions.py
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 
+from accounts.auth_context import get_auth_context
+
 class IsAuthorOrReadOnly(BasePermission):
     """
     작성자(user)만 수정/삭제 가능
@@ -26,41 +28,25 @@ class IsApprovedUser(BasePermission):
         if request.method in SAFE_METHODS:
             return True
         
-        # 인증되지 않은 사용자
-        if not request.user or not request.user.is_authenticated:
-            return False
-        
-        # 관리자는 항상 허용
-        if request.user.is_staff or request.user.is_superuser:
-            return True
-        
-        # 일반 사용자는 승인 상태 확인
-        try:
-            profile = request.user.profile
-            return profile.is_approved
-        except:
-            return False
+        # 미인증 → 거부, 관리자 → 허용, 일반 사용자 → 승인 상태 (요청당 1회 조회)
+        return get_auth_context(request).can_write_post
     
     def has_object_permission(self, request, view, obj):
         # GET, HEAD, OPTIONS는 모두 허용
         if request.method in SAFE_METHODS:
             return True
         
-        # 인증되지 않은 사용자
-        if not request.user or not request.user.is_authenticated:
+        context = get_auth_context(request)
+        if not context.is_authenticated:
             return False
         
         # 관리자는 항상 허용
-        if request.user.is_staff or request.user.is_superuser:
+        if context.is_staff:
             return True
         
         # 작성자 본인인지 확인
-        if obj.user != request.user:
+        if obj.user_id != context.user_id:
             return False
         
-        # 승인 상태 확인
-        try:
-            profile = request.user.profile
-            return profile.is_approved
-        except:
-            return False
\ No newline at end of file
+        # 승인 상태 확인 (has_permission 에서 계산한 값 재사용)
+        return context.is_approved
\ No newline at end of file
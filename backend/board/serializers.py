@@ -5,12 +5,39 @@ from .models import Post, Comment
 class PostSerializer(serializers.ModelSerializer):
     author = serializers.CharField(read_only=True)
     image_url = serializers.SerializerMethodField()
+    image_srcset = serializers.SerializerMethodField()
 
     class Meta:
         model = Post
         fields = ['id', 'title', 'content', 'author', 'image', 'image_url', 
-                  'view_count', 'created_at', 'updated_at']
-        read_only_fields = ['id', 'author', 'view_count', 'created_at', 'updated_at']
+                  'image_srcset', 'view_count', 'comment_count', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'author', 'view_count', 'comment_count', 'created_at', 'updated_at']
+
+    def get_image_srcset(self, obj):
+        """
+        반응형 변환본 (board/images.py). 변환 전이거나 실패하면 None → image_url 사용
+        { width, height, src, webp: "url 320w, url 640w, ...", jpeg: "..." }
+        """
+        variants = obj.image_variants or {}
+        if not obj.image or variants.get('source') != obj.image.name or 'error' in variants:
+            return None
+
+        request = self.context.get('request')
+
+        def url(name):
+            path = obj.image.storage.url(name)
+            return request.build_absolute_uri(path) if request else path
+
+        data = {'width': variants['width'], 'height': variants['height']}
+        for key in ('webp', 'jpeg'):
+            items = sorted(variants.get(key, {}).items(), key=lambda item: int(item[0]))
+            data[key] = ', '.join(f'{url(name)} {width}w' for width, name in items)
+            if key == 'jpeg' and items:
+                # 기본 src: 640px 이하 중 가장 큰 JPEG (카드 썸네일 크기)
+                fitting = [name for width, name in items if int(width) <= 640] or [items[0][1]]
+                data['src'] = url(fitting[-1])
+        return data
+
     
     def get_image_url(self, obj):
         if obj.image:
@@ -21,7 +48,15 @@ class PostSerializer(serializers.ModelSerializer):
 
 
 class CommentSerializer(serializers.ModelSerializer):
+    # 최상위 댓글 목록에서만 annotate 됨 (답글/작성 응답은 0)
+    reply_count = serializers.SerializerMethodField()
+
     class Meta:
         model = Comment
-        fields = ['id', 'post', 'author', 'content', 'user', 'created_at', 'updated_at']
-        read_only_fields = ['id', 'post', 'author', 'user', 'created_at', 'updated_at']
\ No newline at end of file
+        fields = ['id', 'post', 'parent', 'author', 'content', 'user',
+                  'reply_count', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'post', 'author', 'user', 'created_at', 'updated_at']
+        extra_kwargs = {'parent': {'required': False, 'allow_null': True}}
+
+    def get_reply_count(self, obj):
+        return getattr(obj, 'reply_count', 0)
\ No newline at end of file
@@ -1,3 +1,89 @@
-from django.test import TestCase
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from .models import Post
+
+
+LOCMEM_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class BoardWriteQueryCountTests(TestCase):
+    """
+    게시글 수정 / 댓글 작성 시 승인 상태 조회 횟수
+    IsApprovedUser, IsAuthorOrReadOnly, _is_user_approved 가 같은 auth context 를 써서
+    요청당 UserProfile 조회는 최대 1번, 캐시가 있으면 0번, 프로필 저장 후에는 다시 1번
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('writer', password='password-1234')
+        cls.user.profile.approval_status = 'approved'
+        cls.user.profile.save()
+        cls.post = Post.objects.create(title='제목', content='내용', author='writer', user=cls.user)
+
+    def setUp(self):
+        cache.clear()
+
+    def _client(self):
+        # 요청마다 새 User 객체 — 실제 인증처럼 요청 안 캐시(_auth_context)가 남지 않도록
+        client = APIClient()
+        client.force_authenticate(User.objects.get(pk=self.user.pk))
+        return client
+
+    def _patch(self, title):
+        client = self._client()
+        return lambda: client.patch(f'/api/board/posts/{self.post.pk}/', {'title': title}, format='multipart')
+
+    def _comment(self, content):
+        client = self._client()
+        return lambda: client.post(f'/api/board/posts/{self.post.pk}/comments/', {'content': content},
+                                   format='multipart')
+
+    def test_patch_cold_cache(self):
+        request = self._patch('cold')
+        # 프로필 1 + 게시글 조회 1 + UPDATE 1
+        with self.assertNumQueries(3):
+            response = request()
+        self.assertEqual(response.status_code, 200)
+
+    def test_patch_warm_cache(self):
+        self._patch('cold')()
+        request = self._patch('warm')
+        # 게시글 조회 1 + UPDATE 1 (프로필 조회 없음)
+        with self.assertNumQueries(2):
+            response = request()
+        self.assertEqual(response.status_code, 200)
+
+    def test_comment_cold_and_warm_cache(self):
+        request = self._comment('cold')
+        # 프로필 1 + 게시글 조회 1 + INSERT 1 + comment_count UPDATE 1
+        with self.assertNumQueries(4):
+            response = request()
+        self.assertEqual(response.status_code, 201)
+
+        request = self._comment('warm')
+        with self.assertNumQueries(3):
+            response = request()
+        self.assertEqual(response.status_code, 201)
+
+    def test_profile_save_invalidates_cache(self):
+        self._patch('warm up')()
+
+        profile = User.objects.get(pk=self.user.pk).profile
+        profile.approval_status = 'pending'
+        profile.save()
+
+        # 캐시가 지워져 프로필을 다시 읽고 (1) 승인 취소가 바로 반영됨
+        request = self._patch('revoked')
+        with self.assertNumQueries(1):
+            response = request()
+        self.assertEqual(response.status_code, 403)
+
+        # 다시 캐시된 값으로 거부 — 쿼리 없음
+        request = self._comment('revoked')
+        with self.assertNumQueries(0):
+            response = request()
+        self.assertEqual(response.status_code, 403)
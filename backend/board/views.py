@@ -5,17 +5,21 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
 from rest_framework.parsers import MultiPartParser, FormParser
 from django.shortcuts import get_object_or_404
-from django.db.models import Q
+from django.db.models import F, Q, Count, OuterRef, Subquery, IntegerField
+from django.db.models.functions import Coalesce
 
 from .models import Post, Comment
 from .serializers import PostSerializer, CommentSerializer
 from .permissions import IsAuthorOrReadOnly, IsApprovedUser
+from .pagination import PostCursorPagination, CommentCursorPagination
+from accounts.auth_context import get_auth_context
 
 
 class PostViewSet(viewsets.ModelViewSet):
     queryset = Post.objects.all()
     serializer_class = PostSerializer
     parser_classes = [MultiPartParser, FormParser]
+    pagination_class = PostCursorPagination
     
     permission_classes = [IsAuthenticatedOrReadOnly, IsApprovedUser, IsAuthorOrReadOnly]
 
@@ -25,44 +29,26 @@ class PostViewSet(viewsets.ModelViewSet):
         - 제목, 내용, 작성자로 검색
         - 대소문자 구분 없음
         """
-        queryset = super().get_queryset()
+        # 댓글 수는 Post.comment_count (비정규화 컬럼) → 목록에 집계 쿼리 없음
+        queryset = super().get_queryset().select_related('user')
         search = self.request.query_params.get('search', '').strip()
         
         if search:
-            print(f"🔍 검색어: '{search}'")
-            
             # Q 객체로 OR 조건 검색
             query = Q(title__icontains=search)  # 제목에서 검색
             query |= Q(content__icontains=search)  # 내용에서 검색
             query |= Q(author__icontains=search)  # 작성자에서 검색
             
             queryset = queryset.filter(query)
-            print(f"📊 검색 결과 개수: {queryset.count()}")
         
         return queryset
 
-    def list(self, request, *args, **kwargs):
-        """목록 조회 - 검색어 디버깅"""
-        search = request.query_params.get('search', '')
-        if search:
-            print(f"🔍 검색 요청 받음: '{search}'")
-        
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        
-        # ✅ 페이지네이션이 설정되어 있으면 사용, 아니면 전체 결과 반환
-        if hasattr(self, 'paginate_queryset') and self.paginate_queryset(queryset) is not None:
-            page = self.paginate_queryset(queryset)
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        
-        return Response(serializer.data)
-
     def retrieve(self, request, *args, **kwargs):
         """게시글 조회 시 조회수 증가"""
         instance = self.get_object()
+        # 조회수만 원자적으로 증가 (전체 save 는 백그라운드에서 채운 image_variants 를 덮어쓸 수 있음)
+        Post.objects.filter(pk=instance.pk).update(view_count=F('view_count') + 1)
         instance.view_count += 1
-        instance.save()
         serializer = self.get_serializer(instance)
         return Response(serializer.data)
 
@@ -99,13 +85,41 @@ class PostViewSet(viewsets.ModelViewSet):
 
     @action(detail=True, methods=['get', 'post'], url_path='comments')
     def comments(self, request, pk=None):
-        """특정 게시글의 댓글 목록 조회 및 댓글 작성"""
+        """
+        특정 게시글의 댓글 목록 조회 및 댓글 작성
+        GET  ?parent=<id> 이면 해당 댓글의 답글, 없으면 최상위 댓글 (커서 페이지네이션)
+        POST parent 를 보내면 답글 (답글의 답글은 최상위 댓글 아래로)
+        """
         post = self.get_object()
 
         if request.method == 'GET':
-            comments = Comment.objects.filter(post=post)
-            serializer = CommentSerializer(comments, many=True)
-            return Response(serializer.data)
+            parent_id = request.query_params.get('parent')
+            if parent_id:
+                if not parent_id.isdigit():
+                    return Response({'detail': 'parent 는 숫자여야 합니다.'},
+                                    status=status.HTTP_400_BAD_REQUEST)
+                comments = Comment.objects.filter(post=post, parent_id=parent_id)
+            else:
+                comments = Comment.objects.filter(post=post, parent__isnull=True).annotate(
+                    # 페이지에 실린 댓글에 대해서만 계산 ((parent, created_at) 인덱스)
+                    reply_count=Coalesce(
+                        Subquery(
+                            Comment.objects
+                            .filter(parent=OuterRef('pk'))
+                            .order_by()
+                            .values('parent')
+                            .annotate(n=Count('id'))
+                            .values('n'),
+                            output_field=IntegerField(),
+                        ),
+                        0,
+                    )
+                )
+
+            paginator = CommentCursorPagination()
+            page = paginator.paginate_queryset(comments, request, view=self)
+            serializer = CommentSerializer(page, many=True)
+            return paginator.get_paginated_response(serializer.data)
 
         elif request.method == 'POST':
             if not request.user.is_authenticated:
@@ -123,8 +137,19 @@ class PostViewSet(viewsets.ModelViewSet):
 
             serializer = CommentSerializer(data=request.data)
             if serializer.is_valid():
+                parent = serializer.validated_data.get('parent')
+                if parent is not None:
+                    if parent.post_id != post.id:
+                        return Response(
+                            {'detail': '같은 게시글의 댓글에만 답글을 달 수 있습니다.'},
+                            status=status.HTTP_400_BAD_REQUEST
+                        )
+                    # 답글은 한 단계만 — 답글에 단 답글은 최상위 댓글 아래로
+                    if parent.parent_id:
+                        parent = parent.parent
                 serializer.save(
                     post=post,
+                    parent=parent,
                     author=request.user.username,
                     user=request.user
                 )
@@ -156,19 +181,8 @@ class PostViewSet(viewsets.ModelViewSet):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     def _is_user_approved(self, user):
-        """사용자 승인 여부 확인 헬퍼 메서드"""
-        if not user or not user.is_authenticated:
-            return False
-        
-        # 관리자는 항상 승인된 것으로 간주
-        if user.is_staff or user.is_superuser:
-            return True
-        
-        # 일반 사용자는 프로필 승인 상태 확인
-        try:
-            return user.profile.is_approved
-        except:
-            return False
+        """사용자 승인 여부 확인 헬퍼 메서드 (관리자는 항상 승인 — 권한 클래스와 같은 auth context 사용)"""
+        return get_auth_context(user).can_write_post
 
     def get_permissions(self):
         """액션별로 다른 권한 적용"""
@@ -13,6 +13,7 @@ from channels.routing import ProtocolTypeRouter, URLRouter
 from channels.auth import AuthMiddlewareStack
 from channels.security.websocket import AllowedHostsOriginValidator
 import video_meetings.routing
+import board.routing
 from video_meetings.middleware import JWTAuthMiddleware
 
 # ⭐⭐⭐ 4. ASGI 라우팅 설정
@@ -23,6 +24,7 @@ application = ProtocolTypeRouter({
             AuthMiddlewareStack(
                 URLRouter(
                     video_meetings.routing.websocket_urlpatterns
+                    + board.routing.websocket_urlpatterns
                 )
             )
         )
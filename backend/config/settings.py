@@ -286,7 +286,8 @@ REST_FRAMEWORK = {
     
     # 인증
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        # JWT — 토큰 claims 로 사용자 생성 (accounts/jwt.py, JWT_CLAIMS_USER)
+        'accounts.jwt.ClaimsJWTAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
     
@@ -336,7 +337,8 @@ SIMPLE_JWT = {
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
     'ROTATE_REFRESH_TOKENS': True,
     'BLACKLIST_AFTER_ROTATION': True,
-    'UPDATE_LAST_LOGIN': True,
+    # last_login 은 accounts/last_login.py 버퍼로 모아서 저장 (토큰 발급마다 UPDATE 하지 않음)
+    'UPDATE_LAST_LOGIN': False,
     
     'ALGORITHM': 'HS256',
     'SIGNING_KEY': SECRET_KEY,
@@ -358,8 +360,17 @@ SIMPLE_JWT = {
     'SLIDING_TOKEN_REFRESH_EXP_CLAIM': 'refresh_exp',
     'SLIDING_TOKEN_LIFETIME': timedelta(minutes=5),
     'SLIDING_TOKEN_REFRESH_LIFETIME': timedelta(days=1),
+
+    # 사용자 이름·관리자·승인·교인 여부를 토큰에 포함 (accounts/jwt.py)
+    'TOKEN_OBTAIN_SERIALIZER': 'accounts.jwt.ClaimsTokenObtainPairSerializer',
+    'TOKEN_REFRESH_SERIALIZER': 'accounts.jwt.ClaimsTokenRefreshSerializer',
 }
 
+# 인증된 요청/WebSocket 연결마다 User 를 DB 에서 읽지 않고 토큰 claims 로 생성
+# (권한 정보가 바뀐 사용자의 기존 토큰은 Redis 표식으로 DB 조회로 되돌림)
+# 선택 기능 — 기본은 꺼짐 (JWT_CLAIMS_USER=True 로 켬)
+JWT_CLAIMS_USER = config('JWT_CLAIMS_USER', default=False, cast=bool)
+
 # ============================================================================
 # Channels (WebSocket) 설정
 # ============================================================================
@@ -1,6 +1,8 @@
 # backend/pastoral_letters/permissions.py
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 
+from accounts.auth_context import get_auth_context
+
 class IsAdminOrReadOnly(BasePermission):
     """
     관리자만 생성/수정/삭제 가능
@@ -32,35 +34,29 @@ class IsMemberUser(BasePermission):
     message = '목회서신은 Arche 교회 등록 교인만 열람할 수 있습니다.'
     
     def has_permission(self, request, view):
+        context = get_auth_context(request)
+
         # 인증되지 않은 사용자
-        if not request.user or not request.user.is_authenticated:
+        if not context.is_authenticated:
             self.message = '로그인이 필요합니다.'
             return False
         
         # 관리자는 항상 허용
-        if request.user.is_staff or request.user.is_superuser:
+        if context.is_staff:
             return True
         
-        # 프로필 확인
-        try:
-            profile = request.user.profile
-            
-            # 승인되지 않은 사용자
-            if not profile.is_approved:
-                self.message = '관리자 승인 후 이용 가능합니다.'
-                return False
-            
-            # 교인이 아닌 사용자
-            if not profile.is_member:
-                self.message = '목회서신은 Arche 공동체가 열람할 수 있습니다.'
-                return False
-            
-            return True
-            
-        except:
-            self.message = '프로필 정보를 확인할 수 없습니다.'
+        # 승인되지 않은 사용자 (프로필이 없어도 미승인으로 처리)
+        if not context.is_approved:
+            self.message = '관리자 승인 후 이용 가능합니다.'
             return False
+        
+        # 교인이 아닌 사용자
+        if not context.is_member:
+            self.message = '목회서신은 Arche 공동체가 열람할 수 있습니다.'
+            return False
+        
+        return True
     
     def has_object_permission(self, request, view, obj):
-        # has_permission과 동일한 로직
+        # has_permission과 동일한 로직 (auth context 는 요청 안에서 재사용)
         return self.has_permission(request, view)
\ No newline at end of file
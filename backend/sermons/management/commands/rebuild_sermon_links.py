@@ -0,0 +1,28 @@
+# backend/sermons/management/commands/rebuild_sermon_links.py
+#
+# 설교 본문 ↔ 예수님 말씀 연결 테이블 전체 재계산
+#
+# ── 사용법 ──────────────────────────────────────────────────────
+#   python manage.py rebuild_sermon_links
+# ────────────────────────────────────────────────────────────────
+#
+# 평소에는 설교/말씀 저장 시 signal 로 증분 갱신되므로,
+# 초기 데이터 적재(load_jesus_sayings 등) 후 한 번 실행하면 된다.
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from sermons.passages import rebuild_all_links
+
+
+class Command(BaseCommand):
+    help = '설교 ↔ 예수님 말씀 구간 겹침 연결을 전체 재계산'
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        added, removed = rebuild_all_links()
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'  ✅ 연결 갱신 완료: +{added} / -{removed} ({elapsed:.2f}s)'
+        ))
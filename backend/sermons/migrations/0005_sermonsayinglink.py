@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-19 08:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bible_verses', '0003_meditation_date'),
+        ('sermons', '0004_sermon_original_audio_file_alter_sermon_audio_file_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SermonSayingLink',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('saying', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sermon_links', to='bible_verses.jesussaying', verbose_name='말씀')),
+                ('sermon', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='saying_links', to='sermons.sermon', verbose_name='설교')),
+            ],
+            options={
+                'verbose_name': '설교-말씀 연결',
+                'verbose_name_plural': '설교-말씀 연결 목록',
+                'unique_together': {('sermon', 'saying')},
+            },
+        ),
+    ]
@@ -2,7 +2,9 @@
 import uuid
 import os
 from datetime import datetime
-from django.db import models
+from django.db import models, transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
 from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator, MaxValueValidator
 
@@ -209,4 +211,57 @@ class Sermon(models.Model):
             if os.path.isfile(self.translated_pdf.path):
                 os.remove(self.translated_pdf.path)
         
-        super().delete(*args, **kwargs)
\ No newline at end of file
+        super().delete(*args, **kwargs)
+
+
+class SermonSayingLink(models.Model):
+    """설교 본문 ↔ 예수님 말씀 연결 (본문 구간이 겹치는 쌍을 미리 계산해 저장)"""
+
+    sermon = models.ForeignKey(
+        Sermon,
+        on_delete=models.CASCADE,
+        related_name='saying_links',
+        verbose_name='설교'
+    )
+    saying = models.ForeignKey(
+        'bible_verses.JesusSaying',
+        on_delete=models.CASCADE,
+        related_name='sermon_links',
+        verbose_name='말씀'
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ['sermon', 'saying']
+        verbose_name = '설교-말씀 연결'
+        verbose_name_plural = '설교-말씀 연결 목록'
+
+    def __str__(self):
+        return f'{self.sermon_id} ↔ {self.saying_id}'
+
+
+# Signal: 설교/말씀 저장 시 연결 테이블 증분 갱신
+PASSAGE_FIELDS = {'bible_book', 'book', 'chapter', 'verse_start', 'verse_end', 'is_active'}
+
+
+def _passage_changed(update_fields):
+    """update_fields가 지정된 저장(조회수 증가 등)은 본문이 바뀌지 않으면 건너뜀"""
+    return update_fields is None or bool(PASSAGE_FIELDS & set(update_fields))
+
+
+@receiver(post_save, sender=Sermon)
+def sync_sermon_saying_links(sender, instance, update_fields=None, **kwargs):
+    """설교 본문이 바뀌면 해당 설교의 연결만 다시 계산"""
+    if not _passage_changed(update_fields):
+        return
+    from .passages import sync_sermon_links
+    transaction.on_commit(lambda: sync_sermon_links(instance))
+
+
+@receiver(post_save, sender='bible_verses.JesusSaying')
+def sync_saying_sermon_links(sender, instance, update_fields=None, **kwargs):
+    """말씀 구간이 바뀌면 해당 말씀의 연결만 다시 계산"""
+    if not _passage_changed(update_fields):
+        return
+    from .passages import sync_saying_links
+    transaction.on_commit(lambda: sync_saying_links(instance))
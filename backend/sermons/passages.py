@@ -0,0 +1,153 @@
+# backend/sermons/passages.py
+"""
+설교 본문 ↔ 예수님 말씀 구간 겹침 계산
+
+- rebuild_all_links()  : 전체 재계산. (책, 장)별로 두 모델의 구간을 시작 절 순으로
+                         정렬한 뒤 한 번 훑는 sweep 으로 겹치는 쌍을 찾는다.
+- sync_sermon_links()  : 설교 1건 저장 시 증분 갱신 (말씀 구절 인덱스 사용)
+- sync_saying_links()  : 말씀 1건 저장 시 증분 갱신
+
+요청 처리 시에는 SermonSayingLink 테이블만 읽는다 (구간 스캔 없음).
+"""
+
+import logging
+
+from django.db import transaction
+
+from bible_verses.books import canonical_book, USFM_TO_SERMON_BOOK
+from bible_verses.models import JesusSaying
+from bible_verses.verse_index import get_verse_index
+
+from .models import Sermon, SermonSayingLink
+
+logger = logging.getLogger(__name__)
+
+
+# ── 증분 갱신 ────────────────────────────────────────────────
+
+def _link_ids(queryset):
+    """{(sermon_id, saying_id): 연결 id}"""
+    return {(s, j): pk for pk, s, j in queryset.values_list('id', 'sermon_id', 'saying_id')}
+
+
+def _delete_links(link_ids, batch_size=1000):
+    """연결 id 목록을 한 번에 삭제 (batch_size 개씩 DELETE ... WHERE id IN)"""
+    for start in range(0, len(link_ids), batch_size):
+        SermonSayingLink.objects.filter(pk__in=link_ids[start:start + batch_size]).delete()
+
+
+def _replace_links(filter_kwargs, wanted_pairs):
+    """filter_kwargs 범위의 연결을 wanted_pairs({(sermon_id, saying_id)})로 맞춤"""
+    existing = _link_ids(SermonSayingLink.objects.filter(**filter_kwargs))
+    stale = existing.keys() - wanted_pairs
+    fresh = wanted_pairs - existing.keys()
+
+    with transaction.atomic():
+        _delete_links([existing[pair] for pair in stale])
+        SermonSayingLink.objects.bulk_create(
+            [SermonSayingLink(sermon_id=s, saying_id=j) for s, j in fresh],
+            ignore_conflicts=True,
+        )
+    return len(fresh), len(stale)
+
+
+def sync_sermon_links(sermon):
+    """설교 1건의 연결 갱신 — 말씀 구간 인덱스에서 겹치는 말씀 조회"""
+    book = canonical_book(sermon.bible_book)
+    saying_ids = []
+    if book and sermon.chapter and sermon.verse_start:
+        saying_ids = get_verse_index().overlapping(
+            book, sermon.chapter, sermon.verse_start, sermon.verse_end or sermon.verse_start
+        )
+    return _replace_links({'sermon_id': sermon.pk}, {(sermon.pk, i) for i in saying_ids})
+
+
+def sync_saying_links(saying):
+    """말씀 1건의 연결 갱신 — 비활성 말씀은 연결 제거"""
+    wanted = set()
+    sermon_book = USFM_TO_SERMON_BOOK.get(saying.book)
+    if saying.is_active and sermon_book:
+        verse_end = max(saying.verse_end or saying.verse_start, saying.verse_start)
+        sermon_ids = (
+            Sermon.objects
+            .filter(
+                bible_book=sermon_book,
+                chapter=saying.chapter,
+                verse_start__lte=verse_end,
+                verse_end__gte=saying.verse_start,
+            )
+            .values_list('id', flat=True)
+        )
+        wanted = {(sid, saying.pk) for sid in sermon_ids}
+    return _replace_links({'saying_id': saying.pk}, wanted)
+
+
+# ── 전체 재계산 (sweep) ──────────────────────────────────────
+
+def overlap_sweep(sermon_rows, saying_rows):
+    """
+    구간 겹침 sweep.
+
+    sermon_rows / saying_rows: [(key, start, end, id), ...]  (key = (책, 장))
+    반환: {(sermon_id, saying_id), ...}
+
+    (key, start) 순으로 두 목록을 병합하며 진행한다. 새 구간이 들어올 때
+    반대편 활성 목록에서 끝 절이 현재 시작 절보다 앞선 구간을 제거하면,
+    남은 구간은 모두 현재 구간과 겹친다.
+    """
+    events = sorted(
+        [(key, start, 0, end, rid) for key, start, end, rid in sermon_rows] +
+        [(key, start, 1, end, rid) for key, start, end, rid in saying_rows]
+    )
+
+    pairs   = set()
+    active  = ([], [])   # (설교, 말씀) 활성 구간: [(end, id), ...]
+    current = None
+
+    for key, start, side, end, rid in events:
+        if key != current:
+            current = key
+            active  = ([], [])
+
+        other = active[1 - side]
+        other[:] = [(e, oid) for e, oid in other if e >= start]
+        for _, oid in other:
+            pairs.add((rid, oid) if side == 0 else (oid, rid))
+
+        active[side].append((end, rid))
+
+    return pairs
+
+
+def rebuild_all_links():
+    """모든 설교 ↔ 말씀 연결을 다시 계산. (추가 수, 삭제 수) 반환"""
+    sermon_rows = []
+    for sid, book, chapter, vs, ve in Sermon.objects.values_list(
+        'id', 'bible_book', 'chapter', 'verse_start', 'verse_end'
+    ):
+        usfm = canonical_book(book)
+        if usfm and chapter and vs:
+            sermon_rows.append(((usfm, chapter), vs, max(ve or vs, vs), sid))
+
+    saying_rows = [
+        ((book, chapter), vs, max(ve or vs, vs), jid)
+        for jid, book, chapter, vs, ve in JesusSaying.objects
+        .filter(is_active=True)
+        .values_list('id', 'book', 'chapter', 'verse_start', 'verse_end')
+    ]
+
+    wanted   = overlap_sweep(sermon_rows, saying_rows)
+    existing = _link_ids(SermonSayingLink.objects.all())
+
+    stale = existing.keys() - wanted
+    fresh = wanted - existing.keys()
+    with transaction.atomic():
+        _delete_links([existing[pair] for pair in stale])
+        SermonSayingLink.objects.bulk_create(
+            [SermonSayingLink(sermon_id=s, saying_id=j) for s, j in fresh],
+            ignore_conflicts=True,
+            batch_size=1000,
+        )
+
+    logger.info(f"sermon-saying links rebuilt: +{len(fresh)} -{len(stale)}")
+    return len(fresh), len(stale)
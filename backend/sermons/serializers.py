@@ -29,6 +29,9 @@ class SermonDetailSerializer(serializers.ModelSerializer):
     original_pdf_url = serializers.SerializerMethodField()
     translated_pdf_url = serializers.SerializerMethodField()
     
+    # 본문이 겹치는 예수님 말씀 (SermonSayingLink 미리 계산)
+    related_sayings = serializers.SerializerMethodField()
+    
     class Meta:
         model = Sermon
         fields = [
@@ -39,9 +42,23 @@ class SermonDetailSerializer(serializers.ModelSerializer):
             'description', 'duration', 'view_count',
             'original_audio_url',  # ✅ 추가
             'audio_url', 'original_pdf_url', 'translated_pdf_url',
+            'related_sayings',
             'uploaded_by_username', 'created_at', 'updated_at'
         ]
     
+    def get_related_sayings(self, obj):
+        sayings = [link.saying for link in obj.saying_links.all() if link.saying.is_active]
+        sayings.sort(key=lambda s: (s.book, s.chapter, s.verse_start))
+        return [
+            {
+                'id':          s.id,
+                'book':        s.book,
+                'reference':   s.reference,
+                'text_ko_krv': s.text_ko_krv[:60] + '…' if len(s.text_ko_krv) > 60 else s.text_ko_krv,
+            }
+            for s in sayings
+        ]
+    
     def get_original_audio_url(self, obj):  # ✅ 추가
         if obj.original_audio_file:
             request = self.context.get('request')
@@ -7,9 +7,9 @@ from rest_framework.parsers import MultiPartParser, FormParser
 from django.shortcuts import get_object_or_404
 from django.http import FileResponse
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Q
+from django.db.models import Q, Prefetch
 
-from .models import Sermon
+from .models import Sermon, SermonSayingLink
 from .serializers import (
     SermonListSerializer, 
     SermonDetailSerializer,
@@ -51,6 +51,12 @@ class SermonViewSet(viewsets.ModelViewSet):
             
             queryset = queryset.filter(query)
         
+        if self.action == 'retrieve':
+            # 연결된 말씀은 미리 계산된 테이블에서 한 번에 로드
+            queryset = queryset.prefetch_related(
+                Prefetch('saying_links', queryset=SermonSayingLink.objects.select_related('saying'))
+            )
+        
         return queryset
     
     def list(self, request, *args, **kwargs):
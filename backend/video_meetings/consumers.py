@@ -11,19 +11,82 @@ FIX-S3: new_producer 이벤트에 username 항상 포함
          참가자가 produce할 때 방장이 consumeProducer 시 username을 알 수 없던 문제 수정
 FIX-S4: sfu_consumed 응답에 producerId camelCase 보장
          waitForMessage 필터가 producerId로 매칭하므로 반드시 camelCase여야 함
+
+[일괄 요청] sfu_join_full     : join + send/recv transport + 기존 producers 를 한 응답으로
+           sfu_consume_batch : 여러 producer consume 을 동시에 (asyncio.gather)
+           sfu_resume_consumer_batch : 여러 consumer resume 을 동시에
+           (기존 단건 메시지는 그대로 지원)
+
+[SFU 이벤트] 제어 채널(sfu_client RPC)로 받은 producerClosed / transportClosed 를
+           sfu_notification 으로 받아 클라이언트에 producer_closed / sfu_transport_closed 로 전달
+
+[명단] 승인 여부 / 방장 / peer → username 은 roster.py 의 Redis 명단에서 읽음
+       (이벤트마다 DB 조회 없음 — 명단은 REST 뷰가 write-through)
+
+[그룹] 방 전체 + 내 사용자 그룹 + (방장이면) 방장 그룹에 가입 (groups.py)
+       - 받을 사람이 정해진 이벤트(참가 요청 / 승인 / 거부 / transportClosed)는 그 그룹으로
+       - 보낸 사람에게 필요 없는 방 전체 이벤트는 send_to_others() — 보낸 연결은 dispatch 에서 바로 버림
+
+[브로드캐스트] 방 전체 이벤트는 보내는 쪽이 클라이언트 메시지를 한 번만 인코딩 (frames.py)
+       받는 consumer 는 필터만 확인하고 event['frame'] 을 그대로 전송
+
+[코덱] 연결마다 JSON 텍스트 / MessagePack 바이너리 프레임 (subprotocol 'msgpack' 또는 ?codec=msgpack)
+       수신은 self.codec.decode, 송신은 send_message / send_frame 으로만
+
+[수신 처리] ROUTES 표 (type → 핸들러, 순서 키) 로 dispatcher.py 에 넘김
+       순서 키가 같은 메시지만 차례로, 다른 키는 동시에 → 느린 SFU 호출이 채팅 / ping 을 막지 않음
+       연결 종료 시 남은 처리는 취소
 """
 import asyncio
-import json
 import logging
 from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.db import database_sync_to_async
 from datetime import datetime
 from django.utils import timezone
 
-from . import sfu_client
+from . import frames, groups, roster, sfu_client
+from .dispatcher import KeyedDispatcher
 
 logger = logging.getLogger(__name__)
 
+# sfu_consume_batch / sfu_resume_consumer_batch 한 번에 처리하는 최대 개수
+# (참가자 50명 × audio/video 보다 넉넉하게)
+MAX_CONSUME_BATCH = 200
+BATCH_OVERFLOW    = f'batch limit {MAX_CONSUME_BATCH} exceeded — retry individually'
+
+
+def _keyed(prefix, field):
+    """메시지의 field 값별 순서 키 (예: transport 마다)"""
+    return lambda data: f'{prefix}:{data.get(field)}'
+
+
+# 메시지 type → (핸들러 이름, 순서 키)
+# 순서 키가 같으면 받은 순서대로 하나씩, 다르면 동시에. 키가 None 이면 receive 안에서 바로 실행
+ROUTES = {
+    'sfu_get_rtp_capabilities':  ('handle_get_rtp_capabilities', 'sfu'),
+    'sfu_join':                  ('handle_sfu_join', 'sfu'),
+    'sfu_join_full':             ('handle_sfu_join_full', 'sfu'),
+    'sfu_create_transport':      ('handle_create_transport', 'sfu'),
+    'sfu_connect_transport':     ('handle_connect_transport', _keyed('transport', 'transportId')),
+    'sfu_produce':               ('handle_produce', _keyed('transport', 'transportId')),
+    'sfu_consume':               ('handle_consume', _keyed('consume', 'producerId')),
+    'sfu_consume_batch':         ('handle_consume_batch', 'consume'),
+    'sfu_resume_consumer':       ('handle_resume_consumer', _keyed('consumer', 'consumerId')),
+    'sfu_resume_consumer_batch': ('handle_resume_consumer_batch', 'resume'),
+    'sfu_producer_pause':        ('handle_producer_pause', _keyed('producer', 'producerId')),
+    'sfu_producer_resume':       ('handle_producer_resume', _keyed('producer', 'producerId')),
+    'join':                      ('handle_join', 'join'),
+    'join_ready':                ('handle_join_ready', 'join'),
+    'track_state':               ('handle_track_state', _keyed('track', 'kind')),
+    'chat':                      ('handle_chat_message', 'chat'),
+    'reaction':                  ('handle_reaction', 'reaction'),
+    'raise_hand':                ('handle_raise_hand', 'hand'),
+    'lower_hand':                ('handle_lower_hand', 'hand'),
+    'screen_share_start':        ('handle_screen_share_start', 'screen_share'),
+    'screen_share_stop':         ('handle_screen_share_stop', 'screen_share'),
+    'ping':                      ('handle_ping', None),
+}
+
 
 class VideoMeetingConsumer(AsyncWebsocketConsumer):
 
@@ -33,23 +96,34 @@ class VideoMeetingConsumer(AsyncWebsocketConsumer):
 
     async def connect(self):
         try:
+            self.dispatcher = KeyedDispatcher()
             self.room_id = self.scope['url_route']['kwargs']['room_id']
-            self.room_group_name = f'video_room_{self.room_id}'
+            self.room_group_name = groups.room_group(self.room_id)
             self.user = self.scope.get('user')
 
             if not self.user or not self.user.is_authenticated:
                 await self.close(code=4001)
                 return
 
+            self.codec, subprotocol = frames.negotiate(self.scope)
             self.user_id = self.user.id
             self.username = self.user.username
             self.peer_id = f"user_{self.user_id}"
 
-            await self.channel_layer.group_add(self.room_group_name, self.channel_name)
-            await self.accept()
+            # 방장은 바뀌지 않으므로 연결 시 한 번만 확인
+            room_roster  = await self.get_roster()
+            self.is_host = room_roster.is_host(self.user_id)
+
+            self.group_names = [self.room_group_name, groups.user_group(self.user_id)]
+            if self.is_host:
+                self.group_names.append(groups.hosts_group(self.room_id))
+            await asyncio.gather(*(
+                self.channel_layer.group_add(group, self.channel_name) for group in self.group_names
+            ))
+            await self.accept(subprotocol)
 
             logger.info(f"WS connected: {self.username} → room {self.room_id}")
-            await self.send_current_participants()
+            await self.send_current_participants(room_roster)
 
         except Exception as e:
             logger.error(f"connect error: {e}", exc_info=True)
@@ -57,61 +131,85 @@ class VideoMeetingConsumer(AsyncWebsocketConsumer):
 
     async def disconnect(self, close_code):
         try:
+            if hasattr(self, 'dispatcher'):
+                await self.dispatcher.close()   # 진행 중인 SFU 요청 등 취소
+
             username = getattr(self, 'username', None)
             peer_id  = getattr(self, 'peer_id',   None)
 
             if username and hasattr(self, 'room_group_name'):
+                if getattr(self, 'screen_sharing', False):
+                    await self.handle_screen_share_stop({})
                 if peer_id:
                     await sfu_client.leave_room(self.room_id, peer_id)
-
-                await self.channel_layer.group_send(
-                    self.room_group_name,
-                    {
-                        'type':    'user_left',
-                        'username': username,
-                        'user_id':  self.user_id,
-                        'peerId':  peer_id,
-                    }
-                )
-                await self.channel_layer.group_discard(self.room_group_name, self.channel_name)
+                if getattr(self, 'sfu_subscribed', False):
+                    await sfu_client.unsubscribe_room(self.room_id)
+
+                await self.send_to_others(frames.broadcast('user_left', {
+                    'type':     'user_left',
+                    'username': username,
+                    'user_id':  self.user_id,
+                    'peerId':   peer_id,
+                }))
+                await asyncio.gather(*(
+                    self.channel_layer.group_discard(group, self.channel_name)
+                    for group in getattr(self, 'group_names', [self.room_group_name])
+                ))
 
         except Exception as e:
             logger.error(f"disconnect error: {e}", exc_info=True)
 
+    async def send_message(self, message):
+        """클라이언트로 메시지 하나 — 연결의 코덱으로 인코딩"""
+        if self.codec.binary:
+            await self.send(bytes_data=self.codec.encode(message))
+        else:
+            await self.send(text_data=self.codec.encode(message))
+
+    async def send_frame(self, frame):
+        """frames.broadcast 로 미리 인코딩한 JSON frame 전송 (MessagePack 연결이면 변환)"""
+        if self.codec.binary:
+            await self.send(bytes_data=self.codec.from_frame(frame))
+        else:
+            await self.send(text_data=frame)
+
+    async def send_to_others(self, event):
+        """방 전체에서 이 연결만 빼고 — channel layer 에는 제외 기능이 없어 표시만 하고 dispatch 에서 버림"""
+        await self.channel_layer.group_send(
+            self.room_group_name, {**event, 'exclude_channel': self.channel_name}
+        )
+
+    async def dispatch(self, message):
+        # send_to_others 로 내가 보낸 이벤트 — 핸들러 / JSON 직렬화 / 전송 없이 버림
+        if message.get('exclude_channel') == self.channel_name:
+            return
+        await super().dispatch(message)
+
     # ──────────────────────────────────────────────────────────
     # 메시지 수신 라우터
     # ──────────────────────────────────────────────────────────
 
-    async def receive(self, text_data):
+    async def receive(self, text_data=None, bytes_data=None):
         try:
-            data     = json.loads(text_data)
+            data     = self.codec.decode(text_data, bytes_data)
             msg_type = data.get('type')
             if not msg_type:
                 return
 
-            if   msg_type == 'sfu_get_rtp_capabilities': await self.handle_get_rtp_capabilities()
-            elif msg_type == 'sfu_join':                 await self.handle_sfu_join(data)
-            elif msg_type == 'sfu_create_transport':     await self.handle_create_transport(data)
-            elif msg_type == 'sfu_connect_transport':    await self.handle_connect_transport(data)
-            elif msg_type == 'sfu_produce':              await self.handle_produce(data)
-            elif msg_type == 'sfu_consume':              await self.handle_consume(data)
-            elif msg_type == 'sfu_resume_consumer':      await self.handle_resume_consumer(data)
-            elif msg_type == 'sfu_producer_pause':       await self.handle_producer_pause(data)
-            elif msg_type == 'sfu_producer_resume':      await self.handle_producer_resume(data)
-            elif msg_type == 'join':                     await self.handle_join(data)
-            elif msg_type == 'join_ready':               await self.handle_join_ready(data)
-            elif msg_type == 'track_state':              await self.handle_track_state(data)
-            elif msg_type == 'chat':                     await self.handle_chat_message(data)
-            elif msg_type == 'reaction':                 await self.handle_reaction(data)
-            elif msg_type == 'raise_hand':               await self.handle_raise_hand(data)
-            elif msg_type == 'lower_hand':               await self.handle_lower_hand(data)
-            elif msg_type == 'ping':
-                await self.send(text_data=json.dumps({'type': 'pong'}))
-            else:
+            route = ROUTES.get(msg_type)
+            if route is None:
                 logger.warning(f"Unknown message type: {msg_type}")
+                return
+
+            name, key = route
+            handler   = getattr(self, name)
+            if key is None:
+                await handler(data)
+            else:
+                await self.dispatcher.submit(key(data) if callable(key) else key, handler, data)
 
-        except json.JSONDecodeError:
-            logger.error("JSON decode error")
+        except ValueError:   # JSONDecodeError, msgpack 형식 오류 모두 ValueError
+            logger.error(f"{self.codec.name} decode error")
         except Exception as e:
             logger.error(f"receive error: {e}", exc_info=True)
 
@@ -119,13 +217,16 @@ class VideoMeetingConsumer(AsyncWebsocketConsumer):
     # SFU 시그널링 핸들러
     # ──────────────────────────────────────────────────────────
 
-    async def handle_get_rtp_capabilities(self):
+    async def handle_ping(self, data):
+        await self.send_message({'type': 'pong'})
+
+    async def handle_get_rtp_capabilities(self, data):
         try:
             rtp_capabilities = await sfu_client.get_rtp_capabilities(self.room_id)
-            await self.send(text_data=json.dumps({
+            await self.send_message({
                 'type': 'sfu_rtp_capabilities',
                 'rtpCapabilities': rtp_capabilities,
-            }))
+            })
         except Exception as e:
             await self._send_error('sfu_get_rtp_capabilities', str(e))
 
@@ -133,16 +234,19 @@ class VideoMeetingConsumer(AsyncWebsocketConsumer):
         """
         FIX-S2: 기존 producers에 username 항상 포함.
         sfu_client.join_room()이 반환하는 producers 목록의 각 producer에
-        peerId를 통해 DB에서 username을 조회하여 추가.
+        peerId를 통해 명단에서 username을 한 번에 찾아 추가.
         """
         try:
             result = await sfu_client.join_room(self.room_id, self.peer_id)
+            await self._subscribe_sfu_events()
+
+            # FIX-B2 + FIX-S2: camelCase/snake_case 혼용 대응, username 반드시 포함
+            peer_ids  = [p.get('peerId') or p.get('peer_id', '') for p in result['producers']]
+            usernames = await self.get_usernames_for_peers(set(peer_ids))
 
             producers_with_username = []
-            for p in result['producers']:
-                # FIX-B2 + FIX-S2: camelCase/snake_case 혼용 대응, username 반드시 포함
-                peer_id  = p.get('peerId') or p.get('peer_id', '')
-                username = await self.get_username_by_peer_id(peer_id)
+            for p, peer_id in zip(result['producers'], peer_ids):
+                username = usernames.get(peer_id, peer_id)
                 producers_with_username.append({
                     'peerId':     peer_id,
                     'producerId': p.get('producerId') or p.get('producer_id', ''),
@@ -151,24 +255,49 @@ class VideoMeetingConsumer(AsyncWebsocketConsumer):
                     'username':   username,  # FIX-S2: username 항상 포함
                 })
 
-            await self.send(text_data=json.dumps({
+            await self.send_message({
                 'type': 'sfu_joined',
                 'rtpCapabilities': result['rtpCapabilities'],
                 'producers': producers_with_username,
-            }))
+            })
 
-            await self.channel_layer.group_send(
-                self.room_group_name,
-                {
-                    'type':     'peer_joined',
-                    'peerId':   self.peer_id,
-                    'username': self.username,
-                    'userId':   self.user_id,
-                }
-            )
+            await self._announce_peer_joined()
         except Exception as e:
             await self._send_error('sfu_join', str(e))
 
+    async def handle_sfu_join_full(self, data):
+        """
+        join + transport 2개 + 기존 producers(username 포함)를 한 번에 응답.
+        transport 생성은 peer 등록 뒤에만 가능하므로 join 후
+        send/recv transport 생성과 username 조회를 동시에 실행.
+        (기존: capabilities → join → send transport → recv transport 왕복 4회 순차)
+        """
+        try:
+            joined   = await sfu_client.join_room(self.room_id, self.peer_id)
+            peer_ids = [p['peerId'] for p in joined['producers']]
+
+            send_params, recv_params, usernames, _ = await asyncio.gather(
+                sfu_client.create_transport(self.room_id, self.peer_id),
+                sfu_client.create_transport(self.room_id, self.peer_id),
+                self.get_usernames_for_peers(set(peer_ids)),
+                self._subscribe_sfu_events(),
+            )
+
+            await self.send_message({
+                'type':            'sfu_joined_full',
+                'rtpCapabilities': joined['rtpCapabilities'],
+                'sendTransport':   {'direction': 'send', **send_params},
+                'recvTransport':   {'direction': 'recv', **recv_params},
+                'producers': [
+                    {**p, 'username': usernames.get(p['peerId'], p['peerId'])}
+                    for p in joined['producers']
+                ],
+            })
+
+            await self._announce_peer_joined()
+        except Exception as e:
+            await self._send_error('sfu_join_full', str(e))
+
     async def handle_create_transport(self, data):
         """
         FIX-S1: 응답에 direction 필드 추가.
@@ -178,11 +307,11 @@ class VideoMeetingConsumer(AsyncWebsocketConsumer):
         try:
             direction = data.get('direction', 'send')  # FIX-S1: direction 읽기
             transport_params = await sfu_client.create_transport(self.room_id, self.peer_id)
-            await self.send(text_data=json.dumps({
+            await self.send_message({
                 'type':      'sfu_transport_created',
                 'direction': direction,  # FIX-S1: direction 반드시 응답에 포함
                 **transport_params,
-            }))
+            })
         except Exception as e:
             await self._send_error('sfu_create_transport', str(e))
 
@@ -194,10 +323,10 @@ class VideoMeetingConsumer(AsyncWebsocketConsumer):
                 data['transportId'],
                 data['dtlsParameters'],
             )
-            await self.send(text_data=json.dumps({
+            await self.send_message({
                 'type':        'sfu_transport_connected',
                 'transportId': data['transportId'],
-            }))
+            })
         except Exception as e:
             await self._send_error('sfu_connect_transport', str(e))
 
@@ -218,24 +347,21 @@ class VideoMeetingConsumer(AsyncWebsocketConsumer):
             )
             producer_id = result['id']
 
-            await self.send(text_data=json.dumps({
+            await self.send_message({
                 'type': 'sfu_produced',
                 'id':   producer_id,
                 'kind': data['kind'],
-            }))
+            })
 
             # FIX-S3: username 포함하여 브로드캐스트
-            await self.channel_layer.group_send(
-                self.room_group_name,
-                {
-                    'type':       'new_producer',
-                    'peerId':     self.peer_id,
-                    'username':   self.username,  # FIX-S3: username 반드시 포함
-                    'userId':     self.user_id,
-                    'producerId': producer_id,
-                    'kind':       data['kind'],
-                }
-            )
+            await self.send_to_others(frames.broadcast('new_producer', {
+                'type':       'new_producer',
+                'peerId':     self.peer_id,
+                'username':   self.username,  # FIX-S3: username 반드시 포함
+                'userId':     self.user_id,
+                'producerId': producer_id,
+                'kind':       data['kind'],
+            }, peerId=self.peer_id))
         except Exception as e:
             await self._send_error('sfu_produce', str(e))
 
@@ -257,14 +383,14 @@ class VideoMeetingConsumer(AsyncWebsocketConsumer):
             )
 
             # FIX-S4: producerId camelCase 보장 (서버 응답이 snake_case일 수 있으므로 명시적 매핑)
-            await self.send(text_data=json.dumps({
+            await self.send_message({
                 'type':          'sfu_consumed',
                 'id':            result.get('id'),
                 'producerId':    result.get('producerId') or result.get('producer_id') or data['producerId'],  # FIX-S4
                 'kind':          result.get('kind'),
                 'rtpParameters': result.get('rtpParameters') or result.get('rtp_parameters'),
                 'producerPeerId': data['producerPeerId'],
-            }))
+            })
         except Exception as e:
             logger.error(
                 f"handle_consume failed: consumer={self.peer_id} "
@@ -272,49 +398,89 @@ class VideoMeetingConsumer(AsyncWebsocketConsumer):
             )
             await self._send_error('sfu_consume', str(e))
 
+    async def handle_consume_batch(self, data):
+        """
+        여러 producer 를 한 번에 consume.
+        data: { requestId, transportId, rtpCapabilities, producers: [{ producerId, producerPeerId }] }
+        응답: sfu_consumed_batch { consumers: [...], failed: [...] } — 실패한 것만 단건 재시도
+        MAX_CONSUME_BATCH 를 넘는 producer 는 처리하지 않고 failed 로 돌려줌 (클라이언트가 단건 재시도)
+        """
+        try:
+            producers = [
+                {
+                    'producerId':     p['producerId'],
+                    'producerPeerId': p['producerPeerId'],
+                }
+                for p in data.get('producers', [])
+                if p.get('producerPeerId') != self.peer_id
+            ]
+            producers, overflow = producers[:MAX_CONSUME_BATCH], producers[MAX_CONSUME_BATCH:]
+            consumers, failed = await sfu_client.create_consumers(
+                self.room_id,
+                self.peer_id,
+                data['transportId'],
+                data['rtpCapabilities'],
+                producers,
+            )
+            for f in failed:
+                logger.error(
+                    f"handle_consume_batch failed: consumer={self.peer_id} "
+                    f"producer={f['producerId']} err={f['message']}"
+                )
+            failed += [{**p, 'message': BATCH_OVERFLOW} for p in overflow]
+
+            await self.send_message({
+                'type':      'sfu_consumed_batch',
+                'requestId': data.get('requestId'),
+                'consumers': consumers,
+                'failed':    failed,
+            })
+        except Exception as e:
+            await self._send_error('sfu_consume_batch', str(e))
+
     async def handle_resume_consumer(self, data):
         try:
             await sfu_client.resume_consumer(self.room_id, self.peer_id, data['consumerId'])
-            await self.send(text_data=json.dumps({
+            await self.send_message({
                 'type':       'sfu_consumer_resumed',
                 'consumerId': data['consumerId'],
-            }))
+            })
         except Exception as e:
             await self._send_error('sfu_resume_consumer', str(e))
 
+    async def handle_resume_consumer_batch(self, data):
+        try:
+            consumer_ids = data.get('consumerIds', [])
+            resumed, failed = await sfu_client.resume_consumers(
+                self.room_id,
+                self.peer_id,
+                consumer_ids[:MAX_CONSUME_BATCH],
+            )
+            # 한도를 넘은 consumer 는 resume 하지 않았음을 알림
+            failed += [
+                {'consumerId': consumer_id, 'message': BATCH_OVERFLOW}
+                for consumer_id in consumer_ids[MAX_CONSUME_BATCH:]
+            ]
+            await self.send_message({
+                'type':        'sfu_consumers_resumed',
+                'requestId':   data.get('requestId'),
+                'consumerIds': resumed,
+                'failed':      failed,
+            })
+        except Exception as e:
+            await self._send_error('sfu_resume_consumer_batch', str(e))
+
     async def handle_producer_pause(self, data):
         try:
             await sfu_client.pause_producer(self.room_id, self.peer_id, data['producerId'])
-            await self.channel_layer.group_send(
-                self.room_group_name,
-                {
-                    'type':      'track_state_changed',
-                    'username':  self.username,
-                    'user_id':   self.user_id,
-                    'peerId':    self.peer_id,
-                    'kind':      data.get('kind'),
-                    'enabled':   False,
-                    'timestamp': datetime.now().isoformat(),
-                }
-            )
+            await self._announce_track_state(data.get('kind'), False)
         except Exception as e:
             await self._send_error('sfu_producer_pause', str(e))
 
     async def handle_producer_resume(self, data):
         try:
             await sfu_client.resume_producer(self.room_id, self.peer_id, data['producerId'])
-            await self.channel_layer.group_send(
-                self.room_group_name,
-                {
-                    'type':      'track_state_changed',
-                    'username':  self.username,
-                    'user_id':   self.user_id,
-                    'peerId':    self.peer_id,
-                    'kind':      data.get('kind'),
-                    'enabled':   True,
-                    'timestamp': datetime.now().isoformat(),
-                }
-            )
+            await self._announce_track_state(data.get('kind'), True)
         except Exception as e:
             await self._send_error('sfu_producer_resume', str(e))
 
@@ -322,74 +488,57 @@ class VideoMeetingConsumer(AsyncWebsocketConsumer):
     # Channel Layer 이벤트 핸들러
     # ──────────────────────────────────────────────────────────
 
+    # peerId / username 비교는 같은 사용자의 다른 탭(연결)을 위한 것
+    # (보낸 연결 자체는 send_to_others 로 dispatch 에서 이미 제외)
+
     async def peer_joined(self, event):
         if event['peerId'] != self.peer_id:
-            await self.send(text_data=json.dumps({
-                'type':     'peer_joined',
-                'peerId':   event['peerId'],
-                'username': event['username'],
-                'userId':   event['userId'],
-            }))
+            await self.send_frame(event['frame'])
 
     async def new_producer(self, event):
         if event['peerId'] != self.peer_id:
-            await self.send(text_data=json.dumps({
-                'type':       'new_producer',
-                'peerId':     event['peerId'],
-                'username':   event['username'],
-                'userId':     event['userId'],
-                'producerId': event['producerId'],
-                'kind':       event['kind'],
-            }))
+            await self.send_frame(event['frame'])
 
     async def track_state_changed(self, event):
         if event['username'] != self.username:
-            await self.send(text_data=json.dumps({
-                'type':      'track_state',
-                'username':  event['username'],
-                'user_id':   event['user_id'],
-                'peerId':    event.get('peerId', f"user_{event['user_id']}"),
-                'kind':      event['kind'],
-                'enabled':   event['enabled'],
-                'timestamp': event.get('timestamp'),
-            }))
+            await self.send_frame(event['frame'])
 
     async def user_left(self, event):
-        peer_id = event.get('peerId') or f"user_{event['user_id']}"
-        await self.send(text_data=json.dumps({
-            'type':     'user_left',
-            'username': event['username'],
-            'user_id':  event['user_id'],
-            'peerId':   peer_id,
-        }))
+        await self.send_frame(event['frame'])
+
+    async def sfu_notification(self, event):
+        """SFU 서버 이벤트 (sfu_client 제어 채널 → channel layer)"""
+        kind = event.get('event')
+        if kind == 'producerClosed' and event.get('peerId') != self.peer_id:
+            await self.send_message({
+                'type':       'producer_closed',
+                'peerId':     event.get('peerId'),
+                'producerId': event.get('producerId'),
+                'kind':       event.get('kind'),
+            })
+        elif (kind == 'transportClosed' and event.get('peerId') == self.peer_id
+              and str(event.get('roomId')) == str(self.room_id)):
+            await self.send_message({
+                'type':        'sfu_transport_closed',
+                'transportId': event.get('transportId'),
+            })
 
     async def meeting_ended(self, event):
-        await self.send(text_data=json.dumps({
-            'type':      'meeting_ended',
-            'message':   event['message'],
-            'ended_by':  event.get('ended_by'),
-        }))
+        await self.send_frame(event['frame'])
 
     # ──────────────────────────────────────────────────────────
     # 기존 참가 승인 흐름
     # ──────────────────────────────────────────────────────────
 
     async def handle_join(self, data):
-        is_approved = await self.check_is_approved()
+        room_roster = await self.get_roster()
+        is_approved = room_roster.is_approved(self.user_id)
 
         if is_approved:
-            await self.channel_layer.group_send(
-                self.room_group_name,
-                {
-                    'type':     'peer_joined',
-                    'peerId':   self.peer_id,
-                    'username': self.username,
-                    'userId':   self.user_id,
-                }
-            )
+            await self._announce_peer_joined()
         else:
             await self.channel_layer.group_send(
-                self.room_group_name,
+                groups.hosts_group(self.room_id),
                 {
                     'type':         'join_request_notification',
                     'participant_id': self.user_id,
@@ -400,37 +549,19 @@ class VideoMeetingConsumer(AsyncWebsocketConsumer):
 
     async def handle_join_ready(self, data):
         logger.info(f"join_ready received from {self.username} (SFU mode)")
-        await self.channel_layer.group_send(
-            self.room_group_name,
-            {
-                'type':     'peer_joined',
-                'peerId':   self.peer_id,
-                'username': self.username,
-                'userId':   self.user_id,
-            }
-        )
+        await self._announce_peer_joined()
 
     async def handle_track_state(self, data):
-        track_kind = data.get('kind')
-        enabled    = data.get('enabled')
-        await self.channel_layer.group_send(
-            self.room_group_name,
-            {
-                'type':      'track_state_changed',
-                'username':  self.username,
-                'user_id':   self.user_id,
-                'peerId':    self.peer_id,
-                'kind':      track_kind,
-                'enabled':   enabled,
-                'timestamp': datetime.now().isoformat(),
-            }
-        )
+        await self._announce_track_state(data.get('kind'), data.get('enabled'))
+
+    # 승인 / 거부는 video_user_ 그룹으로 옴 — 다른 방에 연결한 같은 사용자는 room_id 로 제외
 
     async def approval_notification(self, event):
         participant_user_id = event.get('participant_user_id')
         try:
-            if int(participant_user_id) == int(self.user_id):
-                await self.send(text_data=json.dumps({
+            if (int(participant_user_id) == int(self.user_id)
+                    and str(event.get('room_id')) == str(self.room_id)):
+                await self.send_message({
                     'type':                 'approval_notification',
                     'approved':             True,
                     'message':              event['message'],
@@ -439,27 +570,28 @@ class VideoMeetingConsumer(AsyncWebsocketConsumer):
                     'participant_username': event.get('participant_username'),
                     'participant_user_id':  participant_user_id,
                     'should_initialize':    True,
-                }))
+                })
         except (ValueError, TypeError) as e:
             logger.error(f"approval_notification error: {e}")
 
     async def join_request_notification(self, event):
-        is_host = await self.check_is_host()
-        if is_host:
-            await self.send(text_data=json.dumps({
+        if getattr(self, 'is_host', False):
+            await self.send_message({
                 'type':           'join_request_notification',
                 'participant_id': event['participant_id'],
                 'username':       event['username'],
                 'message':        event['message'],
-            }))
+            })
 
     async def rejection_notification(self, event):
-        if int(event.get('participant_user_id')) == int(self.user_id):
-            await self.send(text_data=json.dumps({
+        participant_user_id = event.get('participant_user_id')
+        if (participant_user_id is not None and int(participant_user_id) == int(self.user_id)
+                and str(event.get('room_id')) == str(self.room_id)):
+            await self.send_message({
                 'type':     'rejection_notification',
                 'rejected': True,
                 'message':  event['message'],
-            }))
+            })
 
     # ──────────────────────────────────────────────────────────
     # 채팅 / 반응 / 손들기
@@ -472,25 +604,18 @@ class VideoMeetingConsumer(AsyncWebsocketConsumer):
         msg_id = await self.save_chat_message(content)
         await self.channel_layer.group_send(
             self.room_group_name,
-            {
-                'type':       'chat_message',
-                'username':   self.username,
-                'user_id':    self.user_id,
-                'content':    content,
-                'message_id': msg_id,
-                'timestamp':  datetime.now().isoformat(),
-            }
+            frames.broadcast('chat_message', {
+                'type':            'chat_message',
+                'sender_username': self.username,
+                'sender_user_id':  self.user_id,
+                'content':         content,
+                'message_id':      msg_id,
+                'timestamp':       datetime.now().isoformat(),
+            })
         )
 
     async def chat_message(self, event):
-        await self.send(text_data=json.dumps({
-            'type':            'chat_message',
-            'sender_username': event['username'],
-            'sender_user_id':  event['user_id'],
-            'content':         event['content'],
-            'message_id':      event['message_id'],
-            'timestamp':       event['timestamp'],
-        }))
+        await self.send_frame(event['frame'])
 
     async def handle_reaction(self, data):
         reaction_type = data.get('reaction_type')
@@ -498,41 +623,53 @@ class VideoMeetingConsumer(AsyncWebsocketConsumer):
             await self.save_reaction(reaction_type)
             await self.channel_layer.group_send(
                 self.room_group_name,
-                {'type': 'reaction_event', 'username': self.username,
-                 'user_id': self.user_id, 'reaction_type': reaction_type}
+                frames.broadcast('reaction_event', {
+                    'type': 'reaction', 'username': self.username,
+                    'user_id': self.user_id, 'reaction_type': reaction_type,
+                })
             )
 
     async def reaction_event(self, event):
-        await self.send(text_data=json.dumps({
-            'type':          'reaction',
-            'username':      event['username'],
-            'user_id':       event['user_id'],
-            'reaction_type': event['reaction_type'],
-        }))
+        await self.send_frame(event['frame'])
 
     async def handle_raise_hand(self, data):
         await self.save_raise_hand(True)
         await self.channel_layer.group_send(
             self.room_group_name,
-            {'type': 'hand_raised', 'username': self.username, 'user_id': self.user_id}
+            frames.broadcast('hand_raised', {
+                'type': 'raise_hand', 'username': self.username, 'user_id': self.user_id,
+            })
         )
 
     async def handle_lower_hand(self, data):
         await self.save_raise_hand(False)
         await self.channel_layer.group_send(
             self.room_group_name,
-            {'type': 'hand_lowered', 'username': self.username, 'user_id': self.user_id}
+            frames.broadcast('hand_lowered', {
+                'type': 'lower_hand', 'username': self.username, 'user_id': self.user_id,
+            })
         )
 
     async def hand_raised(self, event):
-        await self.send(text_data=json.dumps(
-            {'type': 'raise_hand', 'username': event['username'], 'user_id': event['user_id']}
-        ))
+        await self.send_frame(event['frame'])
 
     async def hand_lowered(self, event):
-        await self.send(text_data=json.dumps(
-            {'type': 'lower_hand', 'username': event['username'], 'user_id': event['user_id']}
-        ))
+        await self.send_frame(event['frame'])
+
+    # ──────────────────────────────────────────────────────────
+    # 화면 공유 (VideoRoom.screen_sharing_user + 명단 screen_share_id)
+    # ──────────────────────────────────────────────────────────
+
+    # 상태만 저장 — 다른 참가자는 화면 공유 producer 의 new_producer 이벤트로 알게 되므로 방 전체 전송 없음
+
+    async def handle_screen_share_start(self, data):
+        await self.save_screen_share(True)
+        self.screen_sharing = True
+
+    async def handle_screen_share_stop(self, data):
+        # 내가 공유 중일 때만 지움 (다른 사람이 이어서 시작했으면 그대로)
+        await self.save_screen_share(False)
+        self.screen_sharing = False
 
     # ──────────────────────────────────────────────────────────
     # 유틸리티
@@ -540,50 +677,51 @@ class VideoMeetingConsumer(AsyncWebsocketConsumer):
 
     async def _send_error(self, request_type: str, message: str):
         logger.error(f"SFU error [{request_type}]: {message}")
-        await self.send(text_data=json.dumps({
+        await self.send_message({
             'type':    'sfu_error',
             'request': request_type,
             'message': message,
-        }))
-
-    async def send_current_participants(self):
-        participants = await self.get_approved_participants()
-        await self.send(text_data=json.dumps({
+        })
+
+    async def _announce_peer_joined(self):
+        await self.send_to_others(frames.broadcast('peer_joined', {
+            'type':     'peer_joined',
+            'peerId':   self.peer_id,
+            'username': self.username,
+            'userId':   self.user_id,
+        }, peerId=self.peer_id))
+
+    async def _announce_track_state(self, kind, enabled):
+        await self.send_to_others(frames.broadcast('track_state_changed', {
+            'type':      'track_state',
+            'username':  self.username,
+            'user_id':   self.user_id,
+            'peerId':    self.peer_id,
+            'kind':      kind,
+            'enabled':   enabled,
+            'timestamp': datetime.now().isoformat(),
+        }, username=self.username))
+
+    async def _subscribe_sfu_events(self):
+        if not getattr(self, 'sfu_subscribed', False):
+            self.sfu_subscribed = True
+            await sfu_client.subscribe_room(self.room_id)
+
+    async def send_current_participants(self, room_roster=None):
+        room_roster = room_roster or await self.get_roster()
+        await self.send_message({
             'type':         'participants_list',
-            'participants': participants,
-        }))
-
-    @database_sync_to_async
-    def check_is_host(self):
-        from .models import VideoRoom
-        try:
-            return VideoRoom.objects.get(id=self.room_id).host == self.user
-        except Exception:
-            return False
+            'participants': room_roster.participants(),
+        })
 
     @database_sync_to_async
-    def check_is_approved(self):
-        from .models import VideoRoom, RoomParticipant
-        try:
-            room = VideoRoom.objects.get(id=self.room_id)
-            if room.host == self.user:
-                return True
-            return RoomParticipant.objects.filter(
-                room_id=self.room_id,
-                user=self.user,
-                status='approved',
-            ).exists()
-        except Exception:
-            return False
+    def get_roster(self):
+        # Redis 명단 (없을 때만 DB 에서 채움)
+        return roster.get(self.room_id)
 
     @database_sync_to_async
-    def get_approved_participants(self):
-        from .models import RoomParticipant
-        return list(
-            RoomParticipant.objects.filter(
-                room_id=self.room_id, status='approved'
-            ).values('user__username', 'user__id')
-        )
+    def get_usernames_for_peers(self, peer_ids):
+        return roster.get(self.room_id).usernames_for_peers(peer_ids)
 
     @database_sync_to_async
     def save_chat_message(self, content):
@@ -613,10 +751,14 @@ class VideoMeetingConsumer(AsyncWebsocketConsumer):
         )
 
     @database_sync_to_async
-    def get_username_by_peer_id(self, peer_id: str) -> str:
-        from django.contrib.auth.models import User
-        try:
-            user_id = int(peer_id.replace('user_', ''))
-            return User.objects.get(id=user_id).username
-        except (ValueError, User.DoesNotExist):
-            return peer_id
\ No newline at end of file
+    def save_screen_share(self, is_sharing):
+        """시작: 공유자를 나로 / 종료: 내가 공유자일 때만 지움. 바뀌었으면 True"""
+        from .models import VideoRoom
+        rooms = VideoRoom.objects.filter(id=self.room_id)
+        if is_sharing:
+            changed = rooms.update(screen_sharing_user_id=self.user_id)
+        else:
+            changed = rooms.filter(screen_sharing_user_id=self.user_id).update(screen_sharing_user=None)
+        if changed:
+            roster.set_screen_share(self.room_id, self.user_id if is_sharing else None)
+        return bool(changed)
@@ -0,0 +1,71 @@
+# backend/video_meetings/dispatcher.py
+"""
+WebSocket 연결 하나의 수신 메시지 처리 — 순서 키별 직렬, 키가 다르면 동시에
+
+[기존] receive 가 핸들러를 차례로 await → SFU 호출 하나가 느리면 (읽기 타임아웃 최대 15초)
+       그 연결의 채팅 / ping / track_state 까지 전부 대기 (head-of-line blocking)
+[지금] 핸들러를 태스크로 실행
+  - 순서 키가 같은 메시지는 받은 순서대로 하나씩 (같은 transport 의 connect → produce,
+    같은 producer 의 pause → resume, 채팅 순서 등)
+  - 키가 다르면 기다리지 않음
+  - 연결마다 동시에 MAX_IN_FLIGHT 개까지 (대기 중인 것 포함) — 넘으면 submit 이 자리가 날 때까지 기다림
+    (그동안 이 연결의 다음 메시지를 읽지 않음 — 백프레셔)
+  - close() 로 남은 태스크 전부 취소 (연결 종료 시)
+
+핸들러는 오류를 스스로 클라이언트에 보내는 것을 전제로 함 — 여기서는 놓친 예외만 로그
+"""
+
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+MAX_IN_FLIGHT = 32
+
+
+class KeyedDispatcher:
+
+    def __init__(self, max_in_flight=MAX_IN_FLIGHT):
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._tails: dict[str, asyncio.Task] = {}   # 키 → 그 키의 마지막 태스크
+        self._tasks: set[asyncio.Task] = set()
+        self._closed = False
+
+    @property
+    def in_flight(self):
+        return len(self._tasks)
+
+    async def submit(self, key, handler, *args):
+        """handler(*args) 를 태스크로 — 같은 key 의 앞 태스크가 끝난 뒤 실행"""
+        await self._slots.acquire()
+        if self._closed:
+            self._slots.release()
+            return
+        previous = self._tails.get(key)
+        task = asyncio.ensure_future(self._run(previous, handler, args))
+        self._tails[key] = task
+        self._tasks.add(task)
+        task.add_done_callback(lambda done: self._finished(key, done))
+
+    async def _run(self, previous, handler, args):
+        if previous is not None and not previous.done():
+            # 앞 태스크가 실패 / 취소돼도 이어서 실행
+            await asyncio.wait([previous])
+        await handler(*args)
+
+    def _finished(self, key, task):
+        self._tasks.discard(task)
+        if self._tails.get(key) is task:
+            del self._tails[key]
+        self._slots.release()
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"dispatch error [{key}]: {task.exception()}", exc_info=task.exception())
+
+    async def close(self):
+        """남은 태스크 전부 취소하고 끝날 때까지 대기"""
+        self._closed = True
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
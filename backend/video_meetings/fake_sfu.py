@@ -0,0 +1,352 @@
+# backend/video_meetings/fake_sfu.py
+"""
+mediasoup SFU 대역 (테스트 / 로컬 개발용, 미디어 없음)
+
+mediasoup/src/server.js 의 REST API, rpc.js 의 JSON-RPC 제어 채널과 같은
+경로·메서드·응답·이벤트를 메모리 안의 방/peer/transport/producer/consumer 로 흉내 낸다.
+sfu_client 를 실제 SFU 없이 돌려 보거나 (bench_meeting 부하 측정)
+연결 끊김·재연결을 확인할 때 사용.
+
+    sfu = FakeSFU(latency=0.005)
+    server = await sfu.serve_rpc('127.0.0.1', 3001)
+    await sfu.serve_http('127.0.0.1', 3000)
+    ...
+    await sfu.close_producer(room_id, peer_id, producer_id)   # producerClosed 이벤트
+    await sfu.drop_connections()                              # 연결 끊김 재현
+
+실행: python manage.py run_fake_sfu --http-port 3000 --rpc-port 3001
+      노드 여러 대는 포트를 바꿔 여러 번 실행 (MEDIASOUP_NODES 로 지정)
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# 실제 router 와 같은 모양의 최소 capabilities (opus + VP8)
+RTP_CAPABILITIES = {
+    'codecs': [
+        {'kind': 'audio', 'mimeType': 'audio/opus', 'clockRate': 48000, 'channels': 2,
+         'preferredPayloadType': 100, 'parameters': {}, 'rtcpFeedback': []},
+        {'kind': 'video', 'mimeType': 'video/VP8', 'clockRate': 90000,
+         'preferredPayloadType': 101, 'parameters': {}, 'rtcpFeedback': []},
+    ],
+    'headerExtensions': [],
+}
+
+
+# rpc.js methods (subscribe / unsubscribe 는 연결 단위라 따로 처리)
+RPC_METHODS = frozenset({
+    'getRtpCapabilities', 'join', 'leave', 'createTransport', 'connectTransport',
+    'produce', 'pauseProducer', 'resumeProducer', 'consume', 'resumeConsumer', 'getProducers',
+})
+
+
+# server.js REST 경로 → 메서드 (경로 변수는 인자로)
+_ROOM = r'^/rooms/(?P<roomId>[^/]+)'
+_PEER = _ROOM + r'/peers/(?P<peerId>[^/]+)'
+HTTP_ROUTES = [
+    ('GET',    re.compile(r'^/health$'),                                          'health'),
+    ('GET',    re.compile(_ROOM + r'/rtp-capabilities$'),                         'getRtpCapabilities'),
+    ('POST',   re.compile(_ROOM + r'/peers$'),                                    'join'),
+    ('DELETE', re.compile(_PEER + r'$'),                                          'leave'),
+    ('POST',   re.compile(_PEER + r'/transports$'),                               'createTransport'),
+    ('POST',   re.compile(_PEER + r'/transports/(?P<transportId>[^/]+)/connect$'), 'connectTransport'),
+    ('POST',   re.compile(_PEER + r'/producers$'),                                'produce'),
+    ('POST',   re.compile(_PEER + r'/producers/(?P<producerId>[^/]+)/pause$'),   'pauseProducer'),
+    ('POST',   re.compile(_PEER + r'/producers/(?P<producerId>[^/]+)/resume$'),  'resumeProducer'),
+    ('POST',   re.compile(_PEER + r'/consumers$'),                                'consume'),
+    ('POST',   re.compile(_PEER + r'/consumers/(?P<consumerId>[^/]+)/resume$'),  'resumeConsumer'),
+    ('GET',    re.compile(_ROOM + r'/producers$'),                                'getProducers'),
+]
+
+HTTP_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 500: 'Internal Server Error',
+                503: 'Service Unavailable'}
+
+
+class FakeSFUError(Exception):
+    def __init__(self, code, message):
+        self.code = code
+        super().__init__(message)
+
+
+class _Peer:
+    def __init__(self):
+        self.transports = set()
+        self.producers = {}    # producer_id → kind
+        self.consumers = {}    # consumer_id → producer_id
+
+
+class FakeSFU:
+
+    def __init__(self, latency=0.0):
+        self.latency = latency          # 요청마다 지연 (초) — 실제 SFU 처리 시간 흉내
+        self.healthy = True             # False 면 /health 가 503 (노드 장애 흉내)
+        self.rooms = {}                 # room_id → { peer_id: _Peer }
+        self.calls = 0
+        self._ids = itertools.count(1)
+        self._sessions = []             # (writer, subscribed room_ids) — 연결 순서
+        self._servers = []
+
+    def _new_id(self, prefix):
+        return f'{prefix}-{next(self._ids)}'
+
+    # ── 방 상태 (rpc.js methods 와 같은 이름·응답) ─────────────
+    def _room(self, room_id):
+        room = self.rooms.get(room_id)
+        if room is None:
+            raise FakeSFUError(404, 'Room not found')
+        return room
+
+    def _peer(self, room_id, peer_id):
+        peer = self._room(room_id).get(peer_id)
+        if peer is None:
+            raise FakeSFUError(500, f'Peer not found: {peer_id}')
+        return peer
+
+    def _producer_list(self, room_id):
+        return [
+            {'peerId': peer_id, 'producerId': producer_id, 'kind': kind, 'paused': False}
+            for peer_id, peer in self.rooms.get(room_id, {}).items()
+            for producer_id, kind in peer.producers.items()
+        ]
+
+    def getRtpCapabilities(self, roomId, **_):
+        self.rooms.setdefault(roomId, {})
+        return {'rtpCapabilities': RTP_CAPABILITIES}
+
+    def join(self, roomId, peerId=None, **_):
+        if not peerId:
+            raise FakeSFUError(400, 'peerId required')
+        self.rooms.setdefault(roomId, {}).setdefault(peerId, _Peer())
+        return {'rtpCapabilities': RTP_CAPABILITIES, 'producers': self._producer_list(roomId)}
+
+    def leave(self, roomId, peerId, **_):
+        peer = self.rooms.get(roomId, {}).pop(peerId, None)
+        if peer is not None:
+            # mediasoup: transport 종료 → producer transportclose
+            for producer_id, kind in peer.producers.items():
+                self._notify(roomId, 'producerClosed',
+                             {'peerId': peerId, 'producerId': producer_id, 'kind': kind})
+        return {'ok': True}
+
+    def createTransport(self, roomId, peerId, **_):
+        peer = self._peer(roomId, peerId)
+        transport_id = self._new_id('transport')
+        peer.transports.add(transport_id)
+        return {
+            'id': transport_id,
+            'iceParameters': {'usernameFragment': transport_id, 'password': 'fake', 'iceLite': True},
+            'iceCandidates': [{'foundation': 'udpcandidate', 'ip': '127.0.0.1', 'port': 40000,
+                               'priority': 1076302079, 'protocol': 'udp', 'type': 'host'}],
+            'dtlsParameters': {'role': 'auto', 'fingerprints': []},
+        }
+
+    def connectTransport(self, roomId, peerId, transportId=None, dtlsParameters=None, **_):
+        if transportId is None or dtlsParameters is None:
+            raise FakeSFUError(400, 'transportId and dtlsParameters required')
+        if transportId not in self._peer(roomId, peerId).transports:
+            raise FakeSFUError(500, f'Transport not found: {transportId}')
+        return {'ok': True}
+
+    def produce(self, roomId, peerId, transportId=None, kind=None, rtpParameters=None, **_):
+        peer = self._peer(roomId, peerId)
+        if transportId not in peer.transports:
+            raise FakeSFUError(500, f'Transport not found: {transportId}')
+        producer_id = self._new_id('producer')
+        peer.producers[producer_id] = kind
+        return {'id': producer_id}
+
+    def pauseProducer(self, roomId, peerId, producerId, **_):
+        if producerId not in self._peer(roomId, peerId).producers:
+            raise FakeSFUError(500, f'Producer not found: {producerId}')
+        return {'ok': True}
+
+    resumeProducer = pauseProducer
+
+    def consume(self, roomId, peerId, producerPeerId=None, producerId=None, transportId=None, **_):
+        peer = self._peer(roomId, peerId)
+        if transportId not in peer.transports:
+            raise FakeSFUError(500, f'Transport not found: {transportId}')
+        producer_peer = self._room(roomId).get(producerPeerId)
+        if producer_peer is None or producerId not in producer_peer.producers:
+            raise FakeSFUError(500, f'Cannot consume producer {producerId}')
+        consumer_id = self._new_id('consumer')
+        peer.consumers[consumer_id] = producerId
+        return {
+            'id': consumer_id,
+            'producerId': producerId,
+            'kind': producer_peer.producers[producerId],
+            'rtpParameters': {'codecs': [], 'encodings': [{'ssrc': next(self._ids)}]},
+            'producerPeerId': producerPeerId,
+        }
+
+    def resumeConsumer(self, roomId, peerId, consumerId, **_):
+        if consumerId not in self._peer(roomId, peerId).consumers:
+            raise FakeSFUError(500, f'Consumer not found: {consumerId}')
+        return {'ok': True}
+
+    def getProducers(self, roomId, **_):
+        return {'producers': self._producer_list(roomId)}
+
+    def health(self, **_):
+        if not self.healthy:
+            raise FakeSFUError(503, 'unhealthy')
+        return {'status': 'ok', 'workers': 1, 'rooms': len(self.rooms),
+                'peers': sum(len(peers) for peers in self.rooms.values())}
+
+    # ── 테스트용 조작 ──────────────────────────────────────────
+    async def close_producer(self, room_id, peer_id, producer_id):
+        kind = self._peer(room_id, peer_id).producers.pop(producer_id)
+        self._notify(room_id, 'producerClosed',
+                     {'peerId': peer_id, 'producerId': producer_id, 'kind': kind})
+
+    async def close_room(self, room_id):
+        if self.rooms.pop(room_id, None) is not None:
+            self._notify(room_id, 'roomClosed', {})
+
+    async def drop_connections(self):
+        """모든 제어 채널 연결 끊기 (재연결 확인용)"""
+        for writer, _ in list(self._sessions):
+            writer.close()
+
+    async def close(self):
+        await self.drop_connections()
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        self._servers = []
+
+    # ── JSON-RPC 서버 (rpc.js 와 같은 프로토콜) ───────────────
+    def _notify(self, room_id, method, params):
+        # 그 방을 구독한 가장 최근 연결 하나에만
+        for writer, rooms in reversed(self._sessions):
+            if room_id in rooms and not writer.is_closing():
+                message = {'jsonrpc': '2.0', 'method': method, 'params': {'roomId': room_id, **params}}
+                writer.write((json.dumps(message) + '\n').encode())
+                return
+
+    async def _dispatch(self, message, rooms):
+        method, params = message.get('method'), message.get('params') or {}
+        if method == 'subscribe':
+            rooms.add(params.get('roomId'))
+            return {'ok': True}
+        if method == 'unsubscribe':
+            rooms.discard(params.get('roomId'))
+            return {'ok': True}
+
+        if method not in RPC_METHODS:
+            raise FakeSFUError(404, f'Unknown method: {method}')
+        return await self._invoke(getattr(self, method), params)
+
+    async def _invoke(self, handler, params):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        self.calls += 1
+        try:
+            return handler(**params)
+        except TypeError as e:
+            raise FakeSFUError(400, str(e))
+
+    async def _handle_rpc(self, reader, writer):
+        session = (writer, set())
+        self._sessions.append(session)
+
+        async def respond(message):
+            try:
+                response = {'jsonrpc': '2.0', 'id': message.get('id'),
+                            'result': await self._dispatch(message, session[1])}
+            except FakeSFUError as e:
+                response = {'jsonrpc': '2.0', 'id': message.get('id'),
+                            'error': {'code': e.code, 'message': str(e)}}
+            if not writer.is_closing():
+                writer.write((json.dumps(response) + '\n').encode())
+                await writer.drain()
+
+        tasks = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    continue
+                # 요청마다 태스크 → 응답 순서는 처리 순서 (실제 서버처럼 pipelining)
+                task = asyncio.ensure_future(respond(message))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass   # 연결 끊김 / 서버 종료
+        finally:
+            for task in tasks:
+                task.cancel()
+            self._sessions.remove(session)
+            writer.close()
+
+    # ── HTTP (server.js REST 와 같은 경로) ────────────────────
+    def _route(self, method, path):
+        for route_method, pattern, name in HTTP_ROUTES:
+            match = pattern.match(path)
+            if match and route_method == method:
+                return getattr(self, name), match.groupdict()
+        raise FakeSFUError(404, f'Not found: {method} {path}')
+
+    async def _handle_http(self, reader, writer):
+        # keep-alive HTTP/1.1 — httpx 연결 풀이 연결을 재사용
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, _ = request_line.decode('latin-1').split(' ', 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get('content-length') or 0)
+                body = await reader.readexactly(length) if length else b''
+
+                try:
+                    handler, params = self._route(method, target.split('?', 1)[0])
+                    if body:
+                        params.update(json.loads(body))
+                    if handler == self.health:
+                        status, result = 200, handler()
+                    else:
+                        status, result = 200, await self._invoke(handler, params)
+                except FakeSFUError as e:
+                    status, result = e.code, {'error': str(e)}
+                except ValueError as e:
+                    status, result = 400, {'error': str(e)}
+
+                payload = json.dumps(result).encode()
+                writer.write(
+                    f'HTTP/1.1 {status} {HTTP_REASONS.get(status, "Error")}\r\n'
+                    f'Content-Type: application/json\r\n'
+                    f'Content-Length: {len(payload)}\r\n\r\n'.encode() + payload
+                )
+                await writer.drain()
+        except (ConnectionError, ValueError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass   # 연결 끊김 / 잘못된 요청 / 서버 종료
+        finally:
+            writer.close()
+
+    async def serve_http(self, host='127.0.0.1', port=0):
+        server = await asyncio.start_server(self._handle_http, host, port)
+        self._servers.append(server)
+        logger.info(f"fake SFU HTTP listening on {server.sockets[0].getsockname()}")
+        return server
+
+    async def serve_rpc(self, host='127.0.0.1', port=0):
+        server = await asyncio.start_server(self._handle_rpc, host, port, limit=4 * 1024 * 1024)
+        self._servers.append(server)
+        logger.info(f"fake SFU RPC listening on {server.sockets[0].getsockname()}")
+        return server
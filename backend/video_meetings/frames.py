@@ -0,0 +1,94 @@
+# backend/video_meetings/frames.py
+"""
+방 전체 이벤트를 보내는 쪽에서 클라이언트 메시지(JSON)를 한 번만 만들기
+
+[기존] group_send 로 받은 N개 consumer 가 각자 dict 를 다시 만들고 json.dumps → 이벤트 하나에 직렬화 N번
+[지금] 보내는 쪽이 broadcast() 로 클라이언트에 보낼 JSON 문자열(frame)을 만들어 이벤트에 넣고,
+       받는 consumer 는 필터(자기 자신 / 다른 방 등)만 확인한 뒤 frame 을 그대로 전송 → 직렬화 1번
+
+- 인코더는 ujson (requirements.txt) — 표준 json 보다 빠름, 한글은 escape 하지 않음 (프레임이 작아짐)
+- 필터에 필요한 값(peerId, username 등)은 이벤트에 따로 넣음 — frame 을 다시 파싱하지 않도록
+- 벤치마크: python manage.py bench_broadcast
+
+[코덱] WebSocket 프레임 형식 — 연결할 때 고름 (negotiate)
+  json    : 텍스트 프레임 (기본, 기존과 같음)
+  msgpack : 바이너리 MessagePack 프레임 — rtpCapabilities / rtpParameters / dtlsParameters 처럼
+            큰 SFU 메시지가 작아지고 파싱이 빠름
+            요청: new WebSocket(url, ['msgpack'])  (subprotocol — 서버가 같은 값으로 응답)
+                  또는 ?codec=msgpack  (subprotocol 을 쓸 수 없는 클라이언트)
+  msgpack 연결도 텍스트 프레임(JSON)은 받음. 브로드캐스트 frame(JSON) 은 프로세스마다
+  한 번만 MessagePack 으로 바꿈 (같은 frame 을 여러 consumer 가 받으므로 LRU 캐시).
+  벤치마크: python manage.py bench_codec
+"""
+
+import json
+from functools import lru_cache
+from urllib.parse import parse_qs
+
+import msgpack
+import ujson
+
+
+def encode(message):
+    """클라이언트로 보낼 JSON 텍스트"""
+    return ujson.dumps(message, ensure_ascii=False, escape_forward_slashes=False)
+
+
+def broadcast(handler, message, **fields):
+    """
+    channel layer 이벤트 — handler: consumer 핸들러 이름, message: 클라이언트에 보낼 메시지,
+    fields: 받는 쪽 필터에 쓰는 값
+    """
+    return {'type': handler, 'frame': encode(message), **fields}
+
+
+# ── 코덱 ──────────────────────────────────────────────────────
+
+class JsonCodec:
+    name   = 'json'
+    binary = False
+
+    def decode(self, text_data=None, bytes_data=None):
+        return json.loads(text_data if text_data is not None else bytes_data)
+
+    def encode(self, message):
+        return json.dumps(message)
+
+    def from_frame(self, frame):
+        return frame
+
+
+class MsgpackCodec:
+    name   = 'msgpack'
+    binary = True
+
+    def decode(self, text_data=None, bytes_data=None):
+        if bytes_data is None:
+            return json.loads(text_data)
+        return msgpack.unpackb(bytes_data, raw=False)
+
+    def encode(self, message):
+        return msgpack.packb(message, use_bin_type=True)
+
+    def from_frame(self, frame):
+        return _frame_to_msgpack(frame)
+
+
+@lru_cache(maxsize=256)
+def _frame_to_msgpack(frame):
+    return msgpack.packb(ujson.loads(frame), use_bin_type=True)
+
+
+JSON    = JsonCodec()
+MSGPACK = MsgpackCodec()
+CODECS  = {codec.name: codec for codec in (JSON, MSGPACK)}
+
+
+def negotiate(scope):
+    """WebSocket scope → (코덱, accept 할 subprotocol 또는 None)"""
+    for subprotocol in scope.get('subprotocols') or ():
+        if subprotocol in CODECS:
+            return CODECS[subprotocol], subprotocol
+    query = parse_qs(scope.get('query_string', b'').decode())
+    codec = CODECS.get(query.get('codec', ['json'])[0], JSON)
+    return codec, None
@@ -0,0 +1,36 @@
+# backend/video_meetings/groups.py
+"""
+channel layer 그룹 이름 (consumers.py / views.py / sfu_client.py 공용)
+
+video_room_<room_id>        방 전체 — peer_joined, new_producer, 채팅, 회의 종료 …
+video_room_<room_id>_hosts  방장 연결만 — join_request_notification
+video_user_<user_id>        사용자 한 명의 연결 (탭 여러 개 포함)
+                            — approval / rejection_notification, SFU transportClosed
+
+[왜 나누나] 방 전체로 보내고 consumer 가 걸러내면 N명 방에서 이벤트 하나마다
+           N개 연결이 깨어나 필터만 하고 버림 → 참가 흐름 전체로는 O(N²).
+           받을 사람이 정해진 이벤트는 그 그룹으로 보내 1~2개 연결만 깨움.
+
+[주의] video_user_ 그룹은 방을 구분하지 않음 — 같은 사용자가 다른 방에도 연결해 있을 수 있으므로
+       이 그룹으로 보내는 이벤트에는 room_id(roomId) 를 넣고 consumer 가 자기 방인지 확인.
+"""
+
+
+def room_group(room_id):
+    return f'video_room_{room_id}'
+
+
+def hosts_group(room_id):
+    return f'video_room_{room_id}_hosts'
+
+
+def user_group(user_id):
+    return f'video_user_{user_id}'
+
+
+def peer_user_group(peer_id):
+    """SFU peerId ('user_<id>', consumers.py) → 그 사용자의 그룹 (형식이 다르면 None)"""
+    prefix, _, user_id = str(peer_id).partition('_')
+    if prefix != 'user' or not user_id.isdigit():
+        return None
+    return user_group(user_id)
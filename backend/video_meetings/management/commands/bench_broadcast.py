@@ -0,0 +1,119 @@
+# backend/video_meetings/management/commands/bench_broadcast.py
+#
+# 방 전체 이벤트 1개의 CPU 비용 — 받는 consumer 마다 json.dumps (기존) vs 보내는 쪽에서 한 번 인코딩 (frames.py)
+# Redis / WebSocket 없이 VideoMeetingConsumer 핸들러를 직접 호출 (전송은 버림)
+#
+# 측정 (이벤트 1개, 방 인원 N명)
+#   기존      : N × (이벤트 → dict 재구성 → json.dumps)       — 이전 핸들러와 같은 코드
+#   지금      : frames.broadcast 1회 + N × 핸들러 (필터 → frame 그대로 전송)
+#   layer     : channels_redis 가 채널마다 msgpack 으로 묶는 비용 (기존 이벤트 / frame 이벤트)
+#   (dispatch 의 aclose_old_connections 스레드 왕복은 양쪽이 같으므로 제외)
+#
+# ── 사용법 ──────────────────────────────────────────────────────
+#   python manage.py bench_broadcast                         # 5, 20, 50, 100, 200명
+#   python manage.py bench_broadcast --sizes 10 500 --rounds 500
+# ────────────────────────────────────────────────────────────────
+
+import asyncio
+import json
+import time
+
+import msgpack
+from django.core.management.base import BaseCommand
+
+from video_meetings import frames
+from video_meetings.consumers import VideoMeetingConsumer
+
+
+async def _discard(message):
+    pass
+
+
+def _event_fields(sender):
+    """대표 이벤트 — new_producer (참가 흐름에서 가장 많음)"""
+    return {
+        'peerId':     f'user_{sender}',
+        'username':   f'참가자{sender}',
+        'userId':     sender,
+        'producerId': '3f1c2d9e-8b7a-4c6d-9e0f-1a2b3c4d5e6f',
+        'kind':       'video',
+    }
+
+
+def _legacy_handler(event, peer_id):
+    """이전 new_producer 핸들러 — 받는 consumer 마다 dict 재구성 + json.dumps"""
+    if event['peerId'] != peer_id:
+        return json.dumps({
+            'type':       'new_producer',
+            'peerId':     event['peerId'],
+            'username':   event['username'],
+            'userId':     event['userId'],
+            'producerId': event['producerId'],
+            'kind':       event['kind'],
+        })
+    return None
+
+
+def _consumer(user_id):
+    consumer = VideoMeetingConsumer()
+    consumer.base_send = _discard
+    consumer.user_id   = user_id
+    consumer.username  = f'참가자{user_id}'
+    consumer.peer_id   = f'user_{user_id}'
+    return consumer
+
+
+class Command(BaseCommand):
+    help = '방 전체 이벤트 1개의 직렬화 CPU 비용 (수신자별 json.dumps vs 한 번 인코딩)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=int, nargs='+', default=[5, 20, 50, 100, 200], help='방 인원')
+        parser.add_argument('--rounds', type=int, default=200, help='크기마다 보내는 이벤트 수')
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"  이벤트 new_producer, 크기마다 {options['rounds']}회 (CPU 시간, 이벤트 1개 기준)")
+        self.stdout.write(f"  {'인원':>6}  {'기존':>10}  {'지금':>10}  {'배':>5}   layer 기존 / 지금")
+        for size in options['sizes']:
+            legacy, current, pack_legacy, pack_current = asyncio.run(self._measure(size, options['rounds']))
+            self.stdout.write(
+                f'  {size:>5}명  {legacy:>8.1f}µs  {current:>8.1f}µs  {legacy / current:>4.1f}×'
+                f'   {pack_legacy:>7.1f}µs / {pack_current:>7.1f}µs'
+            )
+        self.stdout.write(self.style.SUCCESS('  ✅ 완료'))
+
+    async def _measure(self, size, rounds):
+        consumers = [_consumer(i) for i in range(size)]
+        legacy_ns = current_ns = pack_legacy_ns = pack_current_ns = 0
+
+        for round_no in range(rounds):
+            fields = _event_fields(round_no % size)
+
+            # 기존: 수신자마다 직렬화
+            event = {'type': 'new_producer', **fields}
+            t0 = time.process_time_ns()
+            for consumer in consumers:
+                text = _legacy_handler(event, consumer.peer_id)
+                if text is not None:
+                    await consumer.send(text_data=text)
+            legacy_ns += time.process_time_ns() - t0
+
+            t0 = time.process_time_ns()
+            for i in range(size):
+                msgpack.packb({**event, '__asgi_channel__': f'specific.{i}'})
+            pack_legacy_ns += time.process_time_ns() - t0
+
+            # 지금: 보내는 쪽에서 한 번 인코딩, 수신자는 그대로 전송
+            t0 = time.process_time_ns()
+            event = frames.broadcast('new_producer', {
+                'type': 'new_producer', **fields,
+            }, peerId=fields['peerId'])
+            for consumer in consumers:
+                await consumer.new_producer(event)
+            current_ns += time.process_time_ns() - t0
+
+            t0 = time.process_time_ns()
+            for i in range(size):
+                msgpack.packb({**event, '__asgi_channel__': f'specific.{i}'})
+            pack_current_ns += time.process_time_ns() - t0
+
+        return tuple(ns / rounds / 1000 for ns in (legacy_ns, current_ns, pack_legacy_ns, pack_current_ns))
@@ -0,0 +1,175 @@
+# backend/video_meetings/management/commands/bench_codec.py
+#
+# WebSocket 코덱 비교 (frames.py) — SFU 시그널링 메시지의 프레임 크기 / 인코딩 / 디코딩 시간
+# JSON 텍스트 (기존) vs MessagePack 바이너리 (subprotocol 'msgpack')
+# 메시지는 mediasoup 기본 코덱 구성(opus, VP8, VP9, H264 + rtx)과 같은 모양의 예시
+#
+# ── 사용법 ──────────────────────────────────────────────────────
+#   python manage.py bench_codec
+#   python manage.py bench_codec --producers 50 --rounds 5000
+# ────────────────────────────────────────────────────────────────
+
+import itertools
+import time
+
+from django.core.management.base import BaseCommand
+
+from video_meetings import frames
+
+_ids = itertools.count(1)
+
+
+def _uuid():
+    return f'{next(_ids):08x}-4b1e-4c3a-9d2f-6e5a7b8c9d0e'
+
+
+def _video_codec(mime, payload_type, parameters):
+    return [
+        {'kind': 'video', 'mimeType': mime, 'preferredPayloadType': payload_type, 'clockRate': 90000,
+         'parameters': parameters,
+         'rtcpFeedback': [{'type': 'nack', 'parameter': ''}, {'type': 'nack', 'parameter': 'pli'},
+                          {'type': 'ccm', 'parameter': 'fir'}, {'type': 'goog-remb', 'parameter': ''},
+                          {'type': 'transport-cc', 'parameter': ''}]},
+        {'kind': 'video', 'mimeType': 'video/rtx', 'preferredPayloadType': payload_type + 1,
+         'clockRate': 90000, 'parameters': {'apt': payload_type}, 'rtcpFeedback': []},
+    ]
+
+
+def rtp_capabilities():
+    header_extensions = [
+        {'kind': kind, 'uri': uri, 'preferredId': i, 'preferredEncrypt': False, 'direction': 'sendrecv'}
+        for i, (kind, uri) in enumerate([
+            ('audio', 'urn:ietf:params:rtp-hdrext:sdes:mid'),
+            ('video', 'urn:ietf:params:rtp-hdrext:sdes:mid'),
+            ('video', 'urn:ietf:params:rtp-hdrext:sdes:rtp-stream-id'),
+            ('video', 'urn:ietf:params:rtp-hdrext:sdes:repaired-rtp-stream-id'),
+            ('audio', 'http://www.webrtc.org/experiments/rtp-hdrext/abs-send-time'),
+            ('video', 'http://www.webrtc.org/experiments/rtp-hdrext/abs-send-time'),
+            ('video', 'http://www.ietf.org/id/draft-holmer-rmcat-transport-wide-cc-extensions-01'),
+            ('audio', 'urn:ietf:params:rtp-hdrext:ssrc-audio-level'),
+            ('video', 'urn:3gpp:video-orientation'),
+            ('video', 'urn:ietf:params:rtp-hdrext:toffset'),
+            ('video', 'http://www.webrtc.org/experiments/rtp-hdrext/playout-delay'),
+        ], start=1)
+    ]
+    return {
+        'codecs': [
+            {'kind': 'audio', 'mimeType': 'audio/opus', 'preferredPayloadType': 100, 'clockRate': 48000,
+             'channels': 2, 'parameters': {}, 'rtcpFeedback': [{'type': 'nack', 'parameter': ''},
+                                                             {'type': 'transport-cc', 'parameter': ''}]},
+            *_video_codec('video/VP8', 101, {'x-google-start-bitrate': 1000}),
+            *_video_codec('video/VP9', 103, {'profile-id': 2, 'x-google-start-bitrate': 1000}),
+            *_video_codec('video/H264', 105, {'packetization-mode': 1, 'level-asymmetry-allowed': 1,
+                                              'profile-level-id': '4d0032', 'x-google-start-bitrate': 1000}),
+        ],
+        'headerExtensions': header_extensions,
+    }
+
+
+def dtls_parameters(role='auto'):
+    return {'role': role, 'fingerprints': [
+        {'algorithm': algorithm, 'value': ':'.join(f'{(i * 37 + n) % 256:02X}' for i in range(size))}
+        for n, (algorithm, size) in enumerate([('sha-1', 20), ('sha-224', 28), ('sha-256', 32),
+                                               ('sha-384', 48), ('sha-512', 64)])
+    ]}
+
+
+def transport(direction):
+    return {
+        'direction': direction,
+        'id': _uuid(),
+        'iceParameters': {'usernameFragment': 'k3v9x0a1b2c3d4e5', 'password': 'p9o8i7u6y5t4r3e2w1q0a1s2d3f4g5h6',
+                          'iceLite': True},
+        'iceCandidates': [
+            {'foundation': 'udpcandidate', 'priority': 1076302079, 'ip': '203.0.113.10', 'address': '203.0.113.10',
+             'protocol': 'udp', 'port': 40000 + n, 'type': 'host'}
+            for n in range(2)
+        ],
+        'dtlsParameters': dtls_parameters(),
+        'sctpParameters': None,
+    }
+
+
+def rtp_parameters(kind):
+    if kind == 'audio':
+        codecs = [{'mimeType': 'audio/opus', 'payloadType': 100, 'clockRate': 48000, 'channels': 2,
+                   'parameters': {'minptime': 10, 'useinbandfec': 1}, 'rtcpFeedback': [{'type': 'transport-cc', 'parameter': ''}]}]
+        encodings = [{'ssrc': 1001, 'dtx': False}]
+    else:
+        codecs = [{'mimeType': c['mimeType'], 'payloadType': c['preferredPayloadType'], 'clockRate': 90000,
+                   'parameters': c['parameters'], 'rtcpFeedback': c['rtcpFeedback']}
+                  for c in _video_codec('video/VP8', 101, {})]
+        encodings = [{'rid': f'r{n}', 'active': True, 'scalabilityMode': 'L1T3', 'scaleResolutionDownBy': 4 >> n,
+                      'maxBitrate': 150000 << (n * 2)} for n in range(3)]
+    return {
+        'mid': '0' if kind == 'audio' else '1',
+        'codecs': codecs,
+        'headerExtensions': [{'uri': e['uri'], 'id': e['preferredId'], 'encrypt': False, 'parameters': {}}
+                             for e in rtp_capabilities()['headerExtensions'] if e['kind'] == kind],
+        'encodings': encodings,
+        'rtcp': {'cname': 'a1b2c3d4e5f6', 'reducedSize': True},
+    }
+
+
+def messages(producers):
+    """(이름, 메시지) — 참가 흐름에서 크기가 큰 메시지"""
+    peers = [(f'user_{n}', f'참가자{n}') for n in range(1, producers // 2 + 1)]
+    return [
+        ('sfu_joined_full', {
+            'type': 'sfu_joined_full',
+            'rtpCapabilities': rtp_capabilities(),
+            'sendTransport': transport('send'),
+            'recvTransport': transport('recv'),
+            'producers': [{'producerId': _uuid(), 'peerId': peer_id, 'kind': kind, 'username': username}
+                          for peer_id, username in peers for kind in ('audio', 'video')],
+        }),
+        ('sfu_connect_transport', {
+            'type': 'sfu_connect_transport', 'transportId': _uuid(), 'dtlsParameters': dtls_parameters('client'),
+        }),
+        ('sfu_produce (video)', {
+            'type': 'sfu_produce', 'transportId': _uuid(), 'kind': 'video',
+            'rtpParameters': rtp_parameters('video'), 'appData': {'source': 'webcam'},
+        }),
+        ('sfu_consumed_batch', {
+            'type': 'sfu_consumed_batch', 'requestId': 7, 'failed': [],
+            'consumers': [{'id': _uuid(), 'producerId': _uuid(), 'producerPeerId': peer_id, 'kind': kind,
+                           'rtpParameters': rtp_parameters(kind), 'type': 'simple', 'producerPaused': False}
+                          for peer_id, _ in peers for kind in ('audio', 'video')],
+        }),
+    ]
+
+
+def _per_call_us(func, arg, rounds):
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        func(arg)
+    return (time.perf_counter() - t0) / rounds * 1e6
+
+
+class Command(BaseCommand):
+    help = 'WebSocket 코덱(JSON / MessagePack) 프레임 크기와 인코딩·디코딩 시간'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--producers', type=int, default=20,
+                            help='sfu_joined_full / sfu_consumed_batch 에 들어가는 producer 수')
+        parser.add_argument('--rounds', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        rounds = options['rounds']
+        self.stdout.write(f"  producer {options['producers']}개, 메시지마다 {rounds}회")
+        self.stdout.write(f"  {'메시지':<24} {'json':>8} {'msgpack':>8}   "
+                          f"{'인코딩 json / msgpack':>22}   {'디코딩 json / msgpack':>22}")
+        for name, message in messages(options['producers']):
+            text = frames.JSON.encode(message)
+            packed = frames.MSGPACK.encode(message)
+            encode = [_per_call_us(codec.encode, message, rounds) for codec in (frames.JSON, frames.MSGPACK)]
+            decode = [
+                _per_call_us(lambda data: frames.JSON.decode(text_data=data), text, rounds),
+                _per_call_us(lambda data: frames.MSGPACK.decode(bytes_data=data), packed, rounds),
+            ]
+            size = len(text.encode())
+            self.stdout.write(
+                f'  {name:<24} {size:>7,}B {len(packed):>7,}B ({len(packed) / size:>4.0%})'
+                f'   {encode[0]:>8.1f}µs / {encode[1]:>7.1f}µs   {decode[0]:>8.1f}µs / {decode[1]:>7.1f}µs'
+            )
+        self.stdout.write(self.style.SUCCESS('  ✅ 완료'))
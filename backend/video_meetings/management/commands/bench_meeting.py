@@ -0,0 +1,378 @@
+# backend/video_meetings/management/commands/bench_meeting.py
+#
+# 화상회의 시그널링 부하 벤치마크 — VideoMeetingConsumer + sfu_client + SFU 대역 (fake_sfu.py)
+# 브라우저 / mediasoup 없이 참가자 N명이 WebSocket(channels WebsocketCommunicator, JWT 미들웨어 포함)으로
+#   연결 → sfu_join_full → transport connect ×2 → produce(audio, video)
+#   → 기존 producer 일괄 consume → resume
+# 까지 진행하고, 먼저 들어온 참가자는 new_producer 를 받을 때마다 consume (실제 클라이언트와 같게).
+#
+# 측정
+#   입장 지연       : WebSocket 연결 ~ 기존 producer resume 완료 (p50 / p95 / max)
+#   입장당 DB 쿼리   : 모든 스레드의 쿼리 (database_sync_to_async 포함)
+#   입장당 SFU 호출  : 먼저 들어온 참가자들의 consume 포함
+#   메시지 처리량    : 전원이 track_state 를 보낼 때 서버가 클라이언트로 보내는 메시지 수/초
+#                     (channel layer 용량을 넘어 버려진 메시지는 유실로 표시)
+#   fan-out         : channel layer group_send 1회 비용 / 전원 수신까지의 지연
+#
+# ── 사용법 ──────────────────────────────────────────────────────
+#   python manage.py bench_meeting                              # 5, 20, 50명
+#   python manage.py bench_meeting --participants 10 100 --latency-ms 5
+#   python manage.py bench_meeting --rpc                        # SFU 호출을 제어 채널(JSON-RPC)로
+#   python manage.py bench_meeting --burst                      # 전원 동시 입장
+#   python manage.py bench_meeting --in-memory-layer            # Redis 대신 InMemoryChannelLayer
+#   python manage.py bench_meeting --cleanup                    # 벤치용 사용자 / 방 삭제
+# ────────────────────────────────────────────────────────────────
+
+import asyncio
+import collections
+import itertools
+import json
+import statistics
+import time
+
+from channels.auth import AuthMiddlewareStack
+from channels.db import database_sync_to_async
+from channels.layers import get_channel_layer
+from channels.routing import URLRouter
+from channels.testing import WebsocketCommunicator
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.test.utils import override_settings
+
+from accounts.jwt import ClaimsTokenObtainPairSerializer
+from video_meetings import frames, groups, routing, sfu_client
+from video_meetings.fake_sfu import FakeSFU
+from video_meetings.middleware import JWTAuthMiddleware
+from video_meetings.models import RoomParticipant, VideoRoom
+from video_meetings.sfu_pool import SFUNode
+
+BENCH_PREFIX = '__bench_meeting_'
+REPLY_TIMEOUT = 30.0
+QUIET_TIMEOUT = 1.0        # 이 시간 동안 새 메시지가 없으면 나머지는 유실로 봄
+DTLS = {'role': 'client', 'fingerprints': [{'algorithm': 'sha-256', 'value': '00:' * 31 + '00'}]}
+RTP_CAPABILITIES = {'codecs': [], 'headerExtensions': []}
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+class _QueryCounter:
+    """모든 스레드의 DB 쿼리 수 (consumer 의 쿼리는 database_sync_to_async 스레드에서 실행)"""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+    def install(self, connection, **kwargs):
+        if self not in connection.execute_wrappers:
+            connection.execute_wrappers.append(self)
+
+
+class _Tally:
+    """조건에 맞는 수신 메시지가 target 개가 되면 done"""
+
+    def __init__(self, target, match):
+        self.target, self.match = target, match
+        self.count = 0
+        self.last_at = time.perf_counter()
+        self.done = asyncio.Event()
+        if target <= 0:
+            self.done.set()
+
+    def add(self, message):
+        if self.match(message):
+            self.count += 1
+            self.last_at = time.perf_counter()
+            if self.count >= self.target:
+                self.done.set()
+
+    async def wait(self):
+        """target 개 수신 또는 QUIET_TIMEOUT 동안 새 메시지 없음 → 받은 수"""
+        while not self.done.is_set():
+            count = self.count
+            try:
+                await asyncio.wait_for(self.done.wait(), QUIET_TIMEOUT)
+            except asyncio.TimeoutError:
+                if self.count == count:
+                    break
+        return self.count
+
+
+class _Peer:
+    """시뮬레이션 참가자 — useSFU.js 와 같은 순서로 시그널링"""
+
+    _request_ids = itertools.count(1)
+
+    def __init__(self, application, room_id, user, token):
+        self.user = user
+        self.comm = WebsocketCommunicator(application, f'/ws/video-meeting/{room_id}/?token={token}')
+        self.received = collections.Counter()
+        self.tally = None
+        self.consuming = set()     # 늦게 들어온 producer consume 태스크
+        self.resumed = 0           # resume 까지 끝난 consumer 수
+        self._early = []           # recv transport 준비 전에 받은 new_producer (useSFU.js 와 같이 모아 둠)
+        self._waiters = {}         # (type, requestId) → Future
+        self._reader = None
+        self._recv = None
+
+    # ── 송수신 ───────────────────────────────────────
+    def _expect(self, message_type, request_id=None):
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[(message_type, request_id)] = future
+        return future
+
+    async def _request(self, message, reply_type):
+        request_id = message.get('requestId')
+        future = self._expect(reply_type, request_id)
+        await self.comm.send_to(text_data=json.dumps(message))
+        try:
+            return await asyncio.wait_for(future, REPLY_TIMEOUT)
+        finally:
+            self._waiters.pop((reply_type, request_id), None)
+
+    async def _read(self):
+        while True:
+            message = json.loads(await self.comm.receive_from(timeout=3600))
+            message_type = message.get('type')
+            self.received[message_type] += 1
+            if self.tally is not None:
+                self.tally.add(message)
+
+            if message_type == 'sfu_error':
+                error = RuntimeError(f"{message.get('request')}: {message.get('message')}")
+                for future in self._waiters.values():
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+            if message_type == 'new_producer' and self._recv is None:
+                self._early.append({'producerId': message['producerId'], 'producerPeerId': message['peerId']})
+            elif message_type == 'new_producer':
+                task = asyncio.ensure_future(self._consume([{
+                    'producerId': message['producerId'], 'producerPeerId': message['peerId'],
+                }]))
+                self.consuming.add(task)
+                task.add_done_callback(self.consuming.discard)
+
+            future = self._waiters.get((message_type, message.get('requestId')))
+            if future is not None and not future.done():
+                future.set_result(message)
+
+    # ── 시나리오 ─────────────────────────────────────
+    async def join(self):
+        participants = self._expect('participants_list')
+        connected, code = await self.comm.connect(timeout=REPLY_TIMEOUT)
+        if not connected:
+            raise CommandError(f'WebSocket 연결 실패 ({self.user.username}, code={code})')
+        self._reader = asyncio.ensure_future(self._read())
+        await asyncio.wait_for(participants, REPLY_TIMEOUT)
+
+        joined = await self._request({'type': 'sfu_join_full'}, 'sfu_joined_full')
+        send, recv = joined['sendTransport'], joined['recvTransport']
+        for transport in (send, recv):
+            await self._request(
+                {'type': 'sfu_connect_transport', 'transportId': transport['id'], 'dtlsParameters': DTLS},
+                'sfu_transport_connected',
+            )
+        self._recv = recv['id']
+
+        for kind in ('audio', 'video'):
+            await self._request(
+                {'type': 'sfu_produce', 'transportId': send['id'], 'kind': kind,
+                 'rtpParameters': {'codecs': [], 'encodings': []}, 'appData': {}},
+                'sfu_produced',
+            )
+        producers = {p['producerId']: {'producerId': p['producerId'], 'producerPeerId': p['peerId']}
+                     for p in joined['producers']}
+        producers.update((p['producerId'], p) for p in self._early)
+        await self._consume(list(producers.values()))
+
+    async def _consume(self, producers):
+        if not producers:
+            return
+        request_id = next(self._request_ids)
+        consumed = await self._request(
+            {'type': 'sfu_consume_batch', 'requestId': request_id, 'transportId': self._recv,
+             'rtpCapabilities': RTP_CAPABILITIES, 'producers': producers},
+            'sfu_consumed_batch',
+        )
+        consumer_ids = [c['id'] for c in consumed['consumers']]
+        if consumer_ids:
+            resumed = await self._request(
+                {'type': 'sfu_resume_consumer_batch', 'requestId': request_id, 'consumerIds': consumer_ids},
+                'sfu_consumers_resumed',
+            )
+            self.resumed += len(resumed['consumerIds'])
+
+    async def send_track_state(self, enabled):
+        await self.comm.send_to(text_data=json.dumps({'type': 'track_state', 'kind': 'audio', 'enabled': enabled}))
+
+    async def leave(self):
+        for task in list(self.consuming):
+            task.cancel()
+        if self._reader is not None:
+            self._reader.cancel()
+        await self.comm.disconnect()
+
+
+class Command(BaseCommand):
+    help = '화상회의 시그널링 부하 벤치마크 (consumer + sfu_client + SFU 대역)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--participants', type=int, nargs='+', default=[5, 20, 50], help='방 인원 (여러 개)')
+        parser.add_argument('--latency-ms', type=float, default=2.0, help='SFU 요청마다 지연 (ms)')
+        parser.add_argument('--rpc', action='store_true', help='SFU 호출을 제어 채널(JSON-RPC)로')
+        parser.add_argument('--burst', action='store_true', help='전원 동시 입장 (기본: 한 명씩)')
+        parser.add_argument('--messages', type=int, default=20, help='참가자당 보내는 track_state 수')
+        parser.add_argument('--fanout-rounds', type=int, default=50, help='group_send 측정 횟수')
+        parser.add_argument('--in-memory-layer', action='store_true', help='InMemoryChannelLayer 사용')
+        parser.add_argument('--cleanup', action='store_true', help='벤치용 사용자 / 방 삭제')
+
+    def handle(self, *args, **options):
+        if options['cleanup']:
+            deleted, _ = User.objects.filter(username__startswith=BENCH_PREFIX).delete()
+            self.stdout.write(self.style.SUCCESS(f'  ✅ 벤치용 데이터 {deleted}건 삭제'))
+            return
+
+        users = self._users(max(options['participants']))
+        # 로그인(/api/token/)과 같은 claims 토큰 → 미들웨어가 실제와 같은 경로로 인증
+        tokens = {
+            user.id: str(ClaimsTokenObtainPairSerializer.get_token(user).access_token) for user in users
+        }
+        counter = _QueryCounter()
+        connection_created.connect(counter.install, dispatch_uid='bench_meeting_queries')
+        for connection in connections.all():
+            counter.install(connection)
+
+        layers = None
+        if options['in_memory_layer']:
+            layers = {'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}}
+        try:
+            with override_settings(**({'CHANNEL_LAYERS': layers} if layers else {})):
+                asyncio.run(self._bench(users, tokens, counter, options))
+        finally:
+            connection_created.disconnect(dispatch_uid='bench_meeting_queries')
+            for connection in connections.all():
+                if counter in connection.execute_wrappers:
+                    connection.execute_wrappers.remove(counter)
+
+    def _users(self, count):
+        users = []
+        for i in range(count):
+            user, _ = User.objects.get_or_create(username=f'{BENCH_PREFIX}{i}')
+            users.append(user)
+        return users
+
+    def _room(self, users):
+        """방장 users[0], 나머지는 승인된 참가자"""
+        room = VideoRoom.objects.create(
+            title=f'{BENCH_PREFIX}{len(users)}', host=users[0],
+            status='active', max_participants=len(users),
+        )
+        RoomParticipant.objects.bulk_create(
+            RoomParticipant(room=room, user=user, status='approved') for user in users[1:]
+        )
+        return room
+
+    async def _bench(self, users, tokens, counter, options):
+        sfu = FakeSFU(latency=options['latency_ms'] / 1000)
+        http = await sfu.serve_http('127.0.0.1', 0)
+        rpc = await sfu.serve_rpc('127.0.0.1', 0)
+        http_port, rpc_port = http.sockets[0].getsockname()[1], rpc.sockets[0].getsockname()[1]
+        previous = sfu_client.set_nodes([SFUNode(
+            'bench', f'http://127.0.0.1:{http_port}', f'127.0.0.1:{rpc_port}' if options['rpc'] else '',
+        )])
+
+        application = JWTAuthMiddleware(AuthMiddlewareStack(URLRouter(routing.websocket_urlpatterns)))
+        self.stdout.write(
+            f"  SFU 대역 지연 {options['latency_ms']}ms, SFU 호출 {'JSON-RPC' if options['rpc'] else 'REST'}, "
+            f"입장 {'동시' if options['burst'] else '순차'}, channel layer {type(get_channel_layer()).__name__}"
+        )
+        try:
+            for size in options['participants']:
+                room = await database_sync_to_async(self._room)(users[:size])
+                peers = [_Peer(application, room.id, user, tokens[user.id]) for user in users[:size]]
+                try:
+                    await self._scenario(room, peers, sfu, counter, options)
+                finally:
+                    await asyncio.gather(*(peer.leave() for peer in peers), return_exceptions=True)
+        finally:
+            sfu_client.set_nodes(previous)
+            await sfu.close()
+
+    async def _scenario(self, room, peers, sfu, counter, options):
+        size = len(peers)
+        layer = get_channel_layer()
+
+        # ── 입장 ────────────────────────────────────
+        timings = []
+
+        async def timed_join(peer):
+            t0 = time.perf_counter()
+            await peer.join()
+            timings.append((time.perf_counter() - t0) * 1000)
+
+        queries, calls = counter.count, sfu.calls
+        started = time.perf_counter()
+        if options['burst']:
+            await asyncio.gather(*(timed_join(peer) for peer in peers))
+        else:
+            for peer in peers:
+                await timed_join(peer)
+        # 전원이 서로의 audio / video 를 모두 consume 할 때까지
+        expected = size * (size - 1) * 2
+        deadline = time.perf_counter() + REPLY_TIMEOUT
+        while sum(peer.resumed for peer in peers) < expected:
+            if time.perf_counter() > deadline:
+                raise CommandError(f'consume 미완료 ({sum(peer.resumed for peer in peers)}/{expected})')
+            await asyncio.sleep(0.005)
+        settled = time.perf_counter() - started
+        queries, calls = counter.count - queries, sfu.calls - calls
+
+        # ── 메시지 처리량 (track_state → 나머지 전원) ─────
+        messages = options['messages']
+        tally = _Tally(size * messages * (size - 1), lambda m: m.get('type') == 'track_state')
+        for peer in peers:
+            peer.tally = tally
+        t0 = time.perf_counter()
+        for i in range(messages):
+            await asyncio.gather(*(peer.send_track_state(i % 2 == 0) for peer in peers))
+        delivered = await tally.wait()
+        throughput = delivered / max(tally.last_at - t0, 1e-9)
+        loss = f' (유실 {tally.target - delivered}/{tally.target})' if delivered < tally.target else ''
+
+        # ── fan-out (group_send 1회 → 전원 수신) ──────────
+        send_ms, deliver_ms = [], []
+        group = groups.room_group(room.id)
+        for round_no in range(options['fanout_rounds']):
+            marker = f'{BENCH_PREFIX}fanout_{round_no}'
+            tally = _Tally(size, lambda m, marker=marker: m.get('username') == marker)
+            for peer in peers:
+                peer.tally = tally
+            t0 = time.perf_counter()
+            await layer.group_send(group, frames.broadcast('track_state_changed', {
+                'type': 'track_state', 'username': marker, 'user_id': 0,
+                'peerId': marker, 'kind': 'audio', 'enabled': True,
+            }, username=marker))
+            send_ms.append((time.perf_counter() - t0) * 1000)
+            if await tally.wait() < size:
+                raise CommandError(f'fan-out 수신 누락 ({tally.count}/{size})')
+            deliver_ms.append((tally.last_at - t0) * 1000)
+        for peer in peers:
+            peer.tally = None
+
+        self.stdout.write(
+            f'  {size:>3}명: 입장 p50 {_percentile(timings, 50):7.1f}ms  p95 {_percentile(timings, 95):7.1f}ms  '
+            f'max {max(timings):7.1f}ms  (전원 consume 완료 {settled * 1000:.0f}ms)\n'
+            f'        입장당 DB 쿼리 {queries / size:5.1f}  SFU 호출 {calls / size:5.1f}  '
+            f'메시지 {throughput:8.0f}/s{loss}\n'
+            f'        fan-out group_send {statistics.median(send_ms):.2f}ms, '
+            f'전원 수신 p50 {_percentile(deliver_ms, 50):.2f}ms  p95 {_percentile(deliver_ms, 95):.2f}ms '
+            f'(수신자당 {statistics.median(deliver_ms) / size * 1000:.0f}µs)'
+        )
@@ -0,0 +1,46 @@
+# backend/video_meetings/management/commands/run_fake_sfu.py
+#
+# mediasoup SFU 대역 실행 (video_meetings/fake_sfu.py) — 미디어 없이 시그널링만
+# 백엔드를 MEDIASOUP_URL=http://127.0.0.1:3000 MEDIASOUP_RPC_ADDR=127.0.0.1:3001 로 띄우면
+# 이 서버의 REST API / 제어 채널을 사용
+# 노드 여러 대: 포트를 바꿔 여러 번 실행하고
+#   MEDIASOUP_NODES=http://127.0.0.1:3000|127.0.0.1:3001,http://127.0.0.1:3100|127.0.0.1:3101
+#
+# ── 사용법 ──────────────────────────────────────────────────────
+#   python manage.py run_fake_sfu                        # HTTP 3000, RPC 3001
+#   python manage.py run_fake_sfu --http-port 3100 --rpc-port 3101 --latency-ms 5
+# ────────────────────────────────────────────────────────────────
+
+import asyncio
+
+from django.core.management.base import BaseCommand
+
+from video_meetings.fake_sfu import FakeSFU
+
+
+class Command(BaseCommand):
+    help = 'mediasoup SFU 대역 서버 실행 (REST API + JSON-RPC 제어 채널)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--http-port', type=int, default=3000, help='HTTP 포트 (server.js REST API)')
+        parser.add_argument('--rpc-port', type=int, default=3001, help='제어 채널 포트')
+        parser.add_argument('--latency-ms', type=float, default=0.0, help='요청마다 지연 (ms)')
+
+    def handle(self, *args, **options):
+        try:
+            asyncio.run(self._serve(options))
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write(self.style.SUCCESS('  ✅ fake SFU 종료'))
+
+    async def _serve(self, options):
+        sfu = FakeSFU(latency=options['latency_ms'] / 1000)
+        await sfu.serve_http(options['host'], options['http_port'])
+        server = await sfu.serve_rpc(options['host'], options['rpc_port'])
+        self.stdout.write(
+            f"  fake SFU HTTP {options['host']}:{options['http_port']}, "
+            f"RPC {options['host']}:{options['rpc_port']} (Ctrl+C 로 종료)"
+        )
+        async with server:
+            await server.serve_forever()
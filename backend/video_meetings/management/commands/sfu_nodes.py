@@ -0,0 +1,57 @@
+# backend/video_meetings/management/commands/sfu_nodes.py
+#
+# SFU 노드 풀 상태 확인 / drain (video_meetings/sfu_pool.py)
+# drain 한 노드에는 새 방을 배치하지 않음 — 진행 중인 회의는 끝날 때까지 그대로
+#
+# ── 사용법 ──────────────────────────────────────────────────────
+#   python manage.py sfu_nodes                               # 노드별 상태 / 부하
+#   python manage.py sfu_nodes --drain mediasoup-2:3000      # 새 방 배치 중단 (배포·점검 전)
+#   python manage.py sfu_nodes --undrain mediasoup-2:3000
+#   python manage.py sfu_nodes --room <room_id>              # 방을 맡은 노드 (없으면 배치)
+# ────────────────────────────────────────────────────────────────
+
+import asyncio
+
+from django.core.management.base import BaseCommand, CommandError
+
+from video_meetings import sfu_client, sfu_pool
+
+
+class Command(BaseCommand):
+    help = 'SFU 노드 상태 확인 / drain'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--drain', metavar='NODE', help='새 방을 배치하지 않을 노드')
+        parser.add_argument('--undrain', metavar='NODE', help='drain 해제')
+        parser.add_argument('--room', help='이 방을 맡은 노드 (없으면 배치)')
+
+    def handle(self, *args, **options):
+        pool = sfu_client._pool
+
+        for option, draining in (('drain', True), ('undrain', False)):
+            name = options[option]
+            if not name:
+                continue
+            if name not in pool.nodes:
+                raise CommandError(f'알 수 없는 노드: {name} (설정: {", ".join(pool.nodes)})')
+            if not sfu_pool.set_draining(name, draining):
+                raise CommandError('drain 상태는 Redis 캐시에서만 사용할 수 있습니다.')
+            self.stdout.write(self.style.SUCCESS(f'  ✅ {name} {option}'))
+
+        asyncio.run(pool.probe(force=True))
+        draining = sfu_pool.draining_nodes()
+        self.stdout.write(f'  노드 {len(pool.nodes)}대')
+        for name, node in pool.nodes.items():
+            health = pool.health.get(name)
+            if health is None or not health.ok:
+                state = 'DOWN'
+            else:
+                state = 'up' if health.failures == 0 else f'fail×{health.failures}'
+            flags = ' [draining]' if name in draining else ''
+            load = health.load if health else '-'
+            rpc = node.rpc_addr or '-'
+            self.stdout.write(f'    {name:<28} {state:<7} peers={load:<6} rpc={rpc}{flags}')
+
+        if options['room']:
+            node = asyncio.run(pool.node_for(options['room']))
+            self.stdout.write(f"  방 {options['room']} → {node.name}")
@@ -6,6 +6,7 @@ from django.contrib.auth import get_user_model
 from rest_framework_simplejwt.tokens import AccessToken
 from rest_framework_simplejwt.exceptions import TokenError
 from urllib.parse import parse_qs
+from accounts.jwt import claims_enabled, has_claims, token_state, user_from_claims
 import logging
 
 logger = logging.getLogger(__name__)
@@ -17,6 +18,16 @@ def get_user_from_token(token_key):
     try:
         access_token = AccessToken(token_key)
         user_id = access_token['user_id']
+
+        # claims 모드: 로그아웃된 토큰 거부 / claims 토큰이면 DB 조회 없이 사용자 생성 (accounts/jwt.py)
+        if claims_enabled():
+            state = token_state(access_token)
+            if state == 'revoked':
+                logger.warning(f"⚠️ 폐기된 토큰: {user_id}")
+                return AnonymousUser()
+            if has_claims(access_token) and state == 'ok':
+                return user_from_claims(access_token)
+
         user = User.objects.get(id=user_id)
         logger.info(f"✅ JWT 인증 성공: {user.username}")
         return user
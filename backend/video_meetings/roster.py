@@ -0,0 +1,244 @@
+# backend/video_meetings/roster.py
+"""
+회의실 실시간 명단 (roster) — Redis 해시
+
+consumer 와 뷰가 이벤트마다 RoomParticipant / VideoRoom / User 를 조회하던 것을
+방마다 Redis 해시 두 개로 모은다.
+
+  meeting:roster:<room_id>:meta    { host_id, host_username, screen_share_id, loaded }
+  meeting:roster:<room_id>:members { user_id: username }   ← 승인된 참가자
+
+[읽기]  get(room_id) → RoomRoster (Redis 왕복 1회, 쿼리 0)
+        해시가 없으면 DB 에서 한 번 채움 (쿼리 2회) — 이후 같은 방은 쿼리 없음
+[쓰기]  REST 뷰에서 상태가 바뀔 때 write-through (add_member / remove_member / clear ...)
+        화면 공유는 consumer 의 screen_share_start / stop 에서 (set_screen_share)
+        transaction.on_commit 뒤에 반영 → 커밋되지 않은 상태가 명단에 남지 않음
+        쓰기가 실패하면 해시를 지워 다음 읽기에서 DB 로 다시 채움
+Redis 가 아니면(로컬 개발 등) 매번 DB 에서 읽는다.
+"""
+
+import logging
+from dataclasses import dataclass, field
+
+from django.core.cache import cache
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+ROSTER_TTL = 60 * 60 * 12   # 12시간 — 종료 처리를 놓친 방도 이 시간 뒤 정리
+
+
+def _redis():
+    """django_redis 연결 (Redis 캐시가 아니면 None)"""
+    try:
+        from django_redis import get_redis_connection
+        return get_redis_connection('default')
+    except Exception:
+        return None
+
+
+def _meta_key(room_id):
+    return cache.make_key(f'meeting:roster:{room_id}:meta')
+
+
+def _members_key(room_id):
+    return cache.make_key(f'meeting:roster:{room_id}:members')
+
+
+def _text(value):
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _int(value):
+    value = _text(value)
+    return int(value) if value not in (None, '') else None
+
+
+def peer_user_id(peer_id):
+    """'user_<id>' → id (형식이 다르면 None)"""
+    try:
+        return int(str(peer_id).replace('user_', ''))
+    except (TypeError, ValueError):
+        return None
+
+
+# ── 명단 ──────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class RoomRoster:
+    room_id:         str
+    exists:          bool
+    host_id:         int | None = None
+    host_username:   str = ''
+    screen_share_id: int | None = None
+    members:         dict = field(default_factory=dict)   # { user_id: username }
+
+    def is_host(self, user_id):
+        return user_id is not None and self.host_id == int(user_id)
+
+    def is_approved(self, user_id):
+        """방장 또는 승인된 참가자"""
+        return self.is_host(user_id) or (user_id is not None and int(user_id) in self.members)
+
+    def username(self, user_id):
+        if self.is_host(user_id):
+            return self.host_username
+        return self.members.get(int(user_id)) if user_id is not None else None
+
+    def usernames_for_peers(self, peer_ids):
+        """{ peer_id: username } — 명단에 없는 peer 는 User 에서 한 번에 조회"""
+        result, missing = {}, {}
+        for peer_id in peer_ids:
+            user_id = peer_user_id(peer_id)
+            username = self.username(user_id) if user_id is not None else None
+            if username:
+                result[peer_id] = username
+            elif user_id is not None:
+                missing[user_id] = peer_id
+            else:
+                result[peer_id] = peer_id
+
+        if missing:
+            from django.contrib.auth.models import User
+            found = dict(User.objects.filter(id__in=missing).values_list('id', 'username'))
+            for user_id, peer_id in missing.items():
+                result[peer_id] = found.get(user_id, peer_id)
+        return result
+
+    def participants(self, exclude_user_id=None):
+        """승인된 참가자 목록 (consumer participants_list 형식)"""
+        return [
+            {'user__username': username, 'user__id': user_id}
+            for user_id, username in self.members.items()
+            if user_id != exclude_user_id
+        ]
+
+    @property
+    def approved_count(self):
+        return len(self.members)
+
+
+def _load_from_db(room_id):
+    """DB 에서 명단 생성 — 쿼리 2회"""
+    from .models import RoomParticipant, VideoRoom
+
+    row = (
+        VideoRoom.objects.filter(id=room_id)
+        .values_list('host_id', 'host__username', 'screen_sharing_user_id')
+        .first()
+    )
+    if row is None:
+        return RoomRoster(str(room_id), exists=False)
+
+    members = dict(
+        RoomParticipant.objects.filter(room_id=room_id, status='approved')
+        .order_by('joined_at', 'id')
+        .values_list('user_id', 'user__username')
+    )
+    return RoomRoster(str(room_id), True, row[0], row[1], row[2], members)
+
+
+def _store(conn, roster):
+    pipe = conn.pipeline(transaction=True)
+    meta_key, members_key = _meta_key(roster.room_id), _members_key(roster.room_id)
+    pipe.delete(members_key)
+    pipe.hset(meta_key, mapping={
+        'host_id':         roster.host_id,
+        'host_username':   roster.host_username,
+        'screen_share_id': roster.screen_share_id or '',
+        'loaded':          1,
+    })
+    if roster.members:
+        pipe.hset(members_key, mapping=roster.members)
+    pipe.expire(meta_key, ROSTER_TTL)
+    pipe.expire(members_key, ROSTER_TTL)
+    pipe.execute()
+
+
+def get(room_id):
+    """방 명단 — Redis 왕복 1회 (처음 한 번만 DB)"""
+    conn = _redis()
+    if conn is None:
+        return _load_from_db(room_id)
+
+    try:
+        pipe = conn.pipeline(transaction=False)
+        pipe.hgetall(_meta_key(room_id))
+        pipe.hgetall(_members_key(room_id))
+        meta, members = pipe.execute()
+    except Exception as e:
+        logger.warning(f"roster read failed: {e}")
+        return _load_from_db(room_id)
+
+    meta = {_text(k): _text(v) for k, v in meta.items()}
+    if meta.get('loaded'):
+        return RoomRoster(
+            str(room_id), True,
+            _int(meta.get('host_id')),
+            meta.get('host_username', ''),
+            _int(meta.get('screen_share_id')),
+            {int(k): _text(v) for k, v in members.items()},
+        )
+
+    roster = _load_from_db(room_id)
+    if roster.exists:
+        try:
+            _store(conn, roster)
+        except Exception as e:
+            logger.warning(f"roster write failed: {e}")
+    return roster
+
+
+# ── write-through ─────────────────────────────────────────────
+
+def _write(room_id, apply):
+    """커밋 후 apply(pipe) 실행. 명단이 아직 없으면 건너뜀 (다음 읽기에서 DB 로 채움)"""
+    def run():
+        conn = _redis()
+        if conn is None:
+            return
+        meta_key = _meta_key(room_id)
+        try:
+            if not conn.exists(meta_key):
+                return
+            pipe = conn.pipeline(transaction=True)
+            apply(pipe)
+            pipe.expire(meta_key, ROSTER_TTL)
+            pipe.expire(_members_key(room_id), ROSTER_TTL)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"roster write-through failed: {e}")
+            invalidate(room_id)
+
+    transaction.on_commit(run)
+
+
+def add_member(room_id, user_id, username):
+    """참가 승인"""
+    _write(room_id, lambda pipe: pipe.hset(_members_key(room_id), user_id, username))
+
+
+def remove_member(room_id, user_id):
+    """퇴장 / 거부 / 재참가 요청(pending)"""
+    _write(room_id, lambda pipe: pipe.hdel(_members_key(room_id), user_id))
+
+
+def set_screen_share(room_id, user_id):
+    """화면 공유 시작(user_id) / 종료(None)"""
+    _write(room_id, lambda pipe: pipe.hset(_meta_key(room_id), 'screen_share_id', user_id or ''))
+
+
+def clear(room_id):
+    """회의 종료 — 모든 참가자 퇴장"""
+    _write(room_id, lambda pipe: pipe.delete(_members_key(room_id)))
+
+
+def invalidate(room_id):
+    """명단 삭제 — 다음 읽기에서 DB 로 다시 채움"""
+    conn = _redis()
+    if conn is None:
+        return
+    try:
+        conn.delete(_meta_key(room_id), _members_key(room_id))
+    except Exception as e:
+        logger.warning(f"roster invalidate failed: {e}")
@@ -11,33 +11,90 @@ httpx를 사용해 Django의 이벤트 루프 안에서 논블로킹 HTTP 요청
 - 키 이름은 mediasoup REST 서버(server.js/Room.js)가 반환하는 camelCase 그대로 유지
   (consumers.py에서 'peerId', 'producerId' 등으로 참조)
 - 연결 풀(limits)을 모듈 수준에서 하나만 생성 → 재사용으로 성능 향상
+
+[제어 채널] MEDIASOUP_RPC_ADDR (예: mediasoup:3001) 가 설정되면
+- 프로세스당 TCP 연결 하나로 JSON-RPC 2.0 (줄 단위 JSON, mediasoup/src/rpc.js)
+- 요청 id 로 응답 매칭 → 여러 요청이 한 연결에서 동시에 진행 (pipelining)
+- 동시 진행 요청은 RPC_MAX_IN_FLIGHT 개까지 (넘으면 대기 — 백프레셔)
+- 연결이 없거나 끊겨 있으면 REST 로 처리, 재연결은 지수 백오프
+  (이미 보낸 요청이 연결 끊김으로 실패하면 중복 실행을 피해 REST 로 다시 보내지 않음)
+- 서버 이벤트는 channel layer 에 sfu_notification 으로 전달
+  (producerClosed → video_room_<room_id>, transportClosed → 주인의 video_user_<id> — groups.py)
+
+[장애 대응]
+- RTP capabilities 는 방(router)마다 고정 → 프로세스 메모리에 TTL 캐시,
+  roomClosed 이벤트(제어 채널)나 evict_room() 으로 제거
+- 같은 GET(capabilities, producers)이 동시에 여러 번 오면 요청 하나를 같이 기다림
+- SFU 주소별 circuit breaker: 연결 실패/타임아웃이 이어지면 open → 바로 실패 (타임아웃 대기 없음),
+  BREAKER_RESET 뒤 half-open 에서 요청 하나로 복구 확인
+- 멱등 요청(조회, leave, pause/resume)만 연결 실패/타임아웃 시 jitter 백오프로 재시도
+
+[노드 풀] MEDIASOUP_NODES 로 SFU 여러 대 — 방마다 노드 하나 (sfu_pool.py)
+- 요청마다 roomId 로 노드를 찾아 그 노드의 REST 클라이언트 / 제어 채널 / circuit breaker 사용
 """
 
+import asyncio
+import itertools
 import json
 import logging
 import os
+import random
+import time
 
 import httpx
 
+from . import groups
+from .sfu_pool import SFUNode, SFUPool, parse_nodes
+
 logger = logging.getLogger(__name__)
 
 # ── 설정 ─────────────────────────────────────────────────────────────────────
 SFU_BASE_URL = os.environ.get('MEDIASOUP_URL', 'http://mediasoup:3000').rstrip('/')
-
-# 연결 풀: Django 프로세스 당 하나 (재사용)
-_client: httpx.AsyncClient | None = None
-
-
-def _get_client() -> httpx.AsyncClient:
-    """모듈 수준 httpx 클라이언트 반환 (없으면 생성)."""
-    global _client
-    if _client is None or _client.is_closed:
-        _client = httpx.AsyncClient(
-            base_url=SFU_BASE_URL,
+SFU_RPC_ADDR = os.environ.get('MEDIASOUP_RPC_ADDR', '').strip()   # 'host:port', 비우면 REST 만
+
+RPC_TIMEOUT         = 15.0          # 응답 대기 (REST read timeout 과 같게)
+RPC_CONNECT_TIMEOUT = 3.0
+RPC_MAX_IN_FLIGHT   = 256           # 연결 하나에서 동시에 진행하는 요청 수
+RPC_LINE_LIMIT      = 4 * 1024 * 1024
+RPC_RECONNECT_MIN   = 0.5           # 재연결 백오프 (초)
+RPC_RECONNECT_MAX   = 10.0
+
+CAPABILITIES_TTL    = 60 * 10       # RTP capabilities 캐시 (초)
+CAPABILITIES_MAX    = 1000          # 캐시할 방 수 (넘으면 오래된 것부터 제거)
+BREAKER_THRESHOLD   = 5             # 연속 실패 몇 번이면 open
+BREAKER_RESET       = 10.0          # open 후 half-open 까지 (초)
+RETRY_ATTEMPTS      = 3             # 멱등 요청 최대 시도 횟수
+RETRY_BASE_DELAY    = 0.1           # 재시도 백오프 (초, full jitter)
+RETRY_MAX_DELAY     = 1.0
+
+# SFU 노드 (MEDIASOUP_NODES 가 없으면 위 주소의 노드 하나)
+NODES = parse_nodes(os.environ.get('MEDIASOUP_NODES', '')) or [
+    SFUNode(SFU_BASE_URL.split('://', 1)[-1], SFU_BASE_URL, SFU_RPC_ADDR),
+]
+_pool = SFUPool(NODES)
+
+
+def set_nodes(nodes: list[SFUNode]) -> list[SFUNode]:
+    """SFU 노드 교체 (벤치마크 / 테스트용 — fake SFU 로 연결). 이전 노드 목록 반환"""
+    global NODES, _pool
+    previous, NODES, _pool = NODES, list(nodes), SFUPool(nodes)
+    _capabilities.clear()
+    return previous
+
+# 연결 풀: Django 프로세스 당 노드마다 하나 (재사용)
+_clients: dict[str, httpx.AsyncClient] = {}
+
+
+def _get_client(base_url: str = SFU_BASE_URL) -> httpx.AsyncClient:
+    """노드별 httpx 클라이언트 반환 (없으면 생성)."""
+    client = _clients.get(base_url)
+    if client is None or client.is_closed:
+        client = _clients[base_url] = httpx.AsyncClient(
+            base_url=base_url,
             timeout=httpx.Timeout(connect=5.0, read=15.0, write=10.0, pool=5.0),
             limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
         )
-    return _client
+    return client
 
 
 class SFUError(Exception):
@@ -46,20 +103,94 @@ class SFUError(Exception):
         self.status = status
         super().__init__(f"SFU {status}: {detail}")
 
+    @property
+    def unavailable(self) -> bool:
+        """SFU 에 닿지 못함 (연결 실패 / 타임아웃) — 요청 내용 오류가 아님"""
+        return self.status in (502, 503, 504)
+
+
+class CircuitOpenError(SFUError):
+    """circuit breaker 가 열려 있어 요청을 보내지 않음."""
+    def __init__(self, base_url: str):
+        super().__init__(503, f"circuit open: {base_url}")
+
+
+# ── circuit breaker ──────────────────────────────────────────────────────────
+
+class _CircuitBreaker:
+    """
+    closed    : 정상. 연속 실패가 BREAKER_THRESHOLD 번이면 open
+    open      : 요청을 보내지 않고 바로 CircuitOpenError (BREAKER_RESET 동안)
+    half-open : 요청 하나만 통과 → 성공하면 closed, 실패하면 다시 open
+    """
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        self.state = 'closed'
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+
+    def before(self):
+        if self.state == 'open':
+            if time.monotonic() - self.opened_at < BREAKER_RESET:
+                raise CircuitOpenError(self.base_url)
+            self.state = 'half-open'
+            self._probing = False
+        if self.state == 'half-open':
+            if self._probing:
+                raise CircuitOpenError(self.base_url)
+            self._probing = True
+
+    def success(self):
+        if self.state != 'closed':
+            logger.info(f"SFU circuit closed: {self.base_url}")
+        self.state = 'closed'
+        self.failures = 0
+        self._probing = False
+
+    def failure(self):
+        self.failures += 1
+        self._probing = False
+        if self.state == 'half-open' or self.failures >= BREAKER_THRESHOLD:
+            if self.state != 'open':
+                logger.warning(f"SFU circuit open: {self.base_url} ({self.failures} failures)")
+            self.state = 'open'
+            self.opened_at = time.monotonic()
+
+
+_breakers: dict[str, _CircuitBreaker] = {}
+
+
+def _breaker(base_url: str) -> _CircuitBreaker:
+    breaker = _breakers.get(base_url)
+    if breaker is None:
+        breaker = _breakers[base_url] = _CircuitBreaker(base_url)
+    return breaker
+
+
+def circuit_state(base_url: str = SFU_BASE_URL) -> str:
+    """'closed' / 'open' / 'half-open' (모니터링용)"""
+    breaker = _breakers.get(base_url)
+    return breaker.state if breaker else 'closed'
+
 
 # ── 내부 헬퍼 ────────────────────────────────────────────────────────────────
 
-async def _request(method: str, path: str, **kwargs) -> dict:
+async def _request(method: str, path: str, *, base_url: str = SFU_BASE_URL, **kwargs) -> dict:
     """
     HTTP 요청 공통 처리.
     - 4xx/5xx → SFUError
     - JSON 파싱 실패 → SFUError
     """
-    client = _get_client()
+    client = _get_client(base_url)
     url = path  # base_url이 이미 클라이언트에 설정돼 있음
 
     try:
         resp = await client.request(method, url, **kwargs)
+    except httpx.TimeoutException as e:
+        logger.error(f"SFU timeout [{method} {path}]: {e}")
+        raise SFUError(504, f"Timeout: {e}") from e
     except httpx.TransportError as e:
         logger.error(f"SFU transport error [{method} {path}]: {e}")
         raise SFUError(503, f"Connection failed: {e}") from e
@@ -79,6 +210,341 @@ async def _request(method: str, path: str, **kwargs) -> dict:
         raise SFUError(500, f"JSON parse error: {e}") from e
 
 
+# ── 제어 채널 (JSON-RPC over TCP) ────────────────────────────────────────────
+
+class RpcUnavailable(Exception):
+    """요청을 보내기 전에 연결할 수 없음 → REST 로 대체 가능."""
+
+
+class _RpcChannel:
+    """mediasoup/src/rpc.js 와의 장기 연결 하나 (이벤트 루프 하나에 묶임)."""
+
+    def __init__(self, host: str, port: int, node_name: str = ''):
+        self.host, self.port = host, port
+        self.node_name = node_name
+        self._loop = None
+        self._reader = None
+        self._writer = None
+        self._read_task = None
+        self._reconnect_task = None
+        self._pending: dict[int, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+        self._rooms: dict[str, int] = {}     # 이벤트 구독 중인 방 → 참조 수
+        self._retry_at = 0.0
+        self._backoff = RPC_RECONNECT_MIN
+
+    @property
+    def connected(self) -> bool:
+        return self._writer is not None and not self._writer.is_closing()
+
+    def _bind_loop(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # 다른 이벤트 루프에서 호출됨 (async_to_sync 등) → 그 루프용으로 새로 연결
+            self._drop_connection()
+            self._loop = loop
+            self._connect_lock = asyncio.Lock()
+            self._write_lock = asyncio.Lock()
+            self._slots = asyncio.Semaphore(RPC_MAX_IN_FLIGHT)
+
+    # ── 연결 ─────────────────────────────────────────
+    async def _ensure_connected(self):
+        self._bind_loop()
+        if self.connected:
+            return
+        if time.monotonic() < self._retry_at:
+            raise RpcUnavailable('reconnect backoff')
+
+        async with self._connect_lock:
+            if self.connected:
+                return
+            try:
+                self._reader, self._writer = await asyncio.wait_for(
+                    asyncio.open_connection(self.host, self.port, limit=RPC_LINE_LIMIT),
+                    timeout=RPC_CONNECT_TIMEOUT,
+                )
+            except (OSError, asyncio.TimeoutError) as e:
+                self._schedule_retry()
+                raise RpcUnavailable(f"connect failed: {e}") from e
+
+            self._backoff = RPC_RECONNECT_MIN
+            self._read_task = self._loop.create_task(self._read_loop(self._reader))
+            logger.info(f"SFU RPC connected: {self.host}:{self.port}")
+
+            # 재연결이면 이벤트 구독 복구 (응답은 기다리지 않음)
+            try:
+                for room_id in list(self._rooms):
+                    await self._write(self._message('subscribe', {'roomId': room_id}))
+            except SFUError as e:
+                raise RpcUnavailable(str(e)) from e
+
+    def _schedule_retry(self):
+        # 백오프 + jitter — 여러 워커가 동시에 재연결하지 않도록
+        delay = self._backoff * random.uniform(0.5, 1.0)
+        self._retry_at = time.monotonic() + delay
+        self._backoff = min(self._backoff * 2, RPC_RECONNECT_MAX)
+
+    def _drop_connection(self, exc: Exception | None = None):
+        writer, self._reader, self._writer = self._writer, None, None
+        if writer is not None:
+            try:
+                writer.close()
+            except Exception:
+                pass
+        # 이미 보낸 요청은 실행 여부를 알 수 없음 → REST 재시도 없이 실패 처리
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(SFUError(503, f"RPC connection lost: {exc or 'closed'}"))
+
+    def _connection_lost(self, exc: Exception | None):
+        if self._writer is None:
+            return
+        logger.warning(f"SFU RPC disconnected: {exc or 'closed by server'}")
+        self._drop_connection(exc)
+        self._schedule_retry()
+        if self._rooms and (self._reconnect_task is None or self._reconnect_task.done()):
+            # 요청이 없어도 서버 이벤트를 계속 받도록 백그라운드 재연결
+            self._reconnect_task = self._loop.create_task(self._reconnect_loop())
+
+    async def _reconnect_loop(self):
+        while self._rooms and not self.connected:
+            await asyncio.sleep(max(0.0, self._retry_at - time.monotonic()))
+            try:
+                await self._ensure_connected()
+            except RpcUnavailable:
+                pass
+
+    # ── 송수신 ───────────────────────────────────────
+    def _message(self, method: str, params: dict) -> dict:
+        return {'jsonrpc': '2.0', 'id': next(self._ids), 'method': method, 'params': params}
+
+    async def _write(self, message: dict):
+        data = (json.dumps(message, separators=(',', ':')) + '\n').encode()
+        async with self._write_lock:
+            if not self.connected:
+                raise RpcUnavailable('not connected')
+            try:
+                self._writer.write(data)
+                await self._writer.drain()   # 소켓 버퍼가 차면 여기서 대기
+            except (OSError, RuntimeError) as e:
+                self._connection_lost(e)
+                raise SFUError(503, f"RPC write failed: {e}") from e
+
+    async def call(self, method: str, params: dict, timeout: float = RPC_TIMEOUT) -> dict:
+        await self._ensure_connected()
+        async with self._slots:
+            message = self._message(method, params)
+            future = self._loop.create_future()
+            self._pending[message['id']] = future
+            try:
+                await self._write(message)
+                response = await asyncio.wait_for(future, timeout)
+            except asyncio.TimeoutError:
+                logger.error(f"SFU RPC timeout [{method}]")
+                raise SFUError(504, f"RPC timeout: {method}")
+            finally:
+                self._pending.pop(message['id'], None)
+
+        error = response.get('error')
+        if error:
+            logger.error(f"SFU RPC error [{method}] {error.get('code')}: {error.get('message')}")
+            raise SFUError(error.get('code') or 500, error.get('message', 'RPC error'))
+        return response.get('result') or {}
+
+    async def _read_loop(self, reader):
+        exc = None
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    logger.warning(f"SFU RPC: invalid line {line[:80]!r}")
+                    continue
+
+                if message.get('method'):
+                    self._dispatch_event(message['method'], message.get('params') or {})
+                else:
+                    future = self._pending.get(message.get('id'))
+                    if future is not None and not future.done():
+                        future.set_result(message)
+        except Exception as e:
+            exc = e
+        finally:
+            if reader is self._reader:
+                self._connection_lost(exc)
+
+    # ── 서버 이벤트 ─────────────────────────────────
+    def _dispatch_event(self, method: str, params: dict):
+        room_id = params.get('roomId')
+        if not room_id:
+            return
+        if method == 'roomClosed':
+            evict_room(room_id)     # 새 router 는 capabilities 가 다를 수 있음
+            if len(_pool.nodes) > 1:
+                # 빈 방 정리 → 다음 회의는 다시 배치 (drain 중인 노드에서 옮겨 가도록)
+                self._loop.run_in_executor(None, _pool.release, room_id, self.node_name)
+            return
+        self._loop.create_task(_deliver_event(room_id, method, params))
+
+    async def subscribe(self, room_id: str):
+        self._rooms[room_id] = self._rooms.get(room_id, 0) + 1
+        if self._rooms[room_id] == 1:
+            try:
+                await self.call('subscribe', {'roomId': room_id})
+            except (RpcUnavailable, SFUError) as e:
+                # 연결되면 _ensure_connected 가 다시 구독
+                logger.debug(f"SFU RPC subscribe deferred [{room_id}]: {e}")
+
+    async def unsubscribe(self, room_id: str):
+        count = self._rooms.get(room_id, 0) - 1
+        if count > 0:
+            self._rooms[room_id] = count
+            return
+        self._rooms.pop(room_id, None)
+        if self.connected:
+            try:
+                await self.call('unsubscribe', {'roomId': room_id})
+            except (RpcUnavailable, SFUError):
+                pass
+
+
+async def _deliver_event(room_id: str, method: str, params: dict):
+    """
+    SFU 이벤트 → channel layer (consumers.VideoMeetingConsumer.sfu_notification)
+    transportClosed 는 transport 주인만 필요 → 그 사용자의 그룹으로, 나머지는 방 전체로
+    """
+    from channels.layers import get_channel_layer
+    group = None
+    if method == 'transportClosed':
+        group = groups.peer_user_group(params.get('peerId'))
+    try:
+        await get_channel_layer().group_send(
+            group or groups.room_group(room_id),
+            {'type': 'sfu_notification', 'event': method, 'roomId': room_id, **params},
+        )
+    except Exception as e:
+        logger.warning(f"SFU event delivery failed [{method}]: {e}")
+
+
+_rpc_channels: dict[str, _RpcChannel] = {}
+
+
+def _get_rpc(node: SFUNode) -> _RpcChannel | None:
+    """노드의 제어 채널 (제어 채널 주소가 없으면 None → REST 만 사용)."""
+    if not node.rpc_addr:
+        return None
+    channel = _rpc_channels.get(node.rpc_addr)
+    if channel is None:
+        host, _, port = node.rpc_addr.rpartition(':')
+        channel = _rpc_channels[node.rpc_addr] = _RpcChannel(host or 'localhost', int(port), node.name)
+    return channel
+
+
+async def _call_once(
+    node: SFUNode, rpc_method: str, params: dict, method: str, path: str, **kwargs,
+) -> dict:
+    """제어 채널로 요청, 연결할 수 없으면 같은 요청을 REST 로 (circuit breaker 적용)."""
+    breaker = _breaker(node.base_url)
+    breaker.before()
+    try:
+        channel = _get_rpc(node)
+        result = None
+        if channel is not None:
+            try:
+                result = await channel.call(rpc_method, params)
+            except RpcUnavailable as e:
+                logger.debug(f"SFU RPC unavailable ({e}) → REST {method} {path}")
+        if result is None:
+            result = await _request(method, path, base_url=node.base_url, **kwargs)
+    except SFUError as e:
+        # 4xx / 애플리케이션 오류(500)는 SFU 가 응답한 것 → 실패로 세지 않음
+        if e.unavailable:
+            breaker.failure()
+        else:
+            breaker.success()
+        raise
+    breaker.success()
+    return result
+
+
+async def _call(
+    rpc_method: str, params: dict, method: str, path: str,
+    *, idempotent: bool = False, **kwargs,
+) -> dict:
+    """
+    SFU 요청. idempotent=True 면 연결 실패/타임아웃 시 jitter 백오프로 재시도
+    (circuit open 이면 재시도하지 않음).
+    """
+    attempts = RETRY_ATTEMPTS if idempotent else 1
+    for attempt in range(attempts):
+        try:
+            node = await _pool.node_for(params['roomId'])
+            return await _call_once(node, rpc_method, params, method, path, **kwargs)
+        except CircuitOpenError:
+            raise
+        except SFUError as e:
+            if not e.unavailable or attempt + 1 >= attempts:
+                raise
+            delay = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt))
+            logger.warning(f"SFU retry [{rpc_method}] {attempt + 1}/{attempts - 1} in {delay:.2f}s: {e}")
+            await asyncio.sleep(delay)
+
+
+# ── 요청 합치기 / capabilities 캐시 ─────────────────────────────────────────
+
+_inflight: dict[tuple, asyncio.Future] = {}
+
+
+async def _coalesced(key: tuple, factory):
+    """같은 key 의 요청이 진행 중이면 새로 보내지 않고 그 결과를 같이 기다림."""
+    key = (id(asyncio.get_running_loop()), *key)
+    future = _inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(factory())
+        _inflight[key] = future
+        future.add_done_callback(lambda _: _inflight.pop(key, None))
+    # shield: 기다리던 한 쪽이 취소돼도 나머지는 결과를 받음
+    return await asyncio.shield(future)
+
+
+_capabilities: dict[str, tuple[float, dict]] = {}   # room_id → (만료 시각, capabilities)
+
+
+def _cache_capabilities(room_id: str, capabilities: dict):
+    if len(_capabilities) >= CAPABILITIES_MAX:
+        _capabilities.pop(next(iter(_capabilities)))
+    _capabilities[room_id] = (time.monotonic() + CAPABILITIES_TTL, capabilities)
+
+
+def evict_room(room_id: str) -> None:
+    """방(router) 종료 — 캐시된 capabilities 제거."""
+    _capabilities.pop(str(room_id), None)
+
+
+def release_room(room_id: str) -> None:
+    """회의 종료 — 노드 배정 삭제 (동기, 뷰에서 호출)."""
+    evict_room(room_id)
+    _pool.release(room_id)
+
+
+async def subscribe_room(room_id: str) -> None:
+    """이 프로세스로 방의 SFU 이벤트 받기 (제어 채널을 쓸 때만)."""
+    channel = _get_rpc(await _pool.node_for(room_id))
+    if channel is not None:
+        await channel.subscribe(str(room_id))
+
+
+async def unsubscribe_room(room_id: str) -> None:
+    # 구독한 뒤 노드가 바뀌었을 수 있음 → 구독 중인 채널에서 해제
+    for channel in list(_rpc_channels.values()):
+        if str(room_id) in channel._rooms:
+            await channel.unsubscribe(str(room_id))
+
+
 # ── Public API ────────────────────────────────────────────────────────────────
 
 async def get_rtp_capabilities(room_id: str) -> dict:
@@ -89,8 +555,18 @@ async def get_rtp_capabilities(room_id: str) -> dict:
     Returns:
         dict  (mediasoup RouterRtpCapabilities 형식)
     """
-    data = await _request('GET', f'/rooms/{room_id}/rtp-capabilities')
+    room_id = str(room_id)
+    cached = _capabilities.get(room_id)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
+    data = await _coalesced(('capabilities', room_id), lambda: _call(
+        'getRtpCapabilities', {'roomId': room_id},
+        'GET', f'/rooms/{room_id}/rtp-capabilities',
+        idempotent=True,
+    ))
     # server.js: res.json({ rtpCapabilities: room.getRtpCapabilities() })
+    _cache_capabilities(room_id, data['rtpCapabilities'])
     return data['rtpCapabilities']
 
 
@@ -119,9 +595,9 @@ async def join_room(room_id: str, peer_id: str) -> dict:
         consumers.py handle_sfu_join에서 p.get('peerId', '') 로 접근하므로
         키 이름을 camelCase로 그대로 반환.
     """
-    data = await _request(
-        'POST',
-        f'/rooms/{room_id}/peers',
+    data = await _call(
+        'join', {'roomId': str(room_id), 'peerId': peer_id},
+        'POST', f'/rooms/{room_id}/peers',
         json={'peerId': peer_id},
     )
     # 방어: producers 없으면 빈 리스트
@@ -137,6 +613,7 @@ async def join_room(room_id: str, peer_id: str) -> dict:
             'paused':     p.get('paused', False),
         })
 
+    _cache_capabilities(str(room_id), data['rtpCapabilities'])
     return {
         'rtpCapabilities': data['rtpCapabilities'],
         'producers': normalized,
@@ -149,7 +626,11 @@ async def leave_room(room_id: str, peer_id: str) -> None:
     Transport/Producer/Consumer 모두 Room.js removePeer()가 정리함.
     """
     try:
-        await _request('DELETE', f'/rooms/{room_id}/peers/{peer_id}')
+        await _call(
+            'leave', {'roomId': str(room_id), 'peerId': peer_id},
+            'DELETE', f'/rooms/{room_id}/peers/{peer_id}',
+            idempotent=True,
+        )
     except SFUError as e:
         # 이미 없는 peer 제거 시도(404)는 무시
         if e.status == 404:
@@ -174,9 +655,9 @@ async def create_transport(room_id: str, peer_id: str) -> dict:
         server.js POST /rooms/:roomId/peers/:peerId/transports
         Room.js createWebRtcTransport() 가 동일 구조 반환.
     """
-    data = await _request(
-        'POST',
-        f'/rooms/{room_id}/peers/{peer_id}/transports',
+    data = await _call(
+        'createTransport', {'roomId': str(room_id), 'peerId': peer_id},
+        'POST', f'/rooms/{room_id}/peers/{peer_id}/transports',
     )
     return {
         'id':             data['id'],
@@ -198,9 +679,11 @@ async def connect_transport(
     Notes:
         server.js POST /rooms/:roomId/peers/:peerId/transports/:transportId/connect
     """
-    await _request(
-        'POST',
-        f'/rooms/{room_id}/peers/{peer_id}/transports/{transport_id}/connect',
+    await _call(
+        'connectTransport',
+        {'roomId': str(room_id), 'peerId': peer_id,
+         'transportId': transport_id, 'dtlsParameters': dtls_parameters},
+        'POST', f'/rooms/{room_id}/peers/{peer_id}/transports/{transport_id}/connect',
         json={'dtlsParameters': dtls_parameters},
     )
 
@@ -222,15 +705,16 @@ async def create_producer(
     Notes:
         server.js POST /rooms/:roomId/peers/:peerId/producers
     """
-    data = await _request(
-        'POST',
-        f'/rooms/{room_id}/peers/{peer_id}/producers',
-        json={
-            'transportId':    transport_id,
-            'kind':           kind,
-            'rtpParameters':  rtp_parameters,
-            'appData':        app_data or {},
-        },
+    body = {
+        'transportId':    transport_id,
+        'kind':           kind,
+        'rtpParameters':  rtp_parameters,
+        'appData':        app_data or {},
+    }
+    data = await _call(
+        'produce', {'roomId': str(room_id), 'peerId': peer_id, **body},
+        'POST', f'/rooms/{room_id}/peers/{peer_id}/producers',
+        json=body,
     )
     return {'id': data['id']}
 
@@ -242,9 +726,10 @@ async def pause_producer(room_id: str, peer_id: str, producer_id: str) -> None:
     Notes:
         server.js POST /rooms/:roomId/peers/:peerId/producers/:producerId/pause
     """
-    await _request(
-        'POST',
-        f'/rooms/{room_id}/peers/{peer_id}/producers/{producer_id}/pause',
+    await _call(
+        'pauseProducer', {'roomId': str(room_id), 'peerId': peer_id, 'producerId': producer_id},
+        'POST', f'/rooms/{room_id}/peers/{peer_id}/producers/{producer_id}/pause',
+        idempotent=True,
     )
 
 
@@ -255,9 +740,10 @@ async def resume_producer(room_id: str, peer_id: str, producer_id: str) -> None:
     Notes:
         server.js POST /rooms/:roomId/peers/:peerId/producers/:producerId/resume
     """
-    await _request(
-        'POST',
-        f'/rooms/{room_id}/peers/{peer_id}/producers/{producer_id}/resume',
+    await _call(
+        'resumeProducer', {'roomId': str(room_id), 'peerId': peer_id, 'producerId': producer_id},
+        'POST', f'/rooms/{room_id}/peers/{peer_id}/producers/{producer_id}/resume',
+        idempotent=True,
     )
 
 
@@ -297,15 +783,16 @@ async def create_consumer(
         consumer_peer_id != producer_peer_id 검증은 mediasoup 서버(Room.js)가 처리.
         이 함수는 서버 응답을 그대로 전달.
     """
-    data = await _request(
-        'POST',
-        f'/rooms/{room_id}/peers/{consumer_peer_id}/consumers',
-        json={
-            'producerPeerId':  producer_peer_id,
-            'producerId':      producer_id,
-            'transportId':     transport_id,
-            'rtpCapabilities': rtp_capabilities,
-        },
+    body = {
+        'producerPeerId':  producer_peer_id,
+        'producerId':      producer_id,
+        'transportId':     transport_id,
+        'rtpCapabilities': rtp_capabilities,
+    }
+    data = await _call(
+        'consume', {'roomId': str(room_id), 'peerId': consumer_peer_id, **body},
+        'POST', f'/rooms/{room_id}/peers/{consumer_peer_id}/consumers',
+        json=body,
     )
     # Room.js consume() 반환:
     # { id, producerId, kind, rtpParameters, producerPeerId }
@@ -326,9 +813,10 @@ async def resume_consumer(room_id: str, peer_id: str, consumer_id: str) -> None:
     Notes:
         server.js POST /rooms/:roomId/peers/:peerId/consumers/:consumerId/resume
     """
-    await _request(
-        'POST',
-        f'/rooms/{room_id}/peers/{peer_id}/consumers/{consumer_id}/resume',
+    await _call(
+        'resumeConsumer', {'roomId': str(room_id), 'peerId': peer_id, 'consumerId': consumer_id},
+        'POST', f'/rooms/{room_id}/peers/{peer_id}/consumers/{consumer_id}/resume',
+        idempotent=True,
     )
 
 
@@ -339,7 +827,11 @@ async def get_producers(room_id: str) -> list:
     Returns:
         [{'peerId': str, 'producerId': str, 'kind': str, 'paused': bool}, ...]
     """
-    data = await _request('GET', f'/rooms/{room_id}/producers')
+    data = await _coalesced(('producers', str(room_id)), lambda: _call(
+        'getProducers', {'roomId': str(room_id)},
+        'GET', f'/rooms/{room_id}/producers',
+        idempotent=True,
+    ))
     producers = data.get('producers', [])
     return [
         {
@@ -349,4 +841,70 @@ async def get_producers(room_id: str) -> list:
             'paused':     p.get('paused', False),
         }
         for p in producers
-    ]
\ No newline at end of file
+    ]
+
+
+# ── 일괄 호출 (sfu_join_full / sfu_consume_batch) ───────────────────────────
+
+async def create_consumers(
+    room_id: str,
+    consumer_peer_id: str,
+    transport_id: str,
+    rtp_capabilities: dict,
+    producers: list,
+) -> tuple[list, list]:
+    """
+    여러 Producer 를 동시에 consume (asyncio.gather).
+
+    Args:
+        producers: [{'producerId': str, 'producerPeerId': str}, ...]
+
+    Returns:
+        (consumers, failed)
+        consumers: create_consumer() 반환값 목록 (요청 순서 유지)
+        failed:    [{'producerId', 'producerPeerId', 'message'}, ...]
+                   한 Producer 실패가 나머지를 막지 않음
+    """
+    results = await asyncio.gather(
+        *(
+            create_consumer(
+                room_id, consumer_peer_id,
+                p['producerPeerId'], p['producerId'],
+                transport_id, rtp_capabilities,
+            )
+            for p in producers
+        ),
+        return_exceptions=True,
+    )
+
+    consumers, failed = [], []
+    for p, result in zip(producers, results):
+        if isinstance(result, Exception):
+            failed.append({
+                'producerId':     p['producerId'],
+                'producerPeerId': p['producerPeerId'],
+                'message':        str(result),
+            })
+        else:
+            consumers.append(result)
+    return consumers, failed
+
+
+async def resume_consumers(room_id: str, peer_id: str, consumer_ids: list) -> tuple[list, list]:
+    """
+    여러 Consumer 를 동시에 resume.
+
+    Returns:
+        (resumed_ids, failed)  failed: [{'consumerId', 'message'}, ...]
+    """
+    results = await asyncio.gather(
+        *(resume_consumer(room_id, peer_id, consumer_id) for consumer_id in consumer_ids),
+        return_exceptions=True,
+    )
+    resumed, failed = [], []
+    for consumer_id, result in zip(consumer_ids, results):
+        if isinstance(result, Exception):
+            failed.append({'consumerId': consumer_id, 'message': str(result)})
+        else:
+            resumed.append(consumer_id)
+    return resumed, failed
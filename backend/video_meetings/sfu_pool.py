@@ -0,0 +1,303 @@
+# backend/video_meetings/sfu_pool.py
+"""
+mediasoup SFU 노드 풀 — 방마다 노드 하나에 배치
+
+MEDIASOUP_NODES (쉼표 구분, 노드마다 'REST URL|제어 채널 주소', 제어 채널은 생략 가능)
+    MEDIASOUP_NODES=http://mediasoup-1:3000|mediasoup-1:3001,http://mediasoup-2:3000|mediasoup-2:3001
+비우면 MEDIASOUP_URL / MEDIASOUP_RPC_ADDR 노드 하나 (기존과 같음, 배치 과정 없음).
+
+[배치] node_for(room_id)
+1. Redis meeting:sfu:room:<room_id> 에 저장된 노드 → 모든 Daphne 워커가 같은 노드 사용
+   (프로세스 안에서는 LOCAL_TTL 초 동안 기억)
+2. 없으면 consistent hashing 링 (노드마다 가상 노드 VNODES 개) 에서 방 id 위치부터 시계 방향으로
+   - drain 중인 노드, /health 에 응답하지 않는 노드는 건너뜀
+   - 부하(peer 수)가 평균의 LOAD_FACTOR 배를 넘는 노드도 건너뜀 (bounded-load consistent hashing)
+   → SET NX 로 저장. 다른 워커가 먼저 저장했으면 그 값을 사용
+3. 배정된 노드가 /health 에 연속 DOWN_AFTER 번 응답하지 않으면 새 노드로 옮김 (CAS — 한 워커만 옮김)
+   drain 은 새 방만 다른 노드로 보냄 — 진행 중인 방은 끝날 때까지 그 노드에 남음
+4. 회의 종료 / SFU roomClosed 때 release() 로 배정 삭제
+
+[부하 확인] 프로세스마다 PROBE_INTERVAL 초에 한 번 모든 노드 GET /health (요청 경로에서 필요할 때만)
+Redis 가 아니면(로컬 개발 등) 부하·drain 없이 링만 사용 → 프로세스마다 같은 노드가 나옴.
+"""
+
+import asyncio
+import bisect
+import hashlib
+import logging
+import time
+from dataclasses import dataclass
+
+import httpx
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+VNODES         = 100              # 노드당 링 위치 수
+LOAD_FACTOR    = 1.25             # 평균 부하의 몇 배까지 허용
+PROBE_INTERVAL = 5.0              # /health 확인 주기 (초)
+PROBE_TIMEOUT  = 1.0
+DOWN_AFTER     = 2                # /health 연속 실패 몇 번이면 장애로 판단 (일시적 지연으로 방을 옮기지 않도록)
+LOCAL_TTL      = 30.0             # 프로세스 안에서 배정을 기억하는 시간 (초)
+LOCAL_MAX      = 10000
+ASSIGNMENT_TTL = 60 * 60 * 12     # 12시간 — 종료 처리를 놓친 방도 이 시간 뒤 정리
+
+# 값이 ARGV[1] 일 때만 바꿈 / 지움 (다른 워커가 먼저 옮겼으면 그대로)
+_MOVE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+  redis.call('set', KEYS[1], ARGV[2], 'EX', ARGV[3])
+  return 1
+end
+return 0
+"""
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+  return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+def _redis():
+    """django_redis 연결 (Redis 캐시가 아니면 None)"""
+    try:
+        from django_redis import get_redis_connection
+        return get_redis_connection('default')
+    except Exception:
+        return None
+
+
+def _room_key(room_id):
+    return cache.make_key(f'meeting:sfu:room:{room_id}')
+
+
+def _draining_key():
+    return cache.make_key('meeting:sfu:draining')
+
+
+def _text(value):
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _hash(value):
+    return int.from_bytes(hashlib.md5(value.encode()).digest()[:8], 'big')
+
+
+# ── 노드 ──────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class SFUNode:
+    name:     str          # 'mediasoup-1:3000' — Redis 에 저장하는 값
+    base_url: str
+    rpc_addr: str = ''     # 'host:port', 비우면 REST 만
+
+
+@dataclass(frozen=True)
+class NodeHealth:
+    ok:         bool
+    load:       int = 0    # peer 수 (없으면 방 수)
+    failures:   int = 0    # 연속 실패 수
+    checked_at: float = 0.0
+
+
+def parse_nodes(value):
+    """MEDIASOUP_NODES 값 → [SFUNode]"""
+    nodes = []
+    for entry in value.split(','):
+        base_url, _, rpc_addr = entry.strip().partition('|')
+        base_url = base_url.strip().rstrip('/')
+        if base_url:
+            nodes.append(SFUNode(base_url.split('://', 1)[-1], base_url, rpc_addr.strip()))
+    return nodes
+
+
+class HashRing:
+    """consistent hashing 링 — 노드가 늘거나 줄어도 대부분의 방은 같은 노드"""
+
+    def __init__(self, nodes, vnodes=VNODES):
+        points = sorted(
+            ((_hash(f'{node.name}#{i}'), node) for node in nodes for i in range(vnodes)),
+            key=lambda point: point[0],
+        )
+        self._keys = [key for key, _ in points]
+        self._nodes = [node for _, node in points]
+        self._size = len(nodes)
+
+    def walk(self, key):
+        """key 위치부터 시계 방향으로 서로 다른 노드 순서대로"""
+        start = bisect.bisect(self._keys, _hash(str(key)))
+        seen = set()
+        for i in range(len(self._nodes)):
+            node = self._nodes[(start + i) % len(self._nodes)]
+            if node.name not in seen:
+                seen.add(node.name)
+                yield node
+                if len(seen) == self._size:
+                    return
+
+
+# ── drain (운영자, manage.py sfu_nodes) ───────────────────────
+
+def draining_nodes():
+    conn = _redis()
+    if conn is None:
+        return set()
+    try:
+        return {_text(name) for name in conn.smembers(_draining_key())}
+    except Exception as e:
+        logger.warning(f"SFU drain state read failed: {e}")
+        return set()
+
+
+def set_draining(name, draining=True):
+    """노드 drain 시작 / 해제 — 새 방을 이 노드에 배치하지 않음. Redis 가 아니면 False"""
+    conn = _redis()
+    if conn is None:
+        return False
+    if draining:
+        conn.sadd(_draining_key(), name)
+    else:
+        conn.srem(_draining_key(), name)
+    return True
+
+
+# ── 풀 ────────────────────────────────────────────────────────
+
+class SFUPool:
+
+    def __init__(self, nodes):
+        self.nodes = {node.name: node for node in nodes}
+        self.ring = HashRing(nodes)
+        self.health: dict[str, NodeHealth] = {}
+        self._probed_at = 0.0
+        self._probe_task = None
+        self._local: dict[str, tuple[float, str]] = {}   # room_id → (만료 시각, node name)
+
+    def _alive(self, name):
+        health = self.health.get(name)
+        return health is None or health.ok
+
+    # ── 부하 확인 ────────────────────────────────────
+    async def _probe_node(self, client, node):
+        """부하 (peer 수) — 응답이 없거나 status 가 ok 가 아니면 None"""
+        try:
+            resp = await client.get(f'{node.base_url}/health')
+            resp.raise_for_status()
+            body = resp.json()
+            if body.get('status') == 'ok':
+                return int(body.get('peers', body.get('rooms', 0)))
+        except Exception as e:
+            logger.debug(f"SFU health check failed [{node.name}]: {e}")
+        return None
+
+    async def _probe_all(self):
+        async with httpx.AsyncClient(timeout=PROBE_TIMEOUT) as client:
+            nodes = list(self.nodes.values())
+            loads = await asyncio.gather(*(self._probe_node(client, node) for node in nodes))
+        now = time.monotonic()
+        for node, load in zip(nodes, loads):
+            previous = self.health.get(node.name) or NodeHealth(True)
+            if load is not None:
+                health = NodeHealth(True, load, 0, now)
+            else:
+                failures = previous.failures + 1
+                health = NodeHealth(failures < DOWN_AFTER, previous.load, failures, now)
+            if previous.ok != health.ok:
+                logger.warning(f"SFU node {node.name} {'up' if health.ok else 'down'}")
+            self.health[node.name] = health
+
+    async def probe(self, force=False):
+        """모든 노드 GET /health — PROBE_INTERVAL 안이면 건너뜀, 진행 중이면 같이 기다림"""
+        task = self._probe_task
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            return await asyncio.shield(task)
+        if not force and time.monotonic() - self._probed_at < PROBE_INTERVAL:
+            return
+        self._probed_at = time.monotonic()
+        self._probe_task = asyncio.ensure_future(self._probe_all())
+        await asyncio.shield(self._probe_task)
+
+    # ── 배치 ─────────────────────────────────────────
+    def _pick(self, room_id, draining=frozenset(), use_load=True):
+        ordered = list(self.ring.walk(room_id))
+        candidates = [node for node in ordered if node.name not in draining and self._alive(node.name)]
+        if not candidates:
+            # 전부 drain / 장애 → 링 순서대로 (요청 실패는 circuit breaker 가 처리)
+            candidates = [node for node in ordered if node.name not in draining] or ordered
+        if not use_load:
+            return candidates[0]
+
+        loads = {node.name: self.health[node.name].load if node.name in self.health else 0
+                 for node in candidates}
+        # 새 방 하나를 더했을 때 평균의 LOAD_FACTOR 배까지 — 적어도 한 노드는 항상 통과
+        limit = LOAD_FACTOR * (sum(loads.values()) + 1) / len(candidates)
+        for node in candidates:
+            if loads[node.name] + 1 <= limit:
+                return node
+        return min(candidates, key=lambda node: loads[node.name])
+
+    def _assign(self, room_id):
+        """Redis 에 저장된 노드 → 없으면 새로 배치 (동기, Redis 왕복 1~3회)"""
+        conn = _redis()
+        if conn is None:
+            return self._pick(room_id, use_load=False).name
+
+        key = _room_key(room_id)
+        try:
+            current = _text(conn.get(key))
+            if current in self.nodes and self._alive(current):
+                return current
+
+            name = self._pick(room_id, draining=draining_nodes()).name
+            if current is None:
+                if conn.set(key, name, nx=True, ex=ASSIGNMENT_TTL):
+                    logger.info(f"SFU room {room_id} → {name}")
+                    return name
+            elif conn.eval(_MOVE_SCRIPT, 1, key, current, name, ASSIGNMENT_TTL):
+                logger.warning(f"SFU room {room_id} moved {current} → {name}")
+                return name
+
+            # 다른 워커가 먼저 배치 / 이동
+            winner = _text(conn.get(key))
+            return winner if winner in self.nodes else name
+        except Exception as e:
+            logger.warning(f"SFU assignment failed [{room_id}]: {e}")
+            return self._pick(room_id, use_load=False).name
+
+    async def node_for(self, room_id):
+        """방을 맡은 노드 (노드가 하나면 바로 반환)"""
+        if len(self.nodes) == 1:
+            return next(iter(self.nodes.values()))
+
+        room_id = str(room_id)
+        cached = self._local.get(room_id)
+        if cached is not None and cached[0] > time.monotonic() and self._alive(cached[1]):
+            return self.nodes[cached[1]]
+
+        await self.probe()
+        name = await sync_to_async(self._assign, thread_sensitive=False)(room_id)
+        if len(self._local) >= LOCAL_MAX:
+            self._local.pop(next(iter(self._local)))
+        self._local[room_id] = (time.monotonic() + LOCAL_TTL, name)
+        return self.nodes[name]
+
+    def release(self, room_id, node_name=None):
+        """
+        배정 삭제 (동기). node_name 을 주면 아직 그 노드일 때만
+        (SFU roomClosed 가 늦게 와서 이미 옮긴 배정을 지우지 않도록).
+        """
+        room_id = str(room_id)
+        self._local.pop(room_id, None)
+        if len(self.nodes) == 1:
+            return
+        conn = _redis()
+        if conn is None:
+            return
+        try:
+            if node_name is None:
+                conn.delete(_room_key(room_id))
+            else:
+                conn.eval(_RELEASE_SCRIPT, 1, _room_key(room_id), node_name)
+        except Exception as e:
+            logger.warning(f"SFU assignment release failed [{room_id}]: {e}")
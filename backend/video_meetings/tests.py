@@ -1,3 +1,159 @@
-from django.test import TestCase
+import asyncio
+from contextlib import asynccontextmanager
+from unittest import mock
 
-# Create your tests here.
+from channels.layers import get_channel_layer
+from django.test import SimpleTestCase, override_settings
+
+from . import groups, sfu_client
+from .fake_sfu import FakeSFU
+from .sfu_pool import SFUNode
+
+
+class _DelayedSFU(FakeSFU):
+    """방마다 응답 지연을 다르게 — 응답이 보낸 순서와 다르게 도착하도록"""
+
+    def __init__(self, delays, **kwargs):
+        super().__init__(**kwargs)
+        self.delays = delays
+
+    async def _invoke(self, handler, params):
+        await asyncio.sleep(self.delays.get(params.get('roomId'), 0))
+        return await super()._invoke(handler, params)
+
+
+async def _wait_until(predicate, timeout=3.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            return False
+        await asyncio.sleep(0.01)
+    return True
+
+
+async def _unused_port():
+    server = await asyncio.start_server(lambda reader, writer: None, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    server.close()
+    await server.wait_closed()
+    return port
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    CHANNEL_LAYERS={'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}},
+)
+@mock.patch.object(sfu_client, 'RPC_RECONNECT_MIN', 0.01)
+class SFUClientRpcTests(SimpleTestCase):
+    """sfu_client 제어 채널 (JSON-RPC) — FakeSFU 를 상대로 실제 TCP 연결"""
+
+    @asynccontextmanager
+    async def _node(self, sfu, rpc=True, http=False):
+        """FakeSFU 를 띄우고 sfu_client 를 그 노드 하나로 연결 (끝나면 정리)"""
+        rpc_port = (await sfu.serve_rpc()).sockets[0].getsockname()[1] if rpc else await _unused_port()
+        http_port = (await sfu.serve_http()).sockets[0].getsockname()[1] if http else await _unused_port()
+        base_url = f'http://127.0.0.1:{http_port}'
+        previous = sfu_client.set_nodes([SFUNode(f'fake-{rpc_port}', base_url, f'127.0.0.1:{rpc_port}')])
+        try:
+            yield sfu_client._get_rpc(sfu_client._pool.nodes[f'fake-{rpc_port}'])
+        finally:
+            for channel in sfu_client._rpc_channels.values():
+                channel._rooms.clear()
+                channel._drop_connection()
+                for task in (channel._read_task, channel._reconnect_task):
+                    if task is not None:
+                        task.cancel()
+            sfu_client._rpc_channels.clear()
+            client = sfu_client._clients.pop(base_url, None)
+            if client is not None:
+                await client.aclose()
+            sfu_client.set_nodes(previous)
+            await sfu.close()
+
+    @staticmethod
+    def _add_producer(sfu, room_id, peer_id, kind='video'):
+        sfu.join(room_id, peer_id)
+        transport_id = sfu.createTransport(room_id, peer_id)['id']
+        return sfu.produce(room_id, peer_id, transportId=transport_id, kind=kind)['id']
+
+    async def test_pipelined_calls_are_matched_by_id(self):
+        rooms = [f'room-{n}' for n in range(10)]
+        # 먼저 보낸 요청일수록 늦게 응답
+        sfu = _DelayedSFU({room_id: 0.02 * (len(rooms) - n) for n, room_id in enumerate(rooms)})
+        producers = {room_id: self._add_producer(sfu, room_id, f'peer-{room_id}') for room_id in rooms}
+
+        async with self._node(sfu) as channel:
+            with mock.patch.object(sfu_client, '_request', side_effect=AssertionError('REST 사용 안 함')):
+                results = await asyncio.gather(*(sfu_client.get_producers(room_id) for room_id in rooms))
+
+            self.assertTrue(channel.connected)
+            self.assertEqual(len(sfu._sessions), 1)
+            for room_id, result in zip(rooms, results):
+                self.assertEqual([p['producerId'] for p in result], [producers[room_id]])
+                self.assertEqual(result[0]['peerId'], f'peer-{room_id}')
+
+    async def test_reconnect_restores_subscriptions(self):
+        sfu = FakeSFU()
+        async with self._node(sfu) as channel:
+            await sfu_client.subscribe_room('room-1')
+            self.assertEqual([rooms for _, rooms in sfu._sessions], [{'room-1'}])
+            first_session = sfu._sessions[0]
+
+            await sfu.drop_connections()
+
+            # 요청이 없어도 백그라운드로 다시 연결하고 (새 세션) 구독을 복구
+            self.assertTrue(await _wait_until(
+                lambda: channel.connected and len(sfu._sessions) == 1
+                and sfu._sessions[0] is not first_session and sfu._sessions[0][1] == {'room-1'}
+            ))
+
+    async def test_falls_back_to_rest_when_rpc_port_is_down(self):
+        sfu = FakeSFU()
+        producer_id = self._add_producer(sfu, 'room-1', 'peer-1')
+
+        async with self._node(sfu, rpc=False, http=True) as channel:
+            result = await sfu_client.get_producers('room-1')
+
+            self.assertFalse(channel.connected)
+            self.assertEqual([p['producerId'] for p in result], [producer_id])
+            self.assertEqual(sfu.calls, 1)
+
+    async def test_in_flight_request_fails_when_link_drops(self):
+        sfu = FakeSFU(latency=0.5)
+        sfu.join('room-1', 'peer-1')
+
+        async with self._node(sfu) as channel:
+            await sfu_client.subscribe_room('room-1')   # 연결 맺기
+            with mock.patch.object(sfu_client, '_request') as rest:
+                call = asyncio.ensure_future(sfu_client.create_transport('room-1', 'peer-1'))
+                self.assertTrue(await _wait_until(lambda: channel._pending))
+                await sfu.drop_connections()
+
+                with self.assertRaises(sfu_client.SFUError) as raised:
+                    await call
+
+            self.assertEqual(raised.exception.status, 503)
+            # 실행 여부를 알 수 없는 요청은 REST 로도, 다시 연결해서도 보내지 않음
+            rest.assert_not_called()
+            await _wait_until(lambda: channel.connected)
+            await asyncio.sleep(sfu.latency * 1.5)
+            self.assertEqual(sfu.calls, 0)
+            self.assertEqual(sfu.rooms['room-1']['peer-1'].transports, set())
+
+    async def test_producer_closed_reaches_sfu_notification(self):
+        sfu = FakeSFU()
+        producer_id = self._add_producer(sfu, 'room-1', 'peer-1')
+        layer = get_channel_layer()
+        listener = await layer.new_channel()
+        await layer.group_add(groups.room_group('room-1'), listener)
+
+        async with self._node(sfu):
+            await sfu_client.subscribe_room('room-1')
+            await sfu.close_producer('room-1', 'peer-1', producer_id)
+            event = await asyncio.wait_for(layer.receive(listener), timeout=3)
+
+        self.assertEqual(event['type'], 'sfu_notification')
+        self.assertEqual(event['event'], 'producerClosed')
+        self.assertEqual(event['roomId'], 'room-1')
+        self.assertEqual(event['producerId'], producer_id)
+        self.assertEqual(event['peerId'], 'peer-1')
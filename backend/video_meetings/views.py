@@ -13,6 +13,7 @@ import json
 import time  # ⭐ 추가!
 from datetime import datetime  # ⭐ 추가!
 
+from . import frames, groups, roster, sfu_client
 from .models import (
     VideoRoom, RoomParticipant, SignalMessage,
     ChatMessage, Reaction, RaisedHand
@@ -149,19 +150,21 @@ class VideoRoomViewSet(viewsets.ModelViewSet):
         )
         
         print(f'📤 {updated_count}명의 참가자 퇴장 처리 완료')
+        roster.clear(room.id)
+        sfu_client.release_room(room.id)   # 다음 회의는 SFU 노드를 다시 배치
         
         # WebSocket 알림
         channel_layer = get_channel_layer()
-        room_group_name = f'video_room_{room.id}'
+        room_group_name = groups.room_group(room.id)
         
         try:
             async_to_sync(channel_layer.group_send)(
                 room_group_name,
-                {
+                frames.broadcast('meeting_ended', {
                     'type': 'meeting_ended',
                     'message': '회의가 종료되었습니다.',
                     'ended_by': request.user.username
-                }
+                })
             )
             print('📡 회의 종료 알림 전송 완료')
         except Exception as e:
@@ -190,19 +193,22 @@ class VideoRoomViewSet(viewsets.ModelViewSet):
         
         participant.status = 'rejected'
         participant.save()
+        roster.remove_member(room.id, participant.user_id)
         
         print(f"✅ 참가 거부: {participant.user.username}")
         
         # WebSocket 알림
         channel_layer = get_channel_layer()
-        room_group_name = f'video_room_{room.id}'
+        user_group_name = groups.user_group(participant.user_id)   # 거부된 사용자에게만
         
         try:
             async_to_sync(channel_layer.group_send)(
-                room_group_name,
+                user_group_name,
                 {
                     'type': 'rejection_notification',
+                    'participant_user_id': participant.user_id,
                     'participant_username': participant.user.username,
+                    'room_id': str(room.id),
                     'message': '참가가 거부되었습니다.'
                 }
             )
@@ -255,11 +261,11 @@ class VideoRoomViewSet(viewsets.ModelViewSet):
                 
                 # 방장에게 알림
                 channel_layer = get_channel_layer()
-                room_group_name = f'video_room_{room.id}'
+                hosts_group_name = groups.hosts_group(room.id)   # 방장 연결에만
                 
                 try:
                     async_to_sync(channel_layer.group_send)(
-                        room_group_name,
+                        hosts_group_name,
                         {
                             'type': 'join_request_notification',
                             'participant_id': existing.id,
@@ -274,9 +280,8 @@ class VideoRoomViewSet(viewsets.ModelViewSet):
                 serializer = ParticipantSerializer(existing)
                 return Response(serializer.data, status=status.HTTP_200_OK)
         
-        # ⭐ 최대 참가자 수 확인
-        approved_count = room.participants.filter(status='approved').count()
-        if approved_count >= room.max_participants:
+        # ⭐ 최대 참가자 수 확인 (명단에서)
+        if roster.get(room.id).approved_count >= room.max_participants:
             return Response(
                 {'detail': '최대 참가자 수를 초과했습니다.'},
                 status=status.HTTP_400_BAD_REQUEST
@@ -294,11 +299,11 @@ class VideoRoomViewSet(viewsets.ModelViewSet):
             
             # 방장에게 알림
             channel_layer = get_channel_layer()
-            room_group_name = f'video_room_{room.id}'
+            hosts_group_name = groups.hosts_group(room.id)   # 방장 연결에만
             
             try:
                 async_to_sync(channel_layer.group_send)(
-                    room_group_name,
+                    hosts_group_name,
                     {
                         'type': 'join_request_notification',
                         'participant_id': participant.id,
@@ -355,8 +360,8 @@ class VideoRoomViewSet(viewsets.ModelViewSet):
             serializer = ParticipantSerializer(participant)
             return Response(serializer.data)
         
-        approved_count = room.participants.filter(status='approved').count()
-        if approved_count >= room.max_participants:
+        room_roster = roster.get(room.id)
+        if room_roster.approved_count >= room.max_participants:
             return Response(
                 {'detail': '최대 참가자 수를 초과했습니다.'},
                 status=status.HTTP_400_BAD_REQUEST
@@ -366,6 +371,7 @@ class VideoRoomViewSet(viewsets.ModelViewSet):
             participant.status = 'approved'
             participant.joined_at = timezone.now()
             participant.save()
+            roster.add_member(room.id, participant.user_id, participant.user.username)
             
             logger.info(f"✅ 승인 완료: {participant.user.username}")
             
@@ -379,7 +385,7 @@ class VideoRoomViewSet(viewsets.ModelViewSet):
         # ⭐⭐⭐ WebSocket 알림 (방장 정보 추가)
         try:
             channel_layer = get_channel_layer()
-            room_group_name = f'video_room_{room.id}'
+            user_group_name = groups.user_group(participant.user.id)   # 승인된 사용자에게만
             
             notification_data = {
                 'type': 'approval_notification',
@@ -387,16 +393,15 @@ class VideoRoomViewSet(viewsets.ModelViewSet):
                 'participant_username': participant.user.username,
                 'message': '참가가 승인되었습니다.',
                 'room_id': str(room.id),
-                'host_username': room.host.username,  # ⭐ 방장 username 추가
-                'host_user_id': room.host.id,         # ⭐ 방장 ID 추가
-                 # ✅ 추가: 기존 참가자 목록
+                'host_username': room_roster.host_username,  # ⭐ 방장 username 추가
+                'host_user_id': room_roster.host_id,         # ⭐ 방장 ID 추가
+                 # ✅ 추가: 기존 참가자 목록 (명단에서 — 참가자별 조회 없음)
                 'existing_participants': [
                     {
-                        'username': p.user.username,
-                        'user_id': p.user.id
+                        'username': p['user__username'],
+                        'user_id': p['user__id']
                     }
-                    for p in room.participants.filter(status='approved')
-                    if p.user != participant.user
+                    for p in room_roster.participants(exclude_user_id=participant.user_id)
                 ],
                 'should_initialize': True,
                 'timestamp': datetime.now().isoformat()
@@ -405,7 +410,7 @@ class VideoRoomViewSet(viewsets.ModelViewSet):
             # 첫 번째 전송
             logger.info(f"📡 승인 알림 전송")
             async_to_sync(channel_layer.group_send)(
-                room_group_name,
+                user_group_name,
                 notification_data
             )
 
@@ -439,6 +444,7 @@ class VideoRoomViewSet(viewsets.ModelViewSet):
         participant.status = 'left'
         participant.left_at = timezone.now()
         participant.save()
+        roster.remove_member(room.id, user.id)
         
         print(f"👋 {user.username} 퇴장 처리 완료 (레코드 유지)")
         
@@ -464,11 +470,8 @@ class VideoRoomViewSet(viewsets.ModelViewSet):
         """WebRTC 신호 전송"""
         room = self.get_object()
         
-        # 권한 확인
-        is_authorized = (
-            room.host == request.user or
-            room.participants.filter(user=request.user, status='approved').exists()
-        )
+        # 권한 확인 (명단에서)
+        is_authorized = roster.get(room.id).is_approved(request.user.id)
         
         if not is_authorized:
             return Response(
@@ -523,11 +526,8 @@ class VideoRoomViewSet(viewsets.ModelViewSet):
         """신호 메시지 조회"""
         room = self.get_object()
         
-        # 권한 확인
-        is_authorized = (
-            room.host == request.user or
-            room.participants.filter(user=request.user, status='approved').exists()
-        )
+        # 권한 확인 (명단에서)
+        is_authorized = roster.get(room.id).is_approved(request.user.id)
         
         if not is_authorized:
             return Response(
@@ -587,7 +587,7 @@ class VideoRoomViewSet(viewsets.ModelViewSet):
         
         # WebSocket 알림
         channel_layer = get_channel_layer()
-        room_group_name = f'video_room_{room.id}'
+        room_group_name = groups.room_group(room.id)
         
         try:
             async_to_sync(channel_layer.group_send)(
@@ -630,7 +630,7 @@ class VideoRoomViewSet(viewsets.ModelViewSet):
         
         # WebSocket 알림
         channel_layer = get_channel_layer()
-        room_group_name = f'video_room_{room.id}'
+        room_group_name = groups.room_group(room.id)
         
         try:
             async_to_sync(channel_layer.group_send)(
@@ -693,7 +693,7 @@ class VideoRoomViewSet(viewsets.ModelViewSet):
         
         # WebSocket 알림
         channel_layer = get_channel_layer()
-        room_group_name = f'video_room_{room.id}'
+        room_group_name = groups.room_group(room.id)
         
         try:
             async_to_sync(channel_layer.group_send)(
@@ -732,7 +732,7 @@ class VideoRoomViewSet(viewsets.ModelViewSet):
         
         # WebSocket 알림
         channel_layer = get_channel_layer()
-        room_group_name = f'video_room_{room.id}'
+        room_group_name = groups.room_group(room.id)
         
         try:
             async_to_sync(channel_layer.group_send)(
@@ -144,4 +144,94 @@ export const deleteMeditation = async (id) => {
     console.error('deleteMeditation error:', e);
     return false;
   }
-};
\ No newline at end of file
+};
+// ── 구절 참조로 말씀 찾기 (예: JHN 14:6) ────────────────────
+export const getSayingsByRef = async (book, chapter, verse) => {
+  try {
+    const res = await axiosInstance.get(`/sayings/ref/${book}/${chapter}/${verse}/`);
+    return res.data;
+  } catch (e) {
+    console.error('getSayingsByRef error:', e);
+    return [];
+  }
+};
+
+// ── 복음서 장별 절 커버리지 비트맵 ─────────────────────────
+export const getVerseCoverage = async (book) => {
+  try {
+    const res = await axiosInstance.get('/sayings/coverage/', { params: { book } });
+    return res.data;
+  } catch (e) {
+    console.error('getVerseCoverage error:', e);
+    return null;
+  }
+};
+
+// ── 묵상 달력 (날짜별 묵상 수) ──────────────────────────────
+export const getMeditationCalendar = async (year) => {
+  try {
+    const res = await axiosInstance.get('/sayings/meditations/calendar/', { params: { year } });
+    return res.data;
+  } catch (e) {
+    console.error('getMeditationCalendar error:', e);
+    return null;
+  }
+};
+
+// ── 연속 묵상일 ────────────────────────────────────────────
+export const getMeditationStreak = async () => {
+  try {
+    const res = await axiosInstance.get('/sayings/meditations/streak/');
+    return res.data;
+  } catch (e) {
+    console.error('getMeditationStreak error:', e);
+    return null;
+  }
+};
+
+// ── 공유 묵상 피드 (cursor: 응답의 next URL 그대로 전달) ────────
+export const getSharedMeditations = async ({ saying, next } = {}) => {
+  try {
+    const res = next
+      ? await axiosInstance.get(next)
+      : await axiosInstance.get('/sayings/meditations/shared/', { params: { saying } });
+    return res.data;
+  } catch (e) {
+    console.error('getSharedMeditations error:', e);
+    return { results: [], next: null, previous: null };
+  }
+};
+
+// ── 말씀별 공유 묵상 수 ─────────────────────────────────────
+export const getSharedMeditationCounts = async (ids = []) => {
+  try {
+    const res = await axiosInstance.get('/sayings/meditations/shared/counts/', {
+      params: ids.length ? { ids: ids.join(',') } : {},
+    });
+    return res.data;
+  } catch (e) {
+    console.error('getSharedMeditationCounts error:', e);
+    return {};
+  }
+};
+
+// ── 오프라인 콘텐츠 번들 (버전이 바뀐 경우에만 다시 받기) ─────
+export const getContentManifest = async () => {
+  try {
+    const res = await axiosInstance.get('/sayings/bundle/manifest/');
+    return res.data;
+  } catch (e) {
+    console.error('getContentManifest error:', e);
+    return null;
+  }
+};
+
+export const getContentBundle = async (version) => {
+  try {
+    const res = await axiosInstance.get(`/sayings/bundle/${version}/`);
+    return res.data;
+  } catch (e) {
+    console.error('getContentBundle error:', e);
+    return null;
+  }
+};
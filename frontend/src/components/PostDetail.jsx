@@ -1,11 +1,12 @@
 // ============================================
 // frontend/src/components/PostDetail.jsx (Gowun Batang 폰트 적용)
 // ============================================
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useCallback } from 'react';
 import { useParams, useNavigate, Link } from 'react-router-dom';
 import axios from '../api/axios';
 import API_ENDPOINTS from '../config/api';
 import { useAuth } from '../contexts/AuthContext';
+import { useBoardUpdates } from '../hooks/useBoardUpdates';
 import { ArrowLeft, Calendar, User, Eye, Edit, Trash2, MessageSquare, Image as ImageIcon } from 'lucide-react';
 
 function PostDetail() {
@@ -19,12 +20,49 @@ function PostDetail() {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
   const [commentLoading, setCommentLoading] = useState(false);
+  const [commentsNext, setCommentsNext] = useState(null);
+  const [replies, setReplies] = useState({});      // { 댓글 id: [답글...] }
+  const [replyTo, setReplyTo] = useState(null);    // 답글 대상 댓글
 
   useEffect(() => {
     fetchPost();
     fetchComments();
   }, [id]);
 
+  // ✅ 실시간 갱신 — 다른 사용자의 댓글/수정/삭제 반영 (내 작성분은 중복 추가하지 않음)
+  const handleBoardEvents = useCallback((events) => {
+    events.forEach((e) => {
+      if (e.type === 'post.updated' && e.data) {
+        setPost((prev) => (prev ? { ...prev, title: e.data.title, updated_at: e.data.updated_at } : prev));
+      } else if (e.type === 'post.deleted') {
+        setError('삭제된 게시글입니다.');
+      } else if (e.type === 'post.counts' && e.counts[id] !== undefined) {
+        setPost((prev) => (prev ? { ...prev, comment_count: e.counts[id] } : prev));
+      } else if (e.type === 'comment.created' && e.data) {
+        const comment = { ...e.data, reply_count: 0 };
+        if (comment.parent) {
+          setReplies((prev) => (prev[comment.parent] && !prev[comment.parent].some((c) => c.id === comment.id)
+            ? { ...prev, [comment.parent]: [...prev[comment.parent], comment] }
+            : prev));
+          setComments((prev) => prev.map((c) => (c.id === comment.parent
+            ? { ...c, reply_count: (c.reply_count || 0) + 1 } : c)));
+        } else {
+          setComments((prev) => (prev.some((c) => c.id === comment.id) ? prev : [...prev, comment]));
+        }
+      } else if (e.type === 'comment.updated' && e.data) {
+        const merge = (list) => list.map((c) => (c.id === e.id ? { ...c, content: e.data.content } : c));
+        setComments(merge);
+        setReplies((prev) => Object.fromEntries(Object.entries(prev).map(([k, v]) => [k, merge(v)])));
+      } else if (e.type === 'comment.deleted') {
+        const drop = (list) => list.filter((c) => c.id !== e.id);
+        setComments(drop);
+        setReplies((prev) => Object.fromEntries(Object.entries(prev).map(([k, v]) => [k, drop(v)])));
+      }
+    });
+  }, [id]);
+
+  useBoardUpdates(handleBoardEvents, id);
+
   const fetchPost = async () => {
     try {
       setLoading(true);
@@ -43,11 +81,40 @@ function PostDetail() {
     try {
       const response = await axios.get(`/board/posts/${id}/comments/`);
       setComments(response.data.results || response.data);
+      setCommentsNext(response.data.next || null);
+    } catch (err) {
+      console.error('댓글 로딩 실패:', err);
+    }
+  };
+
+  // ✅ 댓글 다음 페이지 (서버가 준 cursor URL 그대로 요청)
+  const fetchMoreComments = async () => {
+    if (!commentsNext) return;
+    try {
+      const response = await axios.get(commentsNext);
+      // 실시간으로 먼저 추가된 댓글은 중복 제외
+      setComments((prev) => {
+        const seen = new Set(prev.map((c) => c.id));
+        return [...prev, ...(response.data.results || []).filter((c) => !seen.has(c.id))];
+      });
+      setCommentsNext(response.data.next || null);
     } catch (err) {
       console.error('댓글 로딩 실패:', err);
     }
   };
 
+  // ✅ 답글 목록 (한 단계)
+  const fetchReplies = async (commentId) => {
+    try {
+      const response = await axios.get(`/board/posts/${id}/comments/`, {
+        params: { parent: commentId, page_size: 100 },
+      });
+      setReplies((prev) => ({ ...prev, [commentId]: response.data.results || [] }));
+    } catch (err) {
+      console.error('답글 로딩 실패:', err);
+    }
+  };
+
   const handleCommentSubmit = async (e) => {
     e.preventDefault();
     
@@ -66,10 +133,16 @@ function PostDetail() {
       setCommentLoading(true);
       await axios.post(`/board/posts/${id}/comments/`, {
         content: commentContent,
+        ...(replyTo ? { parent: replyTo.id } : {}),
       });
       
       setCommentContent('');
+      if (replyTo) {
+        fetchReplies(replyTo.parent || replyTo.id);
+        setReplyTo(null);
+      }
       fetchComments();
+      fetchPost();
       alert('댓글이 작성되었습니다.');
     } catch (err) {
       console.error('댓글 작성 실패:', err);
@@ -89,6 +162,8 @@ function PostDetail() {
     try {
       await axios.delete(`/board/posts/${id}/comments/${commentId}/`);
       fetchComments();
+      fetchPost();
+      setReplies({});
       alert('댓글이 삭제되었습니다.');
     } catch (err) {
       console.error('댓글 삭제 실패:', err);
@@ -235,7 +310,7 @@ function PostDetail() {
         <div className="bg-gradient-to-br from-gray-50 to-gray-100 px-6 py-4 border-b border-gray-200">
           <h2 className="text-lg font-bold text-gray-900 flex items-center">
             <MessageSquare className="w-5 h-5 mr-2 text-neutral-800" />
-            댓글 <span className="text-neutral-800 ml-2">{comments.length}</span>
+            댓글 <span className="text-neutral-800 ml-2">{post?.comment_count ?? comments.length}</span>
           </h2>
         </div>
 
@@ -251,6 +326,14 @@ function PostDetail() {
                 </div>
               </div>
               <div className="flex-1">
+                {replyTo && (
+                  <div className="mb-2 flex items-center justify-between text-xs text-gray-600">
+                    <span>↳ {replyTo.author}님에게 답글</span>
+                    <button type="button" onClick={() => setReplyTo(null)} className="text-gray-500 hover:text-gray-700">
+                      취소
+                    </button>
+                  </div>
+                )}
                 <textarea
                   value={commentContent}
                   onChange={(e) => setCommentContent(e.target.value)}
@@ -333,12 +416,50 @@ function PostDetail() {
                     <p className="blog-content whitespace-pre-wrap leading-relaxed">
                       {comment.content}
                     </p>
+
+                    {/* 답글 */}
+                    <div className="mt-2 flex items-center space-x-3 text-xs">
+                      {comment.reply_count > 0 && !replies[comment.id] && (
+                        <button onClick={() => fetchReplies(comment.id)} className="text-cyan-800 hover:underline">
+                          답글 {comment.reply_count}개 보기
+                        </button>
+                      )}
+                      {isAuthenticated && (
+                        <button onClick={() => setReplyTo(comment)} className="text-gray-500 hover:text-gray-700">
+                          답글 달기
+                        </button>
+                      )}
+                    </div>
+                    {(replies[comment.id] || []).map((reply) => (
+                      <div key={reply.id} className="mt-3 pl-4 border-l-2 border-gray-200">
+                        <div className="flex items-center justify-between">
+                          <span className="font-semibold text-gray-900 text-xs">{reply.author}</span>
+                          {isAuthenticated && user?.username === reply.author && (
+                            <button
+                              onClick={() => handleCommentDelete(reply.id)}
+                              className="text-xs text-red-600 hover:text-red-700 px-2 py-1 hover:bg-red-50 rounded transition"
+                            >
+                              삭제
+                            </button>
+                          )}
+                        </div>
+                        <p className="blog-content whitespace-pre-wrap leading-relaxed text-sm">{reply.content}</p>
+                      </div>
+                    ))}
                   </div>
                 </div>
               </div>
             ))
           )}
         </div>
+
+        {commentsNext && (
+          <div className="px-6 py-4 border-t border-gray-200 text-center">
+            <button onClick={fetchMoreComments} className="text-sm text-gray-700 hover:text-gray-900">
+              댓글 더 보기
+            </button>
+          </div>
+        )}
       </div>
     </div>
   );
@@ -1,18 +1,25 @@
 // ============================================
 // frontend/src/components/PostList.jsx (검색 기능 수정)
 // ============================================
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useCallback } from 'react';
 import { useNavigate } from 'react-router-dom';
 import axios from '../api/axios';
 import API_ENDPOINTS from '../config/api';
 import { useAuth } from '../contexts/AuthContext';
+import { useBoardUpdates } from '../hooks/useBoardUpdates';
 import { Search, Upload, Calendar, User, Eye, FileText, Image as ImageIcon } from 'lucide-react';
 
+// 카드 그리드(1/2/3열) 기준 이미지 표시 너비 — 브라우저가 srcset 에서 알맞은 너비 선택
+const CARD_IMAGE_SIZES = '(min-width: 1024px) 33vw, (min-width: 768px) 50vw, 100vw';
+
 function PostList() {
   const [posts, setPosts] = useState([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
   const [searchTerm, setSearchTerm] = useState('');
+  const [nextUrl, setNextUrl] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [newPostCount, setNewPostCount] = useState(0);
   
   const navigate = useNavigate();
   const { isAuthenticated } = useAuth();
@@ -21,6 +28,29 @@ function PostList() {
     fetchPosts();
   }, []);
 
+  // ✅ 실시간 갱신 — 새 글은 알림만 띄우고, 수정/삭제/댓글 수는 목록에 바로 반영
+  const handleBoardEvents = useCallback((events) => {
+    const created = events.filter((e) => e.type === 'post.created').length;
+    if (created) setNewPostCount((n) => n + created);
+
+    setPosts((prev) => events.reduce((list, e) => {
+      if (e.type === 'post.deleted') {
+        return list.filter((p) => p.id !== e.id);
+      }
+      if (e.type === 'post.updated' && e.data) {
+        return list.map((p) => (p.id === e.id
+          ? { ...p, title: e.data.title, comment_count: e.data.comment_count, updated_at: e.data.updated_at }
+          : p));
+      }
+      if (e.type === 'post.counts') {
+        return list.map((p) => (e.counts[p.id] !== undefined ? { ...p, comment_count: e.counts[p.id] } : p));
+      }
+      return list;
+    }, prev));
+  }, []);
+
+  useBoardUpdates(handleBoardEvents);
+
   const fetchPosts = async () => {
     try {
       setLoading(true);
@@ -32,6 +62,8 @@ function PostList() {
       console.log('📋 게시글 데이터:', postsData);
       
       setPosts(postsData);
+      setNextUrl(response.data?.next || null);
+      setNewPostCount(0);
       setError(null);
     } catch (err) {
       console.error('❌ 게시글 로딩 실패:', err);
@@ -66,6 +98,7 @@ function PostList() {
       console.log('📋 검색된 게시글:', postsData);
       
       setPosts(postsData);
+      setNextUrl(response.data?.next || null);
       setError(null);
     } catch (err) {
       console.error('❌ 검색 실패:', err);
@@ -76,6 +109,21 @@ function PostList() {
     }
   };
 
+  // ✅ 다음 페이지 (서버가 준 cursor URL 그대로 요청)
+  const handleLoadMore = async () => {
+    if (!nextUrl) return;
+    try {
+      setLoadingMore(true);
+      const response = await axios.get(nextUrl);
+      setPosts((prev) => [...prev, ...(response.data?.results || [])]);
+      setNextUrl(response.data?.next || null);
+    } catch (err) {
+      console.error('❌ 다음 페이지 로딩 실패:', err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   // ✅ 검색어 초기화
   const handleClearSearch = () => {
     setSearchTerm('');
@@ -166,6 +214,17 @@ function PostList() {
           </div>
         </div>
 
+        {newPostCount > 0 && !searchTerm && (
+          <div className="mb-4 text-center">
+            <button
+              onClick={fetchPosts}
+              className="px-4 py-2 bg-cyan-700 text-white rounded-full shadow hover:bg-indigo-700 transition text-sm"
+            >
+              새 게시글 {newPostCount}개 보기
+            </button>
+          </div>
+        )}
+
         {error ? (
           <div className="text-center py-20">
             <p className="text-red-500 text-lg">{error}</p>
@@ -207,10 +266,24 @@ function PostList() {
               >
                 {/* 이미지 섹션 */}
                 <div className="h-48 bg-gradient-to-r from-sky-100/40 to-cyan-100/40 overflow-hidden">
-                  {post.image_url ? (
+                  {post.image_srcset ? (
+                    <picture>
+                      <source type="image/webp" srcSet={post.image_srcset.webp} sizes={CARD_IMAGE_SIZES} />
+                      <img
+                        src={post.image_srcset.src}
+                        srcSet={post.image_srcset.jpeg}
+                        sizes={CARD_IMAGE_SIZES}
+                        alt={post.title}
+                        loading="lazy"
+                        decoding="async"
+                        className="w-full h-full object-cover hover:scale-105 transition duration-300"
+                      />
+                    </picture>
+                  ) : post.image_url ? (
                     <img 
                       src={post.image_url} 
                       alt={post.title}
+                      loading="lazy"
                       className="w-full h-full object-cover hover:scale-105 transition duration-300"
                     />
                   ) : (
@@ -262,6 +335,18 @@ function PostList() {
             ))}
           </div>
         )}
+
+        {nextUrl && (
+          <div className="flex justify-center pb-16">
+            <button
+              onClick={handleLoadMore}
+              disabled={loadingMore}
+              className="px-6 py-2 bg-white border border-gray-200 text-gray-700 rounded-lg hover:bg-gray-100 transition text-sm disabled:opacity-50"
+            >
+              {loadingMore ? '불러오는 중...' : '더 보기'}
+            </button>
+          </div>
+        )}
       </div>
     </div>
   );
@@ -68,9 +68,11 @@ const SFU_PROMISE_TYPES = new Set([
   'sfu_rtp_capabilities','sfu_joined','sfu_transport_created',
   'sfu_transport_connected','sfu_produced','sfu_consumed',
   'sfu_consumer_resumed','sfu_error',
+  'sfu_joined_full','sfu_consumed_batch','sfu_consumers_resumed',
 ]);
 const SFU_EVENT_TYPES = new Set([
   'peer_joined','new_producer','track_state','user_left',
+  'producer_closed','sfu_transport_closed',
 ]);
 
 const isIOS = () => {
@@ -7,6 +7,7 @@ const API_ENDPOINTS = {
     login: "/token/",
     refresh: "/token/refresh/",
     register: "/auth/register/",
+    logout: "/auth/logout/",
   },
   board: {
     posts: "/board/posts/",
@@ -65,6 +65,10 @@ export const AuthProvider = ({ children }) => {
   };
 
   const logout = () => {
+    // 서버에 현재 access 토큰 폐기 요청 (응답은 기다리지 않음)
+    if (localStorage.getItem('access_token')) {
+      axios.post(API_ENDPOINTS.auth.logout).catch(() => {});
+    }
     localStorage.removeItem('access_token');
     localStorage.removeItem('refresh_token');
     localStorage.removeItem('username');
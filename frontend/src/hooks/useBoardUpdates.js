@@ -0,0 +1,59 @@
+// frontend/src/hooks/useBoardUpdates.js
+// 게시판 실시간 갱신 (ws/board/) — 서버가 묶어서 보내는 이벤트 배열을 onEvents 로 전달
+// postId 를 주면 해당 게시글 그룹도 구독 (댓글 이벤트)
+import { useEffect, useRef } from 'react';
+
+const RECONNECT_DELAYS = [1000, 2000, 5000, 10000, 30000];
+
+export function useBoardUpdates(onEvents, postId = null) {
+  const onEventsRef = useRef(onEvents);
+
+  useEffect(() => {
+    onEventsRef.current = onEvents;
+  }, [onEvents]);
+
+  useEffect(() => {
+    let ws = null;
+    let timer = null;
+    let attempts = 0;
+    let closed = false;
+
+    const connect = () => {
+      const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+      ws = new WebSocket(`${protocol}//${window.location.host}/ws/board/`);
+
+      ws.onopen = () => {
+        attempts = 0;
+        if (postId) {
+          ws.send(JSON.stringify({ type: 'subscribe_post', post_id: Number(postId) }));
+        }
+      };
+
+      ws.onmessage = (event) => {
+        try {
+          const data = JSON.parse(event.data);
+          if (data.type === 'board.events' && onEventsRef.current) {
+            onEventsRef.current(data.events);
+          }
+        } catch (err) {
+          console.error('❌ 게시판 이벤트 파싱 실패:', err);
+        }
+      };
+
+      ws.onclose = () => {
+        if (closed) return;
+        const delay = RECONNECT_DELAYS[Math.min(attempts, RECONNECT_DELAYS.length - 1)];
+        attempts += 1;
+        timer = setTimeout(connect, delay);
+      };
+    };
+
+    connect();
+
+    return () => {
+      closed = true;
+      clearTimeout(timer);
+      if (ws) ws.close();
+    };
+  }, [postId]);
+}
@@ -12,14 +12,13 @@
  *  D03  waitForMessage — 등록/해소/타임아웃
  *  D10  getLocalMedia — 트랙 종류/수
  *  D20  initSFU 진입
- *  D21  sfu_get_rtp_capabilities 전송 → 응답
+ *  D21  sfu_join_full 전송 → capabilities + send/recv transport + existingProducers
  *  D22  Device.load
- *  D23  sfu_join 전송 → existingProducers 목록
- *  D24  getIceServers 결과
+ *  D24  getIceServers 결과 (sfu_join_full 과 동시에)
  *  D25  sendTransport 생성 → connect/produce 이벤트
  *  D26  recvTransport 생성 → connect 이벤트
  *  D27  earlyQueued 큐 처리
- *  D28  existingProducers 처리 (★중복 감지)
+ *  D28  existingProducers 처리 (★중복 감지, sfu_consume_batch 로 한 번에)
  *  D29  lateQueued 처리
  *  D2Z  initSFU 완료/실패
  *  D30  consumeProducer 진입
@@ -29,11 +28,14 @@
  *  D34  setRemoteStreams 업데이트
  *  D35  sfu_resume_consumer → sfu_consumer_resumed
  *  D36  consumeProducer 완료
+ *  D37  consumeProducers — sfu_consume_batch → sfu_consumed_batch
+ *  D38  sfu_resume_consumer_batch → sfu_consumers_resumed
  *  D3E  consumeProducer 오류 + 재시도
  *  D40  startProducing — audio/video track
  *  D41  sendTransport.produce 완료
  *  D50  handleSFUMessage 수신
  *  D51  new_producer 처리 경로
+ *  D52  producer_closed / sfu_transport_closed — SFU 서버 이벤트
  *  D60  removeRemoteStream
  *  D70  visibilitychange / focus — 탭 전환 시 트랙 복원  ★NEW★
  */
@@ -240,6 +242,34 @@ export function useSFU({ wsRef, roomId }) {
     });
   }, []);
 
+  // ── [D34] consumer track → remoteStreams ────────────────────
+  const addConsumerTrack = useCallback((peerId, kind, username, consumer) => {
+    const track = consumer.track;
+    D('33', `Consumer track — kind="${track.kind}" id="${track.id}" readyState="${track.readyState}" enabled=${track.enabled} muted=${track.muted}`);
+
+    consumersRef.current.set(consumer.id, consumer);
+
+    D('34', `setRemoteStreams UPDATE — peerId="${peerId}" kind="${kind}"`);
+    setRemoteStreams((prev) => {
+      const next     = new Map(prev);
+      const existing = next.get(peerId) || {};
+      const stream   = existing.stream || new MediaStream();
+
+      D('34', `Stream before addTrack — id="${stream.id}" tracks=${stream.getTracks().length}`);
+      stream.addTrack(track);
+      D('34', `Stream after addTrack  — tracks=${stream.getTracks().length}`, stream.getTracks().map(t => `${t.kind}:${t.readyState}`));
+
+      next.set(peerId, {
+        ...existing,
+        stream,
+        username: username || existing.username || peerId,
+        [`${kind}ConsumerId`]: consumer.id,
+      });
+      D('34', `remoteStreams Map size after update: ${next.size}`);
+      return next;
+    });
+  }, []);
+
   // ── [D30~D3E] consumeProducer ────────────────────────────────
   const consumeProducer = useCallback(async (peerId, producerId, kind, username) => {
     D('30', `consumeProducer ENTER — peerId="${peerId}" producerId="${producerId}" kind="${kind}" username="${username}"`);
@@ -300,32 +330,8 @@ export function useSFU({ wsRef, roomId }) {
       const consumer = await transport.consume(consumeArgs);
       D('32', `transport.consume() OK — consumerId="${consumer.id}"`);
 
-      // [D33] track 정보
-      const track = consumer.track;
-      D('33', `Consumer track — kind="${track.kind}" id="${track.id}" readyState="${track.readyState}" enabled=${track.enabled} muted=${track.muted}`);
-
-      consumersRef.current.set(consumer.id, consumer);
-
-      // [D34] setRemoteStreams
-      D('34', `setRemoteStreams UPDATE — peerId="${peerId}" kind="${kind}"`);
-      setRemoteStreams((prev) => {
-        const next     = new Map(prev);
-        const existing = next.get(peerId) || {};
-        const stream   = existing.stream || new MediaStream();
-
-        D('34', `Stream before addTrack — id="${stream.id}" tracks=${stream.getTracks().length}`);
-        stream.addTrack(track);
-        D('34', `Stream after addTrack  — tracks=${stream.getTracks().length}`, stream.getTracks().map(t => `${t.kind}:${t.readyState}`));
-
-        next.set(peerId, {
-          ...existing,
-          stream,
-          username: username || existing.username || peerId,
-          [`${kind}ConsumerId`]: consumer.id,
-        });
-        D('34', `remoteStreams Map size after update: ${next.size}`);
-        return next;
-      });
+      // [D33~D34] track → remoteStreams
+      addConsumerTrack(peerId, kind, username, consumer);
 
       // [D35] resume
       D('35', `TX sfu_resume_consumer consumerId="${consumer.id}"`);
@@ -361,7 +367,102 @@ export function useSFU({ wsRef, roomId }) {
         }
       }, 3000);
     }
-  }, [wsSend, waitForMessage, removeRemoteStream]);
+  }, [wsSend, waitForMessage, removeRemoteStream, addConsumerTrack]);
+
+  // ── [D37~D38] consumeProducers — 여러 producer 를 한 번에 ──────
+  //   sfu_consume_batch 1회 + sfu_resume_consumer_batch 1회
+  //   (producer 마다 sfu_consume / sfu_resume_consumer 왕복하던 것을 대체)
+  //   서버에서 실패한 producer 만 consumeProducer(단건, 재시도 포함)로 다시 처리
+  const consumeProducers = useCallback(async (producers) => {
+    const device    = deviceRef.current;
+    const transport = recvTransportRef.current;
+
+    const todo = producers.filter((p) => {
+      if (consumingProducerIds.current.has(p.producerId)) {
+        DW('37', `★ DUPLICATE SKIP — producerId="${p.producerId}" already consuming/consumed`);
+        return false;
+      }
+      return true;
+    });
+    if (todo.length === 0) return;
+
+    if (!device || !transport) {
+      DW('37', `device=${!!device} recvTransport=${!!transport} — QUEUING ${todo.length} producers`);
+      pendingProducersRef.current.push(...todo);
+      return;
+    }
+
+    todo.forEach((p) => consumingProducerIds.current.add(p.producerId));
+    const byProducerId = new Map(todo.map((p) => [p.producerId, p]));
+    const requestId    = `consume_${Date.now()}_${Math.random().toString(36).slice(2, 8)}`;
+
+    let batch;
+    try {
+      D('37', `TX sfu_consume_batch — count=${todo.length} transportId="${transport.id}"`);
+      wsSend({
+        type:            'sfu_consume_batch',
+        requestId,
+        transportId:     transport.id,
+        rtpCapabilities: device.rtpCapabilities,
+        producers:       todo.map((p) => ({ producerId: p.producerId, producerPeerId: p.peerId })),
+      });
+      batch = await waitForMessage('sfu_consumed_batch', 20000, (d) => d.requestId === requestId);
+      D('37', `sfu_consumed_batch — consumers=${batch.consumers?.length} failed=${batch.failed?.length}`);
+    } catch (e) {
+      // 일괄 요청 자체가 실패 → 단건 경로로
+      DE('37', `sfu_consume_batch FAILED — fallback to single consume`, e.message);
+      todo.forEach((p) => consumingProducerIds.current.delete(p.producerId));
+      for (const p of todo) await consumeProducer(p.peerId, p.producerId, p.kind, p.username);
+      return;
+    }
+
+    const retry   = (batch.failed || []).map((f) => byProducerId.get(f.producerId)).filter(Boolean);
+    const created = [];
+    for (const data of (batch.consumers || [])) {
+      const prod = byProducerId.get(data.producerId);
+      if (!prod) continue;
+      const kind = data.kind || prod.kind;
+      try {
+        const consumer = await transport.consume({
+          id:            data.id,
+          producerId:    data.producerId,
+          kind,
+          rtpParameters: data.rtpParameters,
+        });
+        addConsumerTrack(prod.peerId, kind, prod.username, consumer);
+        created.push({ prod, kind, consumer });
+      } catch (e) {
+        DE('37', `transport.consume() FAILED — producerId="${data.producerId}"`, e.message);
+        retry.push(prod);
+      }
+    }
+
+    if (created.length > 0) {
+      const resumeId = `resume_${requestId}`;
+      D('38', `TX sfu_resume_consumer_batch — count=${created.length}`);
+      wsSend({
+        type:        'sfu_resume_consumer_batch',
+        requestId:   resumeId,
+        consumerIds: created.map(({ consumer }) => consumer.id),
+      });
+      try {
+        const resumed = await waitForMessage('sfu_consumers_resumed', 15000, (d) => d.requestId === resumeId);
+        D('38', `Consumers RESUMED — ok=${resumed.consumerIds?.length} failed=${resumed.failed?.length}`);
+      } catch (e) {
+        DE('38', `sfu_resume_consumer_batch FAILED`, e.message);
+      }
+      for (const { prod, kind, consumer } of created) {
+        consumer.on('trackended',     () => { DW('33', `trackended — peerId="${prod.peerId}" kind="${kind}"`); removeRemoteStream(prod.peerId, kind); });
+        consumer.on('transportclose', () => { DW('33', `transportclose — peerId="${prod.peerId}" kind="${kind}"`); removeRemoteStream(prod.peerId, kind); });
+      }
+    }
+
+    for (const p of retry) {
+      consumingProducerIds.current.delete(p.producerId);
+      DW('37', `🔄 RETRY single consume — producerId="${p.producerId}"`);
+      await consumeProducer(p.peerId, p.producerId, p.kind, p.username);
+    }
+  }, [wsSend, waitForMessage, consumeProducer, addConsumerTrack, removeRemoteStream]);
 
   // ── [D20~D2Z] SFU 초기화 ────────────────────────────────────
   const initSFU = useCallback(async () => {
@@ -369,11 +470,25 @@ export function useSFU({ wsRef, roomId }) {
     setConnectionStatus('connecting');
 
     try {
-      // [D21] RTP Capabilities
-      D('21', 'TX sfu_get_rtp_capabilities');
-      wsSend({ type: 'sfu_get_rtp_capabilities' });
-      const { rtpCapabilities } = await waitForMessage('sfu_rtp_capabilities');
-      D('21', `rtpCapabilities received — codecs=${rtpCapabilities?.codecs?.length}`);
+      // [D21] sfu_join_full — capabilities + join + send/recv transport 를 한 응답으로
+      //       (ICE 서버 조회는 그동안 동시에)
+      D('21', 'TX sfu_join_full');
+      wsSend({ type: 'sfu_join_full' });
+      const [joined, iceServers] = await Promise.all([
+        waitForMessage('sfu_joined_full', 15000),
+        getIceServers(),
+      ]);
+      const {
+        rtpCapabilities,
+        producers: existingProducers,
+        sendTransport: sendParams,
+        recvTransport: recvParams,
+      } = joined;
+      D('21', `sfu_joined_full — codecs=${rtpCapabilities?.codecs?.length} existingProducers count=${existingProducers?.length}`, existingProducers);
+      if (existingProducers?.length === 0) {
+        DW('21', 'existingProducers is EMPTY — 상대방이 아직 produce 안 했거나 join이 늦음');
+      }
+      D('24', `ICE servers: ${iceServers.length} entries`, iceServers.map(s => s.urls));
 
       // [D22] Device.load
       D('22', 'Device.load START');
@@ -382,29 +497,7 @@ export function useSFU({ wsRef, roomId }) {
       deviceRef.current = device;
       D('22', `Device.load OK — canProduce(video)=${device.canProduce('video')} canProduce(audio)=${device.canProduce('audio')}`);
 
-      // [D23] sfu_join
-      D('23', 'TX sfu_join');
-      wsSend({ type: 'sfu_join' });
-      const { producers: existingProducers } = await waitForMessage('sfu_joined');
-      D('23', `sfu_joined — existingProducers count=${existingProducers?.length}`, existingProducers);
-      if (existingProducers?.length === 0) {
-        DW('23', 'existingProducers is EMPTY — 상대방이 아직 produce 안 했거나 join이 늦음');
-      }
-
-      // [D24] ICE Servers
-      const iceServers = await getIceServers();
-      D('24', `ICE servers: ${iceServers.length} entries`, iceServers.map(s => s.urls));
-
       // [D25] Send Transport
-      D('25', 'TX sfu_create_transport direction=send');
-      wsSend({ type: 'sfu_create_transport', direction: 'send' });
-      const sendParams = await waitForMessage(
-        'sfu_transport_created', 10000,
-        (d) => {
-          D('25', `sfu_transport_created filter check — direction="${d.direction}"`);
-          return !d.direction || d.direction === 'send';
-        }
-      );
       D('25', `sendTransport params received — id="${sendParams.id}" iceCandidates=${sendParams.iceCandidates?.length}`);
 
       const sendTransport = device.createSendTransport({
@@ -446,15 +539,6 @@ export function useSFU({ wsRef, roomId }) {
       D('25', `sendTransportRef set — id="${sendTransport.id}"`);
 
       // [D26] Recv Transport
-      D('26', 'TX sfu_create_transport direction=recv');
-      wsSend({ type: 'sfu_create_transport', direction: 'recv' });
-      const recvParams = await waitForMessage(
-        'sfu_transport_created', 10000,
-        (d) => {
-          D('26', `sfu_transport_created filter check — direction="${d.direction}"`);
-          return !d.direction || d.direction === 'recv';
-        }
-      );
       D('26', `recvTransport params received — id="${recvParams.id}" iceCandidates=${recvParams.iceCandidates?.length}`);
 
       const recvTransport = device.createRecvTransport({
@@ -489,35 +573,37 @@ export function useSFU({ wsRef, roomId }) {
       pendingProducersRef.current = [];
       D('27', `earlyQueued count=${earlyQueued.length}`, earlyQueued.map(p => `${p.kind}:${p.producerId}`));
 
-      for (const prod of earlyQueued) {
-        D('27', `Processing earlyQueued — ${prod.kind} peerId="${prod.peerId}" producerId="${prod.producerId}"`);
-        await consumeProducer(prod.peerId, prod.producerId, prod.kind, prod.username);
-      }
-
-      // [D28] existingProducers 처리 + 중복 경고
-      D('28', `Processing existingProducers count=${existingProducers?.length}`);
-      for (const prod of (existingProducers || [])) {
-        const pid = prod.peerId || prod.peer_id;
+      // [D28] existingProducers + earlyQueued 를 sfu_consume_batch 한 번으로
+      //       (★ 중복 감지: 같은 producerId 는 한 번만 — consumeProducers 에서도 재확인)
+      const initialProducers = new Map();
+      for (const prod of [...earlyQueued, ...(existingProducers || [])]) {
         const prodId = prod.producerId || prod.producer_id;
-
-        // ★ 중복 감지: earlyQueued에서 이미 처리됐는지 확인
-        if (consumingProducerIds.current.has(prodId)) {
-          DW('28', `★ DUPLICATE DETECTED — producerId="${prodId}" already in earlyQueued. SKIP.`);
+        if (initialProducers.has(prodId)) {
+          DW('28', `★ DUPLICATE DETECTED — producerId="${prodId}" already queued. SKIP.`);
           continue;
         }
-
-        D('28', `Processing existingProducer — kind="${prod.kind}" peerId="${pid}" producerId="${prodId}"`);
-        await consumeProducer(pid, prodId, prod.kind, prod.username);
+        initialProducers.set(prodId, {
+          peerId:     prod.peerId || prod.peer_id,
+          producerId: prodId,
+          kind:       prod.kind,
+          username:   prod.username,
+        });
       }
+      D('28', `Processing existingProducers + earlyQueued count=${initialProducers.size}`);
+      await consumeProducers([...initialProducers.values()]);
 
       // [D29] lateQueued 처리
       const lateQueued = [...pendingProducersRef.current];
       pendingProducersRef.current = [];
       D('29', `lateQueued count=${lateQueued.length}`, lateQueued.map(p => `${p.kind}:${p.producerId}`));
 
-      for (const prod of lateQueued) {
-        D('29', `Processing lateQueued — ${prod.kind} peerId="${prod.peerId}" producerId="${prod.producerId}"`);
-        await consumeProducer(prod.peerId, prod.producerId, prod.kind, prod.username);
+      if (lateQueued.length > 0) {
+        await consumeProducers(lateQueued.map((prod) => ({
+          peerId:     prod.peerId,
+          producerId: prod.producerId,
+          kind:       prod.kind,
+          username:   prod.username,
+        })));
       }
 
       setConnectionStatus('connected');
@@ -529,7 +615,7 @@ export function useSFU({ wsRef, roomId }) {
       DE('2Z', `Stack:`, e.stack);
       throw e;
     }
-  }, [wsSend, waitForMessage, consumeProducer, remoteStreams.size, roomId]);
+  }, [wsSend, waitForMessage, consumeProducers, remoteStreams.size, roomId]);
 
   // ── [D40~D41] 로컬 미디어 송신 시작 ─────────────────────────
   const startProducing = useCallback(async (stream) => {
@@ -717,6 +803,18 @@ export function useSFU({ wsRef, roomId }) {
         }
         break;
 
+      case 'producer_closed':
+        // [D52] SFU 에서 producer 종료 (상대 transport 종료 등) → 해당 트랙만 제거
+        D('52', `producer_closed — peerId="${data.peerId}" producerId="${data.producerId}" kind="${data.kind}"`);
+        consumingProducerIds.current.delete(data.producerId);
+        removeRemoteStream(data.peerId, data.kind);
+        break;
+
+      case 'sfu_transport_closed':
+        DE('52', `★ sfu_transport_closed — transportId="${data.transportId}"`);
+        setConnectionStatus('failed');
+        break;
+
       case 'track_state': {
         D('50', `track_state — peerId="${data.peerId}" kind="${data.kind}" enabled=${data.enabled}`);
         setRemoteStreams((prev) => {
@@ -776,7 +874,7 @@ export function useSFU({ wsRef, roomId }) {
         DW('50', `handleSFUMessage: unhandled type="${data.type}"`);
         break;
     }
-  }, [consumeProducer]);
+  }, [consumeProducer, removeRemoteStream]);
 
   // ── 정리 ────────────────────────────────────────────────────
   const cleanup = useCallback(() => {
@@ -815,6 +913,7 @@ export function useSFU({ wsRef, roomId }) {
     initSFU,
     startProducing,
     consumeProducer,
+    consumeProducers,
     removeRemoteStream,
     muteAudio,
     unmuteAudio,
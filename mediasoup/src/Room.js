@@ -1,15 +1,23 @@
 // mediasoup/src/Room.js
 'use strict';
 
+const { EventEmitter } = require('events');
 const config = require('./config');
 const logger = require('./logger');
 
 /**
  * Room: 하나의 화상회의방 = 하나의 mediasoup Router
  * 참가자(Peer)마다 WebRtcTransport (send 1개 + recv 1개) 생성
+ *
+ * 서버 이벤트: 'notification' (method, params)
+ *   producerClosed  { peerId, producerId, kind }  — producer/transport 종료
+ *   transportClosed { peerId, transportId }       — DTLS 종료
+ *   roomClosed      {}                            — 빈 방 정리
+ *   rpc.js 가 제어 채널(JSON-RPC)로 Django 에 전달
  */
-class Room {
+class Room extends EventEmitter {
   constructor(roomId, router) {
+    super();
     this.id = roomId;
     this.router = router;
     // peerId → { transports: Map, producers: Map, consumers: Map }
@@ -63,6 +71,7 @@ class Room {
     transport.on('dtlsstatechange', (state) => {
       if (state === 'closed') {
         peer.transports.delete(transport.id);
+        this.emit('notification', 'transportClosed', { peerId, transportId: transport.id });
       }
     });
 
@@ -101,6 +110,7 @@ class Room {
 
     producer.on('transportclose', () => {
       peer.producers.delete(producer.id);
+      this.emit('notification', 'producerClosed', { peerId, producerId: producer.id, kind });
     });
 
     logger.info(`Producer created [${kind}] for peer ${peerId}: ${producer.id}`);
@@ -121,6 +131,7 @@ class Room {
     const producer = this._getProducer(peerId, producerId);
     producer.close();
     this.peers.get(peerId)?.producers.delete(producerId);
+    this.emit('notification', 'producerClosed', { peerId, producerId, kind: producer.kind });
   }
 
   // ─── Consumer (수신) ──────────────────────────────────────
@@ -199,6 +210,8 @@ class Room {
 
   close() {
     this.router.close();
+    this.emit('notification', 'roomClosed', {});
+    this.removeAllListeners();
     logger.info(`Room closed: ${this.id}`);
   }
 }
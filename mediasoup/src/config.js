@@ -9,6 +9,11 @@ module.exports = {
     trustedOrigins: (process.env.TRUSTED_ORIGINS || 'http://backend:8000').split(','),
   },
 
+  // Django 제어 채널 (JSON-RPC over TCP, rpc.js)
+  rpc: {
+    port: parseInt(process.env.MEDIASOUP_RPC_PORT) || 3001,
+  },
+
   // mediasoup Worker 설정
   mediasoup: {
     numWorkers: parseInt(process.env.MEDIASOUP_NUM_WORKERS) || require('os').cpus().length,
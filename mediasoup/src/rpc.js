@@ -0,0 +1,188 @@
+// mediasoup/src/rpc.js
+'use strict';
+
+/**
+ * Django ↔ SFU 제어 채널 (JSON-RPC 2.0, 줄 단위 JSON over TCP)
+ *
+ * REST API 와 같은 기능을 프로세스당 연결 하나로 처리한다.
+ *   요청   {"jsonrpc":"2.0","id":1,"method":"join","params":{"roomId":"..","peerId":".."}}
+ *   응답   {"jsonrpc":"2.0","id":1,"result":{...}}  /  {"jsonrpc":"2.0","id":1,"error":{"code":404,"message":".."}}
+ *   이벤트 {"jsonrpc":"2.0","method":"producerClosed","params":{"roomId":"..","peerId":"..",...}}
+ *
+ * - 요청은 연결 하나에서 여러 개가 동시에 진행됨 (id 로 응답 매칭, 응답 순서 보장 없음)
+ * - error.code 는 REST 의 HTTP 상태 코드와 같음 (404 / 400 / 500)
+ * - 서버 이벤트는 그 방을 subscribe 한 연결 중 가장 최근 연결 하나에만 보냄
+ *   (Django 프로세스가 여러 개여도 channel layer 로 한 번만 전달되도록)
+ * - 백프레셔: socket.write 가 false 면 drain 까지 요청 읽기를 멈춤
+ */
+
+const net = require('net');
+const logger = require('./logger');
+
+class RpcError extends Error {
+  constructor(code, message) {
+    super(message);
+    this.code = code;
+  }
+}
+
+function required(params, ...names) {
+  for (const name of names) {
+    if (params[name] === undefined || params[name] === null) {
+      throw new RpcError(400, `${name} required`);
+    }
+  }
+}
+
+function startRpcServer({ port, rooms, getOrCreateRoom }) {
+  const sessions = new Set();
+  const watched = new WeakSet();   // notification 리스너를 붙인 Room
+
+  const existingRoom = (roomId) => {
+    const room = rooms.get(roomId);
+    if (!room) throw new RpcError(404, 'Room not found');
+    return room;
+  };
+
+  // REST 라우트(server.js)와 같은 동작·응답 형식
+  const methods = {
+    async getRtpCapabilities({ roomId }) {
+      const room = await getOrCreateRoom(roomId);
+      return { rtpCapabilities: room.getRtpCapabilities() };
+    },
+    async join({ roomId, peerId }) {
+      if (!peerId) throw new RpcError(400, 'peerId required');
+      const room = await getOrCreateRoom(roomId);
+      room.addPeer(peerId);
+      return { rtpCapabilities: room.getRtpCapabilities(), producers: room.getProducerList() };
+    },
+    async leave({ roomId, peerId }) {
+      const room = rooms.get(roomId);
+      if (room) room.removePeer(peerId);
+      return { ok: true };
+    },
+    async createTransport({ roomId, peerId }) {
+      return existingRoom(roomId).createWebRtcTransport(peerId);
+    },
+    async connectTransport(params) {
+      required(params, 'transportId', 'dtlsParameters');
+      const { roomId, peerId, transportId, dtlsParameters } = params;
+      await existingRoom(roomId).connectTransport(peerId, transportId, dtlsParameters);
+      return { ok: true };
+    },
+    async produce(params) {
+      required(params, 'transportId', 'kind', 'rtpParameters');
+      const { roomId, peerId, transportId, kind, rtpParameters, appData } = params;
+      return existingRoom(roomId).produce(peerId, transportId, kind, rtpParameters, appData || {});
+    },
+    async pauseProducer({ roomId, peerId, producerId }) {
+      await existingRoom(roomId).pauseProducer(peerId, producerId);
+      return { ok: true };
+    },
+    async resumeProducer({ roomId, peerId, producerId }) {
+      await existingRoom(roomId).resumeProducer(peerId, producerId);
+      return { ok: true };
+    },
+    async consume(params) {
+      const { roomId, peerId, producerPeerId, producerId, transportId, rtpCapabilities } = params;
+      return existingRoom(roomId).consume(peerId, producerPeerId, producerId, transportId, rtpCapabilities);
+    },
+    async resumeConsumer({ roomId, peerId, consumerId }) {
+      await existingRoom(roomId).resumeConsumer(peerId, consumerId);
+      return { ok: true };
+    },
+    async getProducers({ roomId }) {
+      const room = rooms.get(roomId);
+      return { producers: room ? room.getProducerList() : [] };
+    },
+    // 이 연결로 방 이벤트 받기 (Django 가 재연결 후 다시 호출)
+    async subscribe({ roomId }, session) {
+      session.rooms.add(roomId);
+      return { ok: true };
+    },
+    async unsubscribe({ roomId }, session) {
+      session.rooms.delete(roomId);
+      return { ok: true };
+    },
+  };
+
+  function watchRoom(room) {
+    if (watched.has(room)) return;
+    watched.add(room);
+    room.on('notification', (method, params) => {
+      // 가장 최근에 subscribe 한(Set 순회 마지막) 살아 있는 연결 하나에만
+      let target = null;
+      for (const session of sessions) {
+        if (session.rooms.has(room.id)) target = session;
+      }
+      if (target) target.send({ jsonrpc: '2.0', method, params: { roomId: room.id, ...params } });
+    });
+  }
+
+  const server = net.createServer((socket) => {
+    socket.setNoDelay(true);
+    socket.setEncoding('utf8');
+
+    const session = {
+      rooms: new Set(),
+      send(message) {
+        if (socket.destroyed) return;
+        // 버퍼가 차면 drain 까지 새 요청을 읽지 않음
+        if (!socket.write(JSON.stringify(message) + '\n')) socket.pause();
+      },
+    };
+    sessions.add(session);
+    socket.on('drain', () => socket.resume());
+
+    const remote = `${socket.remoteAddress}:${socket.remotePort}`;
+    logger.info(`RPC client connected: ${remote}`);
+
+    let buffer = '';
+    socket.on('data', (chunk) => {
+      buffer += chunk;
+      let newline;
+      while ((newline = buffer.indexOf('\n')) !== -1) {
+        const line = buffer.slice(0, newline).trim();
+        buffer = buffer.slice(newline + 1);
+        if (line) handle(line);
+      }
+    });
+
+    async function handle(line) {
+      let message;
+      try {
+        message = JSON.parse(line);
+      } catch (e) {
+        session.send({ jsonrpc: '2.0', id: null, error: { code: 400, message: 'Parse error' } });
+        return;
+      }
+
+      const { id, method, params = {} } = message;
+      const fn = methods[method];
+      try {
+        if (!fn) throw new RpcError(404, `Unknown method: ${method}`);
+        const result = await fn(params, session);
+        session.send({ jsonrpc: '2.0', id, result });
+      } catch (e) {
+        logger.error(`RPC ${method}: ${e.message}`);
+        session.send({ jsonrpc: '2.0', id, error: { code: e.code || 500, message: e.message } });
+      }
+    }
+
+    socket.on('close', () => {
+      sessions.delete(session);
+      logger.info(`RPC client disconnected: ${remote}`);
+    });
+    socket.on('error', (e) => logger.warn(`RPC socket error (${remote}): ${e.message}`));
+  });
+
+  server.listen(port, '0.0.0.0', () => {
+    logger.info(`mediasoup RPC listening on port ${port}`);
+  });
+
+  // 이미 있는 방 + 이후 생성되는 방(server.js getOrCreateRoom)의 이벤트 전달
+  for (const room of rooms.values()) watchRoom(room);
+  return { server, watchRoom };
+}
+
+module.exports = { startRpcServer };
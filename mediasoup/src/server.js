@@ -7,6 +7,7 @@ const cors = require('cors');
 const config = require('./config');
 const Room = require('./Room');
 const logger = require('./logger');
+const { startRpcServer } = require('./rpc');
 
 const app = express();
 app.use(express.json());
@@ -47,6 +48,7 @@ function getNextWorker() {
 
 // ─── Room 관리 ────────────────────────────────────────────────
 const rooms = new Map(); // roomId → Room
+let rpc = null;          // 제어 채널 (main 에서 시작)
 
 async function getOrCreateRoom(roomId) {
   if (rooms.has(roomId)) return rooms.get(roomId);
@@ -55,6 +57,7 @@ async function getOrCreateRoom(roomId) {
   const router = await worker.createRouter(config.mediasoup.routerOptions);
   const room = new Room(roomId, router);
   rooms.set(roomId, room);
+  if (rpc) rpc.watchRoom(room);
 
   logger.info(`Room created: ${roomId}`);
   return room;
@@ -74,9 +77,11 @@ setInterval(cleanupEmptyRooms, 5 * 60 * 1000);
 
 // ─── REST API ─────────────────────────────────────────────────
 
-// 헬스체크
+// 헬스체크 (Django sfu_pool 이 peers 를 부하로 사용해 새 방을 배치)
 app.get('/health', (req, res) => {
-  res.json({ status: 'ok', workers: workers.length, rooms: rooms.size });
+  let peers = 0;
+  for (const room of rooms.values()) peers += room.peers.size;
+  res.json({ status: 'ok', workers: workers.length, rooms: rooms.size, peers });
 });
 
 // 방 RTP Capabilities 조회 (클라이언트 Device.load()에 사용)
@@ -242,6 +247,9 @@ async function main() {
     logger.info(`Announced IP: ${process.env.MEDIASOUP_ANNOUNCED_IP}`);
     logger.info(`RTP port range: ${process.env.MEDIASOUP_RTP_MIN_PORT || 40000}-${process.env.MEDIASOUP_RTP_MAX_PORT || 49999}`);
   });
+
+  // Django 제어 채널 (JSON-RPC) — REST 와 같은 rooms 를 공유
+  rpc = startRpcServer({ port: config.rpc.port, rooms, getOrCreateRoom });
 }
 
 main().catch((err) => {